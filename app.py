@@ -15,12 +15,17 @@ arquitectura modular que facilita el mantenimiento y extensión.
 import dash
 from dash import Dash, html
 import dash_bootstrap_components as dbc
+from flask import Flask, request
+import atexit
+import logging
+import logging.handlers
 import os
 import netrc
+import queue
 
 # Importar módulos refactorizados
-from config import config_manager, COLORS, is_sqlite_mode, get_sqlite_config, is_postgresql_mode, get_postgresql_config
-from components import create_navbar
+from config import config_manager, COLORS, COLOR_CSS_VARIABLES, is_sqlite_mode, get_sqlite_config, is_postgresql_mode, get_postgresql_config
+from components import create_navbar, LOGO_URLS
 from pages import layout_home, layout_otros_contaminantes, layout_historicos, layout_acerca, layout_debugresumen
 from callbacks import initialize_callbacks
 
@@ -38,16 +43,51 @@ try:
 except ImportError:
     SQLITE_AVAILABLE = False
 
+# Compresión de respuestas (opcional): el bundle de plotly.js y las figuras son lo más pesado
+try:
+    import flask_compress  # noqa: F401  (Dash lo usa con compress=True; Brotli si está instalado)
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
+# Flask-Compress lee su configuración al inicializarse dentro de Dash(), por eso va
+# en el servidor Flask antes de crear la app. El layout inicial repite mucho las
+# mismas llaves de estilo y Brotli lo comprime muy bien
+COMPRESS_CONFIG = {
+    'COMPRESS_ALGORITHM': ['br', 'gzip'],
+    'COMPRESS_LEVEL': 6,        # gzip
+    'COMPRESS_BR_LEVEL': 5,     # Brotli: buena razón sin costo alto de CPU por respuesta
+    'COMPRESS_MIN_SIZE': 500    # Respuestas pequeñas de callbacks no valen la pena
+}
+
 # Configuración simple de la aplicación
 APP_CONFIG = {
     'title': 'Pronóstico de Calidad del Aire Mediante Redes Neuronales: Nivel de Ozono de la RAMA',
     'suppress_callback_exceptions': True,
+    # Carga diferida de los chunks async (plotly.js solo se descarga cuando se monta un
+    # dcc.Graph; la página "Acerca" no lo pide). No activar: mandaría todo en la carga inicial
+    'eager_loading': False,
     'debug': False,  # Debug desactivado por seguridad
     'host': '127.0.0.1',  # Solo localhost por seguridad
     'port': 6006  # Puerto para debug en localhost
     # 'port': 8888  # Puerto original comentado como referencia
 }
 
+# Log rotativo de callbacks en producción (tamaño acotado y cola acotada)
+CALLBACKS_LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'callbacks.log')
+CALLBACKS_LOG_QUEUE_SIZE = 10000
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que descarta registros si la cola está llena en lugar de bloquear"""
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
 class AirQualityApp:
     """Aplicación principal de pronóstico de calidad del aire"""
     
@@ -56,6 +96,7 @@ class AirQualityApp:
         self.callback_manager = None
         self._load_secure_config()  # Cargar configuración segura
         self._validate_security_config()  # Validar configuración de seguridad
+        self._setup_logging()
         self._initialize_app()
         self._setup_pages()
         self._setup_layout()
@@ -119,6 +160,37 @@ class AirQualityApp:
         else:
             print("✅ Configuración de seguridad válida")
     
+    def _setup_logging(self):
+        """Configura el nivel de logging de los callbacks (DEBUG solo en modo debug)"""
+        # Configuración base a nivel INFO: los logger.debug de los callbacks no formatean nada
+        logging.basicConfig(level=logging.INFO)
+        callbacks_level = logging.DEBUG if APP_CONFIG['debug'] else logging.INFO
+        # Los módulos que se ejecutan en cada render siguen el mismo nivel
+        for module_name in ('pages', 'visualization', 'config'):
+            logging.getLogger(module_name).setLevel(callbacks_level)
+        callbacks_logger = logging.getLogger('callbacks')
+        callbacks_logger.setLevel(callbacks_level)
+        
+        if APP_CONFIG['debug']:
+            return
+        
+        # En producción los callbacks solo encolan; un hilo aparte escribe al archivo
+        # rotativo, así una ráfaga de excepciones no bloquea el hilo de la petición
+        try:
+            file_handler = logging.handlers.RotatingFileHandler(
+                CALLBACKS_LOG_FILE, maxBytes=5 * 1024 * 1024, backupCount=3, encoding='utf-8'
+            )
+        except OSError as e:
+            print(f"⚠️ No se pudo abrir el log de callbacks: {e}")
+            return
+        file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+        
+        log_queue = queue.Queue(maxsize=CALLBACKS_LOG_QUEUE_SIZE)
+        listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        callbacks_logger.addHandler(_DroppingQueueHandler(log_queue))
+    
     def _initialize_app(self):
         """Inicializa la aplicación Dash con configuración"""
         
@@ -189,14 +261,21 @@ class AirQualityApp:
         else:
             print("   ⚠️ Ningún sistema de base de datos activo - usando modo mock")
         
+        server = Flask(__name__)
+        if COMPRESS_AVAILABLE:
+            server.config.update(COMPRESS_CONFIG)
+        
         # assets_folder se usa por defecto como "./assets"
         self.app = Dash(
             __name__, 
+            server=server,
             use_pages=True,
             pages_folder="",
             external_stylesheets=[dbc.themes.BOOTSTRAP],
             title=APP_CONFIG['title'],
-            suppress_callback_exceptions=APP_CONFIG['suppress_callback_exceptions']
+            suppress_callback_exceptions=APP_CONFIG['suppress_callback_exceptions'],
+            eager_loading=APP_CONFIG['eager_loading'],
+            compress=COMPRESS_AVAILABLE
         )
         
         # Configurar CSS personalizado para responsividad
@@ -205,6 +284,9 @@ class AirQualityApp:
         # Configurar favicon usando assets
         self._setup_favicon()
         
+        # Caché de larga duración para assets con huella de versión
+        self._setup_static_cache_headers()
+        
         print("✅ Aplicación Dash inicializada")
     
     def _setup_favicon(self):
@@ -213,6 +295,19 @@ class AirQualityApp:
         # Dash busca automáticamente este archivo
         print("✅ Favicon configurado (assets/favicon.ico)")
     
+    def _setup_static_cache_headers(self):
+        """
+        Sirve con Cache-Control de un año los assets pedidos con huella (?m=<mtime>),
+        como los logos; al cambiar el archivo cambia la URL y se vuelve a descargar.
+        """
+        assets_prefix = self.app.config.routes_pathname_prefix + 'assets/'
+        
+        @self.app.server.after_request
+        def add_asset_cache_headers(response):
+            if request.path.startswith(assets_prefix) and 'm' in request.args and response.status_code == 200:
+                response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+            return response
+    
     def _setup_pages(self):
         """Configura las páginas de la aplicación"""
         # Registrar página principal
@@ -463,6 +558,14 @@ class AirQualityApp:
             </body>
         </html>
         '''
+        # Variables CSS con la paleta de COLORS (las usa assets/components.css)
+        # y precarga de los logos del encabezado
+        preload_links = ''.join(
+            f'\n                <link rel="preload" href="{url}" as="image">' for url in LOGO_URLS
+        )
+        self.app.index_string = self.app.index_string.replace(
+            '{%css%}', '{%css%}\n                <style>' + COLOR_CSS_VARIABLES + '</style>' + preload_links, 1
+        )
     
     def run(self, debug=None, host=None, port=None):
         """Ejecuta la aplicación"""
@@ -0,0 +1,19 @@
+/*
+ * Caché en el navegador de las figuras de PM2.5 y PM10 (clientside callbacks).
+ * El servidor envía las figuras de cada estación una sola vez por sesión;
+ * al volver a una estación ya vista se muestran sin consultar al servidor.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    figures: {
+        // Devuelve [figura PM2.5, figura PM10, estación a pedir al servidor]
+        pmFromCache: function (station, cache) {
+            var noUpdate = window.dash_clientside.no_update;
+            station = station || 'MER';
+            var entry = (cache || {})[station];
+            if (entry) {
+                return [entry['PM2.5'], entry['PM10'], noUpdate];
+            }
+            return [noUpdate, noUpdate, station];
+        }
+    }
+});
@@ -0,0 +1,63 @@
+/*
+ * Carga diferida de gráficas (IntersectionObserver + clientside callbacks).
+ * Los contenedores con atributo data-lazy-store marcan como visible el Store
+ * indicado la primera vez que entran en pantalla; las figuras diferidas se
+ * dibujan hasta entonces.
+ */
+(function () {
+    var seen = typeof WeakSet !== 'undefined' ? new WeakSet() : null;
+
+    function markVisible(el) {
+        el.setAttribute('data-visible', 'true');
+        var clientside = window.dash_clientside || {};
+        if (clientside.set_props) {
+            clientside.set_props(el.getAttribute('data-lazy-store'), {data: true});
+        }
+    }
+
+    var observer = window.IntersectionObserver ? new IntersectionObserver(function (entries) {
+        entries.forEach(function (entry) {
+            if (entry.isIntersecting) {
+                observer.unobserve(entry.target);
+                markVisible(entry.target);
+            }
+        });
+    }, {rootMargin: '200px 0px'}) : null;
+
+    function scan() {
+        var nodes = document.querySelectorAll('[data-lazy-store]:not([data-visible])');
+        for (var i = 0; i < nodes.length; i++) {
+            var el = nodes[i];
+            if (seen && seen.has(el)) {
+                continue;
+            }
+            if (seen) {
+                seen.add(el);
+            }
+            if (observer) {
+                observer.observe(el);
+            } else {
+                // Navegadores sin IntersectionObserver: dibujar todo de inmediato
+                markVisible(el);
+            }
+        }
+    }
+
+    // Dash monta las páginas dinámicamente: revisar cada vez que cambia el DOM
+    document.addEventListener('DOMContentLoaded', function () {
+        scan();
+        new MutationObserver(scan).observe(document.body, {childList: true, subtree: true});
+    });
+})();
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    lazy: {
+        // Devuelve la figura guardada solo cuando su contenedor ya fue visible
+        figureWhenVisible: function (figure, visible) {
+            if (!visible || !figure) {
+                return window.dash_clientside.no_update;
+            }
+            return figure;
+        }
+    }
+});
@@ -0,0 +1,48 @@
+/*
+ * Navegación de fecha y hora de históricos en el navegador (clientside callbacks).
+ * Solo cambian el valor del selector; el servidor recibe únicamente el callback
+ * de la figura que depende de ese valor.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    ui: (function () {
+        function pad2(n) {
+            return (n < 10 ? '0' : '') + n;
+        }
+
+        // Id del botón que disparó el callback (o null)
+        function triggeredId() {
+            var triggered = window.dash_clientside.callback_context.triggered || [];
+            if (!triggered.length) {
+                return null;
+            }
+            return triggered[0].prop_id.split('.')[0];
+        }
+
+        return {
+            // Día anterior/siguiente; por defecto hace 7 días
+            navigateDate: function (prevClicks, nextClicks, currentDate) {
+                var step = {'date-picker-historicos-prev': -1, 'date-picker-historicos-next': 1}[triggeredId()];
+                if (!step) {
+                    return window.dash_clientside.no_update;
+                }
+                var m = /^(\d{4})-(\d{2})-(\d{2})/.exec(currentDate || '');
+                var d = m ? new Date(+m[1], +m[2] - 1, +m[3])
+                          : new Date(Date.now() - 7 * 24 * 3600 * 1000);
+                d.setDate(d.getDate() + step);
+                return d.getFullYear() + '-' + pad2(d.getMonth() + 1) + '-' + pad2(d.getDate());
+            },
+
+            // Hora anterior/siguiente, circular (23 -> 0 y 0 -> 23); por defecto las 9
+            navigateHour: function (prevClicks, nextClicks, currentHour) {
+                var step = {'hour-picker-historicos-prev': -1, 'hour-picker-historicos-next': 1}[triggeredId()];
+                if (!step) {
+                    return window.dash_clientside.no_update;
+                }
+                if (currentHour === null || currentHour === undefined) {
+                    currentHour = 9;
+                }
+                return (currentHour + step + 24) % 24;
+            }
+        };
+    })()
+});
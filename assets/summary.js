@@ -0,0 +1,38 @@
+/*
+ * Resumen del máximo pronóstico de ozono armado en el navegador (clientside callbacks).
+ * El servidor solo envía los datos (valor, estación, hora y fecha del pronóstico);
+ * el texto replica el formato que antes se generaba en Python.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    summary: (function () {
+        function html(type, props) {
+            return {namespace: 'dash_html_components', type: type, props: props || {}};
+        }
+
+        return {
+            ozoneMax: function (data) {
+                if (!data) {
+                    return window.dash_clientside.no_update;
+                }
+                if (data.message) {
+                    return html('P', {
+                        children: data.message,
+                        className: 'ozone-summary' + (data.error ? ' summary-error' : '')
+                    });
+                }
+                return html('P', {
+                    children: [
+                        'Máxima concentración pronosticada: ' + Number(data.value).toFixed(1) +
+                            ' ppb en ' + data.station + ', a las ' + data.hour + ' hrs.',
+                        html('Br'),
+                        html('Span', {
+                            children: '(Pronóstico del ' + data.fecha + ' a las ' + data.hora + ' hrs.)',
+                            style: {'font-style': 'italic'}
+                        })
+                    ],
+                    className: 'ozone-summary summary-ok'
+                });
+            }
+        };
+    })()
+});
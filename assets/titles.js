@@ -0,0 +1,59 @@
+/*
+ * Títulos de las gráficas calculados en el navegador (clientside callbacks).
+ * Replican el formato de los títulos que antes se generaban en el servidor.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    titles: (function () {
+        var MESES = ['Enero', 'Febrero', 'Marzo', 'Abril', 'Mayo', 'Junio', 'Julio',
+                     'Agosto', 'Septiembre', 'Octubre', 'Noviembre', 'Diciembre'];
+
+        function pad2(n) {
+            return (n < 10 ? '0' : '') + n;
+        }
+
+        // Parsea 'YYYY-MM-DD[T ]HH:MM[:SS]' como hora local (sin zona horaria)
+        function parseLocal(value) {
+            var m = /^(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2})(?::(\d{2}))?)?/.exec(value || '');
+            if (!m) {
+                return null;
+            }
+            return new Date(+m[1], +m[2] - 1, +m[3], +(m[4] || 0), +(m[5] || 0), +(m[6] || 0));
+        }
+
+        function fechaLarga(d) {
+            return pad2(d.getDate()) + ' de ' + MESES[d.getMonth()] + ' de ' + d.getFullYear();
+        }
+
+        return {
+            // Título de ozono: hora del último pronóstico menos 1 hora
+            ozoneTitle: function (station, lastForecastIso) {
+                var d = parseLocal(lastForecastIso) || new Date();
+                d = new Date(d.getTime() - 3600 * 1000);
+                var hora = pad2(d.getHours()) + ':' + pad2(d.getMinutes());
+                return 'Concentraciones de Ozono (ppb) - a las ' + hora + ' hrs. del ' + fechaLarga(d);
+            },
+
+            // Título de pronósticos históricos
+            historicosTitle: function (date, hour, pollutant, station, meta) {
+                if (!date) {
+                    var past = new Date(Date.now() - 7 * 24 * 3600 * 1000);
+                    date = past.getFullYear() + '-' + pad2(past.getMonth() + 1) + '-' + pad2(past.getDate());
+                }
+                if (hour === null || hour === undefined) {
+                    hour = 9;
+                }
+                pollutant = pollutant || 'O3';
+                station = station || 'MER';
+                meta = meta || {};
+
+                var info = (meta.pollutants || {})[pollutant] || {name: pollutant, units: 'units'};
+                var stationName = (meta.stations || {})[station] || station;
+                var d = parseLocal(date);
+                var dateStr = d ? fechaLarga(d) : date;
+
+                return 'Concentraciones de ' + info.name + ' (' + info.units + ') - Pronóstico del ' +
+                    dateStr + ' a las ' + pad2(hour) + ':00 hrs. - ' + stationName;
+            }
+        };
+    })()
+});
@@ -0,0 +1,76 @@
+"""
+Utilidades de caché en memoria para el dashboard de pronósticos.
+
+Proporciona un decorador TTL seguro para hilos (Dash/gunicorn atienden
+peticiones en varios hilos) sin depender de paquetes externos.
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+
+def ttl_cache(ttl: float, maxsize: int = 128, cache_falsy: bool = True,
+              cache_if: Optional[Callable[[Any], bool]] = None) -> Callable:
+    """
+    Decorador que memoriza resultados por argumentos durante `ttl` segundos.
+
+    Args:
+        ttl: Tiempo de vida de cada entrada en segundos
+        maxsize: Número máximo de entradas (se descarta la más antigua)
+        cache_falsy: Si es False, no se guardan resultados vacíos/None
+                     (p. ej. cuando la BD no respondió) para reintentar pronto
+        cache_if: Predicado opcional sobre el resultado; si devuelve False
+                  el resultado se entrega pero no se guarda
+
+    La función decorada expone `cache_clear()` para invalidar manualmente.
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            now = time.monotonic()
+
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and entry[0] > now:
+                    cache.move_to_end(key)
+                    return entry[1]
+
+            result = func(*args, **kwargs)
+
+            if (cache_falsy or _is_truthy(result)) and (cache_if is None or cache_if(result)):
+                with lock:
+                    cache[key] = (now + ttl, result)
+                    cache.move_to_end(key)
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return result
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def _is_truthy(value: Any) -> bool:
+    """Evalúa si un resultado merece guardarse (soporta DataFrames/arrays)"""
+    if value is None:
+        return False
+    empty = getattr(value, 'empty', None)
+    if isinstance(empty, bool):
+        return not empty
+    try:
+        return bool(value)
+    except ValueError:
+        # Arrays de NumPy con más de un elemento
+        return True
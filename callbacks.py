@@ -3,17 +3,415 @@ Módulo de callbacks para la aplicación de pronóstico de calidad del aire.
 Organiza todos los callbacks por funcionalidad y página.
 """
 
-from dash import Output, Input, State, callback, dcc
+from dash import Output, Input, State, ClientsideFunction, Patch, callback, dcc, ctx, no_update
+from dash.exceptions import PreventUpdate
 from typing import Any
-from datetime import datetime
+from datetime import datetime, timedelta
+from operator import itemgetter
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import plotly.io as pio
 
 from visualization import create_time_series, create_indicators, create_historical_time_series, get_historical_data_for_csv
-from config import config_manager, DEFAULT_DATE_CONFIG
-from components import indicator_components
-from pages import get_forecast_datetime_str
+from config import DEFAULT_DATE_CONFIG, FORECAST_API_CONFIG, register_reload_hook
+from components import (
+    indicator_components, station_options_lazy, search_station_options, STATION_DROPDOWN_IDS,
+    INDICATORS_VISIBLE_ID, DIALS_GRAPH_ID, DIALS_FIGURE_ID, default_forecast_date
+)
+from pages import MESES_ESP
 from data_service import data_service
+from cache_utils import ttl_cache
 from dash import html
 
+# Servicio PostgreSQL (sistema principal); sin él no hay fecha de último pronóstico
+try:
+    from postgres_data_service import get_last_available_date
+except ImportError:
+    get_last_available_date = None
+
+# Decodificador JSON rápido si está disponible (orjson), si no la biblioteca estándar
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# Sesión HTTP compartida: reutiliza la conexión keep-alive con la API de pronóstico
+_API_SESSION = requests.Session()
+_API_SESSION.mount('http://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+# Pedir JSON comprimido explícitamente (no depender de los valores por defecto de requests)
+_API_SESSION.headers.update({'Accept': 'application/json', 'Accept-Encoding': 'gzip, deflate'})
+
+# URL base de la API de pronóstico (configurable con OZONE_FORECAST_API_URL)
+_API_BASE = FORECAST_API_CONFIG['ozone_url_base']
+
+logger = logging.getLogger(__name__)
+
+
+# Estilos compartidos por los párrafos de resumen, aviso y error
+_STYLE_INFO = {
+    'font-size': '18px',
+    'font-family': 'Helvetica',
+    'color': '#666',
+    'margin': '0',
+    'text-align': 'center'
+}
+_STYLE_ERR = {**_STYLE_INFO, 'color': '#d32f2f'}
+_STYLE_OK = {**_STYLE_INFO, 'color': '#1a1a1a', 'font-weight': '500'}
+_STYLE_ITALIC = {'font-style': 'italic'}
+
+
+def _info_p(text: str, err: bool = False) -> html.P:
+    """Crea un párrafo de aviso (o de error si err=True) con el estilo compartido"""
+    return html.P(text, style=_STYLE_ERR if err else _STYLE_INFO)
+
+
+# Respuestas fijas del resumen desde BD (se comparten entre llamadas)
+_NO_DATA_RESPONSE = _info_p("No hay datos de pronóstico disponibles")
+_SUMMARY_ERROR_RESPONSE = _info_p("Error al cargar el resumen del pronóstico", err=True)
+
+
+def _parse_fecha(fecha_str: str, fallback: datetime) -> datetime:
+    """
+    Parsea la fecha del pronóstico devuelta por la API.
+    Acepta 'YYYY-MM-DD' y 'YYYY-MM-DD[T ]HH:MM:SS'; si la fecha no trae hora
+    se usan las 7 AM. Si no se puede parsear se regresa `fallback`.
+    """
+    try:
+        if 'T' not in fecha_str and ' ' not in fecha_str:
+            # Solo fecha: camino directo sin revisar la hora
+            return datetime.fromisoformat(fecha_str).replace(hour=7)
+        fecha_dt = datetime.fromisoformat(fecha_str.replace('Z', '+00:00'))
+    except (ValueError, TypeError, AttributeError):
+        return fallback
+    if fecha_dt.hour == 0 and fecha_dt.minute == 0 and fecha_dt.second == 0:
+        fecha_dt = fecha_dt.replace(hour=7)
+    return fecha_dt
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_forecast_ts(fecha_str: str) -> datetime:
+    """Parsea 'YYYY-MM-DD HH:MM:SS' (memoizado: se repiten las mismas pocas fechas)"""
+    return datetime.fromisoformat(fecha_str)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_date(fecha_str: str) -> datetime:
+    """Parsea 'YYYY-MM-DD' (memoizado)"""
+    return datetime.fromisoformat(fecha_str)
+
+
+def _last_available_date():
+    """Fecha del último pronóstico en BD (postgres_data_service la cachea 60 s)"""
+    if get_last_available_date is None:
+        return None
+    return get_last_available_date()
+
+
+def _current_fecha_str():
+    """Fecha ('%Y-%m-%d %H:%M:%S') del pronóstico vigente, o None si no hay datos"""
+    if DEFAULT_DATE_CONFIG['use_specific_date']:
+        return DEFAULT_DATE_CONFIG['specific_date']
+    latest_date = _last_available_date()
+    return latest_date.strftime('%Y-%m-%d %H:%M:%S') if latest_date else None
+
+
+@ttl_cache(ttl=600, maxsize=1, cache_falsy=False)
+def _station_names() -> dict:
+    """Mapa código -> nombre de estación, refrescado cada 10 min"""
+    return {code: info.get('name', code) for code, info in data_service.get_all_stations().items()}
+
+
+def _station_name(code: str) -> str:
+    """Nombre de una estación; si no se conoce se regresa el código"""
+    try:
+        return _station_names().get(code, code)
+    except (AttributeError, TypeError):
+        return code
+
+
+@ttl_cache(ttl=600, maxsize=8, cache_falsy=False)
+def _forecast_max(fecha_str: str):
+    """Máximo pronóstico entre estaciones y horas (agregado en la BD), cacheado por fecha (10 min)"""
+    return data_service.get_forecast_argmax(fecha_str)
+
+
+# Respuestas fijas de la API sin datos (se comparten entre llamadas)
+_API_EMPTY_DATA = {'message': "No hay datos de pronóstico disponibles en la API"}
+_API_NO_MAX_DATA = {'message': "No se encontró valor máximo en los datos de la API"}
+_API_LOADING_RESPONSE = _info_p("Cargando datos de la API...")
+
+
+def _api_error_data(text: str) -> dict:
+    """Datos de resumen para un error de la API (se muestran en rojo)"""
+    return {'message': text, 'error': True}
+
+
+@ttl_cache(ttl=300, maxsize=4)
+def _api_summary(fecha_api: str) -> dict:
+    """
+    Consulta la API externa de pronóstico de ozono para `fecha_api` (YYYY-MM-DD)
+    y extrae los datos del resumen del máximo pronosticado.
+
+    Devuelve solo los datos (valor, estación, hora y fecha del pronóstico) o
+    {'message': ...} si no hay máximo; el texto se arma en el navegador
+    (assets/summary.js) o con _summary_p() en el servidor.
+
+    El resultado se cachea 5 min por fecha; los errores se propagan como
+    excepciones y por lo tanto no se cachean.
+    """
+    # Construir URL de la API
+    api_url = _API_BASE + fecha_api
+    
+    logger.debug("🔍 [API] Consultando API: %s", api_url)
+    
+    # Hacer petición a la API
+    response = _API_SESSION.get(api_url, timeout=(2, 8))
+    response.raise_for_status()
+    
+    # Parsear JSON directamente de los bytes de la respuesta
+    data = _json_loads(response.content)
+    
+    # Verificar que hay datos antes de cualquier otro trabajo
+    if not data or 'pronos' not in data or not data['pronos']:
+        return _API_EMPTY_DATA
+    
+    # Encontrar el máximo valor en el array pronos
+    max_pron = max((p for p in data['pronos'] if p.get('valor') is not None),
+                   key=itemgetter('valor'), default=None)
+    if max_pron is None:
+        return _API_NO_MAX_DATA
+    max_value = max_pron['valor']
+    
+    # Obtener información del máximo
+    id_est = max_pron.get('id_est', 'N/A')
+    hora = max_pron.get('hora', 'N/A')
+    
+    # Obtener fecha y hora del pronóstico desde la respuesta de la API
+    fecha_pron_str = data.get('fecha_pron', fecha_api)
+    
+    # Parsear la fecha; si no trae hora usar 7 AM por defecto
+    fecha_default = _parse_date(fecha_api).replace(hour=7)
+    fecha_pron_dt = _parse_fecha(fecha_pron_str, fecha_default)
+    
+    # Formatear fecha y hora para mostrar
+    hora_formateada = fecha_pron_dt.strftime('%H:%M')
+    
+    # Formatear fecha en español manualmente
+    fecha_formateada = f"{fecha_pron_dt.day} de {MESES_ESP[fecha_pron_dt.month]} de {fecha_pron_dt.year}"
+    
+    # Obtener nombre de la estación si está disponible
+    station_name = _station_name(id_est)
+    
+    logger.debug("✅ [API] Resumen desde API: %.1f ppb en %s a las %s (Pronóstico: %s %s)",
+                 max_value, id_est, hora, fecha_formateada, hora_formateada)
+    
+    return {
+        'value': round(float(max_value), 1),
+        'station': station_name,
+        'hour': hora,
+        'fecha': fecha_formateada,
+        'hora': hora_formateada
+    }
+
+
+def _summary_p(data: dict) -> html.P:
+    """Párrafo de resumen a partir de los datos de _api_summary (página de debug)"""
+    if 'message' in data:
+        return _info_p(data['message'], err=data.get('error', False))
+    return html.P([
+        f"Máxima concentración pronosticada: {data['value']:.1f} ppb en {data['station']}, a las {data['hour']} hrs.",
+        html.Br(),
+        html.Span(
+            f"(Pronóstico del {data['fecha']} a las {data['hora']} hrs.)",
+            style=_STYLE_ITALIC
+        )
+    ], style=_STYLE_OK)
+
+
+def _prejson(fig) -> dict:
+    """
+    Serializa la figura una sola vez con el codificador de Plotly (orjson si está).
+    Lo que queda en caché son tipos JSON nativos, así Dash no vuelve a recorrer
+    arreglos de NumPy y fechas de pandas en cada respuesta.
+    """
+    return _json_loads(pio.to_json(fig, validate=False))
+
+
+def _has_traces(fig: dict) -> bool:
+    """Una figura sin trazas suele indicar que la BD no respondió: no se cachea"""
+    return bool(fig.get('data'))
+
+
+@ttl_cache(ttl=900, maxsize=64, cache_if=_has_traces)
+def _cached_time_series(pollutant: str, station: str, fecha_str: str):
+    """
+    Figura de serie temporal cacheada por (contaminante, estación, pronóstico).
+    Un pronóstico nuevo cambia la llave; el TTL de 15 min acota la antigüedad
+    de las observaciones incluidas en la figura.
+    """
+    return _prejson(create_time_series(pollutant, station))
+
+
+@ttl_cache(ttl=3600, maxsize=32, cache_if=_has_traces)
+def _cached_historical_series(pollutant: str, station: str, forecast_datetime_str: str):
+    """Figura de pronóstico histórico; los pronósticos pasados no cambian (1 h de TTL)"""
+    return _prejson(create_historical_time_series(pollutant, station, forecast_datetime_str))
+
+
+@ttl_cache(ttl=3600, maxsize=128, cache_if=_has_traces)
+def _cached_indicator_figure(station: str, fecha_str: str) -> dict:
+    """Figura de diales de probabilidad cacheada por (estación, pronóstico)"""
+    return _prejson(create_indicators(station))
+
+
+def _cached_indicators(station: str, fecha_str: str) -> html.Div:
+    """Diales envueltos en columnas; envolver es barato, lo costoso es la figura"""
+    return indicator_components.wrap_indicators_in_columns(_cached_indicator_figure(station, fecha_str))
+
+
+def _clear_figure_caches():
+    """
+    Descarta datos y figuras cacheadas cuando la configuración cambia en caliente:
+    el ID de pronóstico cambia los datos y los umbrales cambian las bandas dibujadas.
+    """
+    for cached in (_cached_time_series, _cached_historical_series, _cached_indicator_figure, _forecast_max,
+                   data_service.get_all_stations_forecast_batch,
+                   data_service.get_all_stations_historical_batch):
+        cached.cache_clear()
+
+
+register_reload_hook(_clear_figure_caches)
+
+
+# Precarga en segundo plano de las vistas vecinas (estación u hora adyacente)
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='prefetch')
+_prefetch_pending = set()
+_prefetch_lock = threading.Lock()
+
+
+def _prefetch(func, *args):
+    """Ejecuta func(*args) en segundo plano para dejar el resultado en su caché"""
+    key = (func.__name__,) + args
+    with _prefetch_lock:
+        if key in _prefetch_pending:
+            return
+        _prefetch_pending.add(key)
+    
+    def run():
+        try:
+            func(*args)
+        except Exception as e:
+            logger.debug("⚠️ Precarga fallida %s: %s", key, e)
+        finally:
+            with _prefetch_lock:
+                _prefetch_pending.discard(key)
+    
+    _PREFETCH_EXECUTOR.submit(run)
+
+
+def _neighbour_stations(station: str) -> list:
+    """Estaciones anterior y siguiente en el orden del selector"""
+    codes = list(_station_names())
+    if station not in codes:
+        return []
+    i = codes.index(station)
+    return [codes[j] for j in (i - 1, i + 1) if 0 <= j < len(codes)]
+
+
+# Snapshot del resumen de la API, actualizado por un hilo en segundo plano
+_API_REFRESH_SECONDS = 300
+# Un snapshot con más de dos ciclos sin refrescarse se considera desactualizado
+_API_STALE_SECONDS = 2 * _API_REFRESH_SECONDS
+_LATEST_API_SUMMARY = {'summary': None, 'error': None, 'fetched_at': None}
+_api_refresher_lock = threading.Lock()
+_api_refresher_started = False
+
+
+def _api_refresher():
+    """Consulta la API periódicamente y guarda el último resumen válido"""
+    while True:
+        fecha_api = datetime.now().strftime('%Y-%m-%d')
+        try:
+            _api_summary.cache_clear()
+            summary = _api_summary(fecha_api)
+            # Un solo update: el resumen y su hora de consulta cambian juntos
+            _LATEST_API_SUMMARY.update(summary=summary, error=None, fetched_at=datetime.now())
+        except requests.exceptions.RequestException as e:
+            logger.warning("⚠️ [API] Error de conexión en refresco en segundo plano: %s", e)
+            _LATEST_API_SUMMARY['error'] = _api_error_data(f"Error al conectar con la API: {str(e)}")
+        except Exception as e:
+            logger.exception("⚠️ [API] Error en refresco en segundo plano: %s", e)
+            _LATEST_API_SUMMARY['error'] = _api_error_data(f"Error al procesar datos de la API: {str(e)}")
+        time.sleep(_API_REFRESH_SECONDS)
+
+
+def _start_api_refresher():
+    """Arranca el hilo de refresco de la API una sola vez por proceso"""
+    global _api_refresher_started
+    with _api_refresher_lock:
+        if _api_refresher_started:
+            return
+        threading.Thread(target=_api_refresher, name='api-summary-refresher', daemon=True).start()
+        _api_refresher_started = True
+
+
+def _fetch_api_summary(log_tag: str) -> tuple:
+    """
+    Datos del resumen del máximo pronosticado desde la API para la fecha de hoy
+    y la hora en que se consultaron (None si no se obtuvieron).
+    `log_tag` identifica la página en los logs.
+    """
+    # Para la API, usar la fecha actual (hoy) en lugar de la fecha del último pronóstico en BD
+    # Esto asegura que siempre consultemos el pronóstico más reciente disponible en la API
+    fecha_api = datetime.now().strftime('%Y-%m-%d')
+    
+    # Último resumen obtenido por el hilo de refresco (respuesta inmediata)
+    snapshot = _LATEST_API_SUMMARY.copy()
+    if snapshot['summary'] is not None:
+        fetched_at = snapshot['fetched_at']
+        stale = (datetime.now() - fetched_at).total_seconds() > _API_STALE_SECONDS
+        if stale and snapshot['error'] is not None:
+            # La API lleva varios ciclos fallando: mostrar el error y no el máximo viejo
+            return snapshot['error'], fetched_at
+        return snapshot['summary'], fetched_at
+    
+    if snapshot['error'] is not None:
+        # Sin resumen previo y el hilo ya falló: no bloquear cada petición con la API caída
+        return snapshot['error'], None
+    
+    # Arranque en frío: el primer refresco aún no termina, consultar directamente
+    try:
+        return _api_summary(fecha_api), datetime.now()
+    except requests.exceptions.RequestException as e:
+        logger.warning("⚠️ %s Error de conexión con API: %s", log_tag, e)
+        return _api_error_data(f"Error al conectar con la API: {str(e)}"), None
+    except Exception as e:
+        logger.exception("⚠️ %s Error calculando resumen desde API: %s", log_tag, e)
+        
+        return _api_error_data(f"Error al procesar datos de la API: {str(e)}"), None
+
+
+def _freshness_text(fetched_at) -> str:
+    """Hora de la última consulta exitosa a la API, marcada si ya está desactualizada"""
+    if fetched_at is None:
+        return ""
+    text = f"Actualizado a las {fetched_at:%H:%M} hrs."
+    if (datetime.now() - fetched_at).total_seconds() > _API_STALE_SECONDS:
+        text += " (datos desactualizados)"
+    return text
+
 
 class HomePageCallbacks:
     """Callbacks específicos para la página principal"""
@@ -22,258 +420,73 @@ class HomePageCallbacks:
     def register_home_callbacks(app):
         """Registra todos los callbacks de la página principal"""
         
+        # Gráfico y diales dependen solo de la estación: un solo callback
         @app.callback(
             [Output("o3-timeseries-home", "figure"),
-             Output("ozone-max-summary-content", "children")],
+             Output("indicators-container", "children")],
             Input("station-dropdown-home", "value")
         )
-        def update_o3_timeseries_and_summary(station):
-            """Actualiza la serie temporal de ozono Y el resumen usando los mismos datos"""
-            if station is None:
-                station = 'MER'
+        def update_home(station):
+            """Actualiza gráfico de ozono y diales de la página principal"""
+            station = station or 'MER'
+            fecha_str = _current_fecha_str()
             
-            # Crear el gráfico (que ya consulta todos los datos de pronóstico)
-            fig = create_time_series('O3', station)
+            # Para una misma estación y pronóstico los diales no cambian
+            result = (
+                _cached_time_series('O3', station, fecha_str),
+                _cached_indicators(station, fecha_str)
+            )
             
-            # Calcular el resumen usando la API externa
-            try:
-                import requests
-                from datetime import datetime
-                from data_service import data_service
-                
-                # Para la API, usar la fecha actual (hoy) en lugar de la fecha del último pronóstico en BD
-                # Esto asegura que siempre consultemos el pronóstico más reciente disponible en la API
-                fecha_date = datetime.now()
-                
-                # Formatear fecha para la API (YYYY-MM-DD)
-                fecha_api = fecha_date.strftime('%Y-%m-%d')
-                
-                # Construir URL de la API
-                api_url = f"http://132.248.8.98:58888/ai_vi_transformer01/ozono/CDMX/{fecha_api}"
-                
-                print(f"🔍 [HOME] Consultando API: {api_url}")
-                
-                # Hacer petición a la API
-                response = requests.get(api_url, timeout=10)
-                response.raise_for_status()
-                
-                # Parsear JSON
-                data = response.json()
-                
-                # Verificar que hay datos
-                if not data or 'pronos' not in data or not data['pronos']:
-                    summary_html = html.P(
-                        "No hay datos de pronóstico disponibles en la API",
-                        style={
-                            'font-size': '18px',
-                            'font-family': 'Helvetica',
-                            'color': '#666',
-                            'margin': '0',
-                            'text-align': 'center'
-                        }
-                    )
-                    return fig, summary_html
-                
-                # Obtener fecha y hora del pronóstico desde la respuesta de la API
-                fecha_pron_str = data.get('fecha_pron', fecha_api)
-                
-                # Intentar parsear la fecha con hora, si no tiene hora usar 7 AM por defecto
-                try:
-                    # Intentar parsear con hora
-                    if 'T' in fecha_pron_str or ' ' in fecha_pron_str:
-                        # Formato con hora (ISO o con espacio)
-                        if 'T' in fecha_pron_str:
-                            fecha_pron_dt = datetime.fromisoformat(fecha_pron_str.replace('Z', '+00:00'))
-                        else:
-                            fecha_pron_dt = datetime.strptime(fecha_pron_str, '%Y-%m-%d %H:%M:%S')
-                    else:
-                        # Solo fecha, agregar 7 AM
-                        fecha_pron_dt = datetime.strptime(fecha_pron_str, '%Y-%m-%d')
-                        fecha_pron_dt = fecha_pron_dt.replace(hour=7, minute=0, second=0)
-                except:
-                    # Si falla el parsing, usar la fecha de la consulta con 7 AM
-                    try:
-                        fecha_pron_dt = datetime.strptime(fecha_pron_str, '%Y-%m-%d')
-                        fecha_pron_dt = fecha_pron_dt.replace(hour=7, minute=0, second=0)
-                    except:
-                        fecha_pron_dt = fecha_date.replace(hour=7, minute=0, second=0)
-                
-                # Formatear fecha y hora para mostrar
-                hora_formateada = fecha_pron_dt.strftime('%H:%M')
-                
-                # Formatear fecha en español manualmente
-                meses_esp = {
-                    1: 'Enero', 2: 'Febrero', 3: 'Marzo', 4: 'Abril',
-                    5: 'Mayo', 6: 'Junio', 7: 'Julio', 8: 'Agosto',
-                    9: 'Septiembre', 10: 'Octubre', 11: 'Noviembre', 12: 'Diciembre'
-                }
-                dia = fecha_pron_dt.day
-                mes = meses_esp[fecha_pron_dt.month]
-                año = fecha_pron_dt.year
-                fecha_formateada = f"{dia} de {mes} de {año}"
-                
-                # Encontrar el máximo valor en el array pronos
-                max_pron = None
-                max_value = None
-                
-                for pron in data['pronos']:
-                    valor = pron.get('valor')
-                    if valor is not None:
-                        if max_value is None or valor > max_value:
-                            max_value = valor
-                            max_pron = pron
-                
-                if max_pron and max_value is not None:
-                    # Obtener información del máximo
-                    id_est = max_pron.get('id_est', 'N/A')
-                    hora = max_pron.get('hora', 'N/A')
-                    
-                    # Obtener nombre de la estación si está disponible
-                    try:
-                        stations_dict = data_service.get_all_stations()
-                        station_info = stations_dict.get(id_est, {})
-                        station_name = station_info.get('name', id_est)
-                    except:
-                        station_name = id_est
-                    
-                    print(f"✅ [HOME] Resumen desde API: {max_value:.1f} ppb en {id_est} a las {hora} (Pronóstico: {fecha_formateada} {hora_formateada})")
-                    
-                    summary_html = html.P([
-                        f"Máxima concentración pronosticada: {max_value:.1f} ppb en {station_name}, a las {hora} hrs.",
-                        html.Br(),
-                        html.Span(
-                            f"(Pronóstico del {fecha_formateada} a las {hora_formateada} hrs.)",
-                            style={'font-style': 'italic'}
-                        )
-                    ], style={
-                        'font-size': '18px',
-                        'font-family': 'Helvetica',
-                        'color': '#1a1a1a',
-                        'margin': '0',
-                        'text-align': 'center',
-                        'font-weight': '500'
-                    })
-                else:
-                    summary_html = html.P(
-                        "No se encontró valor máximo en los datos de la API",
-                        style={
-                            'font-size': '18px',
-                            'font-family': 'Helvetica',
-                            'color': '#666',
-                            'margin': '0',
-                            'text-align': 'center'
-                        }
-                    )
-                
-                return fig, summary_html
-                
-            except requests.exceptions.RequestException as e:
-                print(f"⚠️ [HOME] Error de conexión con API: {e}")
-                summary_html = html.P(
-                    f"Error al conectar con la API: {str(e)}",
-                    style={
-                        'font-size': '18px',
-                        'font-family': 'Helvetica',
-                        'color': '#d32f2f',
-                        'margin': '0',
-                        'text-align': 'center'
-                    }
-                )
-                return fig, summary_html
-            except Exception as e:
-                print(f"⚠️ [HOME] Error calculando resumen desde API: {e}")
-                import traceback
-                traceback.print_exc()
-                
-                summary_html = html.P(
-                    f"Error al procesar datos de la API: {str(e)}",
-                    style={
-                        'font-size': '18px',
-                        'font-family': 'Helvetica',
-                        'color': '#d32f2f',
-                        'margin': '0',
-                        'text-align': 'center'
-                    }
-                )
-                return fig, summary_html
+            # Dejar listas las estaciones vecinas del selector
+            for neighbour in _neighbour_stations(station):
+                _prefetch(_cached_time_series, 'O3', neighbour, fecha_str)
+            
+            return result
         
+        # Diales diferidos: se dibujan en el navegador cuando la fila entra en pantalla
+        app.clientside_callback(
+            ClientsideFunction(namespace="lazy", function_name="figureWhenVisible"),
+            Output(DIALS_GRAPH_ID, "figure"),
+            [Input(DIALS_FIGURE_ID, "data"),
+             Input(INDICATORS_VISIBLE_ID, "data")]
+        )
         
-        @app.callback(
-            Output("indicators-container", "children"),
-            Input("station-dropdown-home", "value")
+        # El título solo formatea la fecha del último pronóstico: se calcula en el navegador
+        app.clientside_callback(
+            ClientsideFunction(namespace="titles", function_name="ozoneTitle"),
+            Output("o3-title", "children"),
+            [Input("station-dropdown-home", "value"),
+             Input("last-fcst-date", "data")]
         )
-        def update_indicators_home(station):
-            if station is None:
-                station = 'MER'
-            indicators = create_indicators(station)
-            return indicator_components.wrap_indicators_in_columns(indicators)
+        
         
         @app.callback(
-            Output("o3-title", "children"),
-            Input("station-dropdown-home", "value")
+            [Output("ozone-summary-data", "data"),
+             Output("ozone-summary-freshness", "children")],
+            Input("interval-refresh", "n_intervals"),
+            State("ozone-summary-data", "data")
+        )
+        def update_o3_summary(_, shown_data):
+            """
+            Actualiza los datos del resumen del máximo de ozono desde la API.
+            No depende de la estación: se calcula al cargar la página y cada 15 min.
+            Solo viajan los datos (el texto se arma en el navegador) y, si no
+            cambiaron, solo se actualiza la hora de la última consulta exitosa
+            (marcada como desactualizada si el hilo de refresco dejó de obtener datos).
+            """
+            data, fetched_at = _fetch_api_summary('[HOME]')
+            freshness = _freshness_text(fetched_at)
+            if data == shown_data:
+                return no_update, freshness
+            return data, freshness
+        
+        # Texto del resumen a partir de los datos: se arma en el navegador
+        app.clientside_callback(
+            ClientsideFunction(namespace="summary", function_name="ozoneMax"),
+            Output("ozone-max-summary-content", "children"),
+            Input("ozone-summary-data", "data"),
+            prevent_initial_call=True
         )
-        def update_o3_title(station):
-            """Actualiza el título del pronóstico de ozono cuando cambia la estación"""
-            print(f"🔄 CALLBACK EJECUTADO - Estación: {station}")
-            
-            if station is None:
-                station = 'MER'
-            
-            # Obtener la hora del último pronóstico menos 1 hora
-            from datetime import datetime, timedelta
-            from postgres_data_service import get_last_available_date
-            
-            try:
-                # Obtener la fecha del último pronóstico
-                forecast_datetime = get_last_available_date()
-                
-                if forecast_datetime:
-                    # Restar 1 hora al último pronóstico
-                    adjusted_datetime = forecast_datetime - timedelta(hours=1)
-                    # Formatear fecha y hora de manera más clara
-                    day_str = adjusted_datetime.strftime('%d')
-                    month_names = {
-                        1: 'Enero', 2: 'Febrero', 3: 'Marzo', 4: 'Abril', 5: 'Mayo', 6: 'Junio',
-                        7: 'Julio', 8: 'Agosto', 9: 'Septiembre', 10: 'Octubre', 11: 'Noviembre', 12: 'Diciembre'
-                    }
-                    month_str = month_names[adjusted_datetime.month]
-                    year_str = adjusted_datetime.strftime('%Y')
-                    hour_str = adjusted_datetime.strftime('%H:%M')
-                    datetime_str = f"a las {hour_str} hrs. del {day_str} de {month_str} de {year_str}"
-                    print(f"✅ Usando fecha del último pronóstico menos 1h: {datetime_str}")
-                else:
-                    # Fallback: usar hora actual menos 1 hora
-                    adjusted_datetime = datetime.now() - timedelta(hours=1)
-                    day_str = adjusted_datetime.strftime('%d')
-                    month_names = {
-                        1: 'Enero', 2: 'Febrero', 3: 'Marzo', 4: 'Abril', 5: 'Mayo', 6: 'Junio',
-                        7: 'Julio', 8: 'Agosto', 9: 'Septiembre', 10: 'Octubre', 11: 'Noviembre', 12: 'Diciembre'
-                    }
-                    month_str = month_names[adjusted_datetime.month]
-                    year_str = adjusted_datetime.strftime('%Y')
-                    hour_str = adjusted_datetime.strftime('%H:%M')
-                    datetime_str = f"a las {hour_str} hrs. del {day_str} de {month_str} de {year_str}"
-                    print(f"⚠️ Fallback: usando fecha actual menos 1h: {datetime_str}")
-                    
-            except Exception as e:
-                print(f"❌ Error obteniendo fecha del pronóstico: {e}")
-                # Fallback: usar hora actual menos 1 hora
-                adjusted_datetime = datetime.now() - timedelta(hours=1)
-                day_str = adjusted_datetime.strftime('%d')
-                month_names = {
-                    1: 'Enero', 2: 'Febrero', 3: 'Marzo', 4: 'Abril', 5: 'Mayo', 6: 'Junio',
-                    7: 'Julio', 8: 'Agosto', 9: 'Septiembre', 10: 'Octubre', 11: 'Noviembre', 12: 'Diciembre'
-                }
-                month_str = month_names[adjusted_datetime.month]
-                year_str = adjusted_datetime.strftime('%Y')
-                hour_str = adjusted_datetime.strftime('%H:%M')
-                datetime_str = f"a las {hour_str} hrs. del {day_str} de {month_str} de {year_str}"
-                print(f"⚠️ Error fallback: usando fecha actual menos 1h: {datetime_str}")
-            
-            title = f'Concentraciones de Ozono (ppb) - {datetime_str}'
-            print(f"✅ Título generado: {title}")
-            
-            return title
 
 
 class OtrosContaminantesCallbacks:
@@ -283,83 +496,40 @@ class OtrosContaminantesCallbacks:
     def register_otros_contaminantes_callbacks(app):
         """Registra todos los callbacks de otros contaminantes"""
         
-        # CALLBACKS COMENTADOS - Selector dinámico de contaminantes (para uso futuro)
-        # @app.callback(
-        #     Output("pollutant-timeseries-container", "children"),
-        #     [Input("pollutant-dropdown", "value"),
-        #      Input("station-dropdown-otros", "value")]
-        # )
-        # def update_pollutant_timeseries(pollutant, station):
-        #     if pollutant is None or station is None:
-        #         return [
-        #             dcc.Graph(
-        #                 id="pollutant-timeseries",
-        #                 figure={
-        #                     'data': [],
-        #                     'layout': {
-        #                         'title': 'Selecciona un contaminante y estación',
-        #                         'xaxis': {'visible': False},
-        #                         'yaxis': {'visible': False},
-        #                         'annotations': [{
-        #                             'text': 'Esperando selección...',
-        #                             'xref': 'paper',
-        #                             'yref': 'paper',
-        #                             'x': 0.5,
-        #                             'y': 0.5,
-        #                             'xanchor': 'center',
-        #                             'yanchor': 'middle',
-        #                             'showarrow': False,
-        #                             'font': {'size': 16, 'color': 'gray'}
-        #                         }]
-        #                     }
-        #                 },
-        #                 config={'responsive': True, 'displayModeBar': False}
-        #             )
-        #         ]
-        #     
-        #     # Crear gráfico con los datos seleccionados
-        #     figure = create_time_series(pollutant, station)
-        #     return [
-        #         dcc.Graph(
-        #             id="pollutant-timeseries",
-        #             figure=figure,
-        #             config={'responsive': True, 'displayModeBar': False}
-        #         )
-        #     ]
-        # 
-        # @app.callback(
-        #     Output("pollutant-info-text", "children"),
-        #     Input("pollutant-dropdown", "value")
-        # )
-        # def update_pollutant_info(pollutant):
-        #     if pollutant is None:
-        #         return "Selecciona un contaminante para ver información específica."
-        #     
-        #     pollutant_info = config_manager.get_pollutant_info(pollutant)
-        #     
-        #     if pollutant == 'O3':
-        #         return f"{pollutant_info['name']}: Pronósticos específicos por estación. Cambiar estación afecta observaciones y pronósticos."
-        #     else:
-        #         return f"{pollutant_info['name']}: Observaciones específicas por estación + Pronóstico regional (mean/min/max) igual para todas las estaciones."
-        
-        # CALLBACKS ACTIVOS - Series de tiempo fijas de PM2.5 y PM10
-        @app.callback(
-            Output("pm25-timeseries-otros", "figure"),
-            Input("station-dropdown-otros", "value")
+        # Series temporales de PM2.5 y PM10: se muestran desde la caché del navegador
+        # y solo se pide al servidor una estación que aún no se ha visto
+        app.clientside_callback(
+            ClientsideFunction(namespace="figures", function_name="pmFromCache"),
+            [Output("pm25-timeseries-otros", "figure"),
+             Output("pm10-timeseries-otros", "figure"),
+             Output("pm-station-request", "data")],
+            [Input("station-dropdown-otros", "value"),
+             Input("pm-figure-cache", "data")]
         )
-        def update_pm25_timeseries_otros(station):
-            if station is None:
-                station = 'MER'
-            return create_time_series('PM2.5', station)
         
         @app.callback(
-            Output("pm10-timeseries-otros", "figure"),
-            Input("station-dropdown-otros", "value")
+            Output("pm-figure-cache", "data"),
+            Input("pm-station-request", "data"),
+            prevent_initial_call=True
         )
-        def update_pm10_timeseries_otros(station):
-            if station is None:
-                station = 'MER'
-            return create_time_series('PM10', station)
+        def load_pm_figures(station):
+            """Agrega a la caché del navegador las figuras de PM de `station`"""
+            if not station:
+                return no_update
+            fecha_str = _current_fecha_str()
+            
+            # Patch: solo viaja la entrada nueva, no la caché completa
+            cache = Patch()
+            cache[station] = {
+                pollutant: _cached_time_series(pollutant, station, fecha_str)
+                for pollutant in ('PM2.5', 'PM10')
+            }
+            
+            for neighbour in _neighbour_stations(station):
+                for pollutant in ('PM2.5', 'PM10'):
+                    _prefetch(_cached_time_series, pollutant, neighbour, fecha_str)
+            
+            return cache
 
 
 class HistoricosCallbacks:
@@ -378,8 +548,7 @@ class HistoricosCallbacks:
         )
         def update_pollutant_timeseries_historicos(date, hour, pollutant, station):
             if date is None:
-                from datetime import datetime, timedelta
-                date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+                date = default_forecast_date()
             if hour is None:
                 hour = 9
             if pollutant is None:
@@ -388,119 +557,45 @@ class HistoricosCallbacks:
                 station = 'MER'
             # Combinar fecha y hora
             forecast_datetime_str = f"{date} {hour:02d}:00:00"
-            return create_historical_time_series(pollutant, station, forecast_datetime_str)
+            fig = _cached_historical_series(pollutant, station, forecast_datetime_str)
+            
+            # Dejar listas la hora anterior y la siguiente del mismo día
+            for next_hour in (hour - 1, hour + 1):
+                if 0 <= next_hour <= 23:
+                    _prefetch(_cached_historical_series, pollutant, station, f"{date} {next_hour:02d}:00:00")
+            
+            return fig
         
-        @app.callback(
+        # Título de históricos: todos los datos ya están en el navegador
+        app.clientside_callback(
+            ClientsideFunction(namespace="titles", function_name="historicosTitle"),
             Output("pollutant-title-historicos", "children"),
             [Input("date-picker-historicos", "date"),
              Input("hour-picker-historicos", "value"),
              Input("pollutant-dropdown-historicos", "value"),
-             Input("station-dropdown-historicos", "value")]
+             Input("station-dropdown-historicos", "value")],
+            State("historicos-title-meta", "data")
         )
-        def update_pollutant_title_historicos(date, hour, pollutant, station):
-            """Actualiza el título del pronóstico histórico"""
-            if date is None:
-                from datetime import datetime, timedelta
-                date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-            if hour is None:
-                hour = 9
-            if pollutant is None:
-                pollutant = 'O3'
-            if station is None:
-                station = 'MER'
-            
-            # Obtener información del contaminante
-            pollutant_info = config_manager.get_pollutant_info(pollutant)
-            pollutant_name = pollutant_info['name']
-            units = pollutant_info['units']
-            
-            # Formatear fecha
-            try:
-                forecast_date = datetime.strptime(date, '%Y-%m-%d')
-                day_str = forecast_date.strftime('%d')
-                month_names = {
-                    1: 'Enero', 2: 'Febrero', 3: 'Marzo', 4: 'Abril', 5: 'Mayo', 6: 'Junio',
-                    7: 'Julio', 8: 'Agosto', 9: 'Septiembre', 10: 'Octubre', 11: 'Noviembre', 12: 'Diciembre'
-                }
-                month_str = month_names[forecast_date.month]
-                year_str = forecast_date.strftime('%Y')
-                date_str = f"{day_str} de {month_str} de {year_str}"
-            except:
-                date_str = date
-            
-            stations_dict = data_service.get_all_stations()
-            station_name = stations_dict.get(station, {}).get('name', station)
-            
-            return f'Concentraciones de {pollutant_name} ({units}) - Pronóstico del {date_str} a las {hour:02d}:00 hrs. - {station_name}'
         
-        # Callbacks para navegación de fecha (anterior/siguiente)
-        @app.callback(
+        # Navegación de fecha y hora (anterior/siguiente): solo cambia el selector, en el navegador
+        app.clientside_callback(
+            ClientsideFunction(namespace="ui", function_name="navigateDate"),
             Output("date-picker-historicos", "date"),
             Input("date-picker-historicos-prev", "n_clicks"),
             Input("date-picker-historicos-next", "n_clicks"),
             State("date-picker-historicos", "date"),
             prevent_initial_call=True
         )
-        def navigate_date(prev_clicks, next_clicks, current_date):
-            """Navega a la fecha anterior o siguiente"""
-            from dash import callback_context
-            from datetime import datetime, timedelta
-            
-            if current_date is None:
-                current_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-            
-            # Determinar qué botón se presionó
-            ctx = callback_context
-            if not ctx.triggered:
-                return current_date
-            
-            button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-            current_dt = datetime.strptime(current_date, '%Y-%m-%d')
-            
-            if button_id == 'date-picker-historicos-prev':
-                # Día anterior
-                new_date = (current_dt - timedelta(days=1)).strftime('%Y-%m-%d')
-            elif button_id == 'date-picker-historicos-next':
-                # Día siguiente
-                new_date = (current_dt + timedelta(days=1)).strftime('%Y-%m-%d')
-            else:
-                return current_date
-            
-            return new_date
         
-        # Callbacks para navegación de hora (anterior/siguiente)
-        @app.callback(
+        app.clientside_callback(
+            ClientsideFunction(namespace="ui", function_name="navigateHour"),
             Output("hour-picker-historicos", "value"),
             Input("hour-picker-historicos-prev", "n_clicks"),
             Input("hour-picker-historicos-next", "n_clicks"),
             State("hour-picker-historicos", "value"),
             prevent_initial_call=True
         )
-        def navigate_hour(prev_clicks, next_clicks, current_hour):
-            """Navega a la hora anterior o siguiente"""
-            from dash import callback_context
-            
-            if current_hour is None:
-                current_hour = 9
-            
-            # Determinar qué botón se presionó
-            ctx = callback_context
-            if not ctx.triggered:
-                return current_hour
-            
-            button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-            
-            if button_id == 'hour-picker-historicos-prev':
-                # Hora anterior (circular: 23 -> 22 -> ... -> 0 -> 23)
-                new_hour = (current_hour - 1) % 24
-            elif button_id == 'hour-picker-historicos-next':
-                # Hora siguiente (circular: 0 -> 1 -> ... -> 23 -> 0)
-                new_hour = (current_hour + 1) % 24
-            else:
-                return current_hour
-            
-            return new_hour
-
+        
         @app.callback(
             Output("download-csv-historicos", "data"),
             Input("btn-download-csv-historicos", "n_clicks"),
@@ -515,9 +610,8 @@ class HistoricosCallbacks:
             if not n_clicks:
                 return None
 
-            from datetime import timedelta
             if date is None:
-                date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+                date = default_forecast_date()
             if hour is None:
                 hour = 9
             if pollutant is None:
@@ -535,6 +629,46 @@ class HistoricosCallbacks:
             return dcc.send_data_frame(df.to_csv, filename, index=False)
 
 
+def _db_summary() -> html.P:
+    """Resumen del máximo pronosticado calculado desde la BD (página de debug)"""
+    try:
+        # Obtener la fecha actual del pronóstico
+        fecha_str = _current_fecha_str()
+        
+        if not fecha_str:
+            return _NO_DATA_RESPONSE
+        
+        fecha_base = _parse_forecast_ts(fecha_str)
+        
+        # Máximo entre todas las estaciones y todas las horas
+        forecast_max = _forecast_max(fecha_str)
+        
+        if forecast_max:
+            max_value = forecast_max['value']
+            max_station = forecast_max['station']
+            max_hour_number = forecast_max['hour']
+            
+            # Calcular la hora real (fecha_base + max_hour_number - 1 hora de corrección)
+            max_hour_datetime = fecha_base + timedelta(hours=max_hour_number - 1)
+            max_hour_str = max_hour_datetime.strftime('%H:%M')
+            
+            # Obtener nombre de la estación
+            station_name = _station_name(max_station)
+            
+            summary_text = f"Máxima concentración pronosticada: {max_value:.1f} ppb en {station_name}, a las {max_hour_str} hrs."
+            
+            logger.debug("✅ [DEBUG] Resumen calculado: %.1f ppb en %s a las %s", max_value, max_station, max_hour_str)
+            
+            return html.P(summary_text, style=_STYLE_OK)
+        else:
+            return _NO_DATA_RESPONSE
+        
+    except Exception as e:
+        logger.exception("⚠️ [DEBUG] Error calculando resumen: %s", e)
+        
+        return _SUMMARY_ERROR_RESPONSE
+
+
 class DebugResumenCallbacks:
     """Callbacks específicos para la página de debug resumen"""
     
@@ -542,284 +676,57 @@ class DebugResumenCallbacks:
     def register_debug_resumen_callbacks(app):
         """Registra todos los callbacks de la página de debug resumen"""
         
+        # Un solo callback para la página: al cargarla se calculan ambos resúmenes y
+        # el sondeo de la API solo vuelve a leer el snapshot (la BD no se consulta)
         @app.callback(
-            Output("ozone-max-summary-content-debug", "children"),
-            Input("debug-resumen-location", "pathname")
+            [Output("ozone-max-summary-content-debug", "children"),
+             Output("ozone-max-summary-api-debug", "children"),
+             Output("api-poll", "disabled")],
+            [Input("debug-resumen-location", "pathname"),
+             Input("api-poll", "n_intervals")]
         )
-        def update_debug_summary(pathname):
-            """Actualiza el resumen del pronóstico para la página de debug"""
-            try:
-                from datetime import datetime, timedelta
-                
-                # Obtener la fecha actual del pronóstico
-                if DEFAULT_DATE_CONFIG['use_specific_date']:
-                    fecha_str = DEFAULT_DATE_CONFIG['specific_date']
-                else:
-                    from postgres_data_service import get_last_available_date
-                    latest_date = get_last_available_date()
-                    if latest_date:
-                        fecha_str = latest_date.strftime('%Y-%m-%d %H:%M:%S')
-                    else:
-                        fecha_str = None
-                
-                if not fecha_str:
-                    return html.P(
-                        "No hay datos de pronóstico disponibles",
-                        style={
-                            'font-size': '18px',
-                            'font-family': 'Helvetica',
-                            'color': '#666',
-                            'margin': '0',
-                            'text-align': 'center'
-                        }
-                    )
-                
-                # Obtener los pronósticos batch
-                all_forecasts_batch = data_service.get_all_stations_forecast_batch(fecha_str)
-                
-                if not all_forecasts_batch:
-                    return html.P(
-                        "No hay datos de pronóstico disponibles",
-                        style={
-                            'font-size': '18px',
-                            'font-family': 'Helvetica',
-                            'color': '#666',
-                            'margin': '0',
-                            'text-align': 'center'
-                        }
-                    )
-                
-                # Calcular el máximo entre todas las estaciones y todas las horas
-                max_value = None
-                max_station = None
-                max_hour_number = None
-                fecha_base = datetime.strptime(fecha_str, '%Y-%m-%d %H:%M:%S')
-                
-                for station_code, forecast_data in all_forecasts_batch.items():
-                    if 'forecast_vector' in forecast_data:
-                        forecast_vector = forecast_data['forecast_vector']
-                        for hour_idx, value in enumerate(forecast_vector, start=1):
-                            if max_value is None or value > max_value:
-                                max_value = value
-                                max_station = station_code
-                                max_hour_number = hour_idx
-                
-                if max_value is not None and max_station is not None:
-                    # Calcular la hora real (fecha_base + max_hour_number - 1 hora de corrección)
-                    max_hour_datetime = fecha_base + timedelta(hours=max_hour_number) - timedelta(hours=1)
-                    max_hour_str = max_hour_datetime.strftime('%H:%M')
-                    
-                    # Obtener nombre de la estación
-                    stations_dict = data_service.get_all_stations()
-                    station_info = stations_dict.get(max_station, {})
-                    station_name = station_info.get('name', max_station)
-                    
-                    summary_text = f"Máxima concentración pronosticada: {max_value:.1f} ppb en {station_name}, a las {max_hour_str} hrs."
-                    
-                    print(f"✅ [DEBUG] Resumen calculado: {max_value:.1f} ppb en {max_station} a las {max_hour_str}")
-                    
-                    return html.P(
-                        summary_text,
-                        style={
-                            'font-size': '18px',
-                            'font-family': 'Helvetica',
-                            'color': '#1a1a1a',
-                            'margin': '0',
-                            'text-align': 'center',
-                            'font-weight': '500'
-                        }
-                    )
-                else:
-                    return html.P(
-                        "No hay datos de pronóstico disponibles",
-                        style={
-                            'font-size': '18px',
-                            'font-family': 'Helvetica',
-                            'color': '#666',
-                            'margin': '0',
-                            'text-align': 'center'
-                        }
-                    )
-                
-            except Exception as e:
-                print(f"⚠️ [DEBUG] Error calculando resumen: {e}")
-                import traceback
-                traceback.print_exc()
-                
-                return html.P(
-                    "Error al cargar el resumen del pronóstico",
-                    style={
-                        'font-size': '18px',
-                        'font-family': 'Helvetica',
-                        'color': '#d32f2f',
-                        'margin': '0',
-                        'text-align': 'center'
-                    }
-                )
+        def update_debug_summaries(pathname, n_intervals):
+            """
+            Resumen desde BD y resumen de la API para la página de debug.
+            El de la API sale del snapshot del hilo de refresco: nunca espera a la
+            red, mientras no hay datos devuelve un aviso de carga y el sondeo se
+            desactiva en cuanto llega el resumen.
+            """
+            polling = ctx.triggered_id == "api-poll"
+            db_summary = no_update if polling else _db_summary()
+            
+            summary = _LATEST_API_SUMMARY['summary']
+            if summary is not None:
+                return db_summary, _summary_p(summary), True
+            
+            error = _LATEST_API_SUMMARY['error']
+            if error is not None:
+                return db_summary, _summary_p(error), False
+            
+            return db_summary, no_update if polling else _API_LOADING_RESPONSE, False
+
+
+
+class SelectorCallbacks:
+    """Callbacks compartidos de los selectores"""
+    
+    @staticmethod
+    def register_selector_callbacks(app):
+        """Registra la búsqueda de estaciones en el servidor cuando la lista es grande"""
+        # Con pocas estaciones las opciones van completas en el layout y no hace falta
+        if not station_options_lazy():
+            return
         
-        @app.callback(
-            Output("ozone-max-summary-api-debug", "children"),
-            Input("debug-resumen-location", "pathname")
-        )
-        def update_debug_summary_api(pathname):
-            """Actualiza el resumen del pronóstico desde la API externa"""
-            try:
-                import requests
-                from datetime import datetime
-                
-                # Para la API, usar la fecha actual (hoy) en lugar de la fecha del último pronóstico en BD
-                # Esto asegura que siempre consultemos el pronóstico más reciente disponible en la API
-                fecha_date = datetime.now()
-                
-                # Formatear fecha para la API (YYYY-MM-DD)
-                fecha_api = fecha_date.strftime('%Y-%m-%d')
-                
-                # Construir URL de la API
-                api_url = f"http://132.248.8.98:58888/ai_vi_transformer01/ozono/CDMX/{fecha_api}"
-                
-                print(f"🔍 [DEBUG API] Consultando: {api_url}")
-                
-                # Hacer petición a la API
-                response = requests.get(api_url, timeout=10)
-                response.raise_for_status()
-                
-                # Parsear JSON
-                data = response.json()
-                
-                # Verificar que hay datos
-                if not data or 'pronos' not in data or not data['pronos']:
-                    return html.P(
-                        "No hay datos de pronóstico disponibles en la API",
-                        style={
-                            'font-size': '18px',
-                            'font-family': 'Helvetica',
-                            'color': '#666',
-                            'margin': '0',
-                            'text-align': 'center'
-                        }
-                    )
-                
-                # Obtener fecha y hora del pronóstico desde la respuesta de la API
-                fecha_pron_str = data.get('fecha_pron', fecha_api)
-                
-                # Intentar parsear la fecha con hora, si no tiene hora usar 7 AM por defecto
-                try:
-                    # Intentar parsear con hora
-                    if 'T' in fecha_pron_str or ' ' in fecha_pron_str:
-                        # Formato con hora (ISO o con espacio)
-                        if 'T' in fecha_pron_str:
-                            fecha_pron_dt = datetime.fromisoformat(fecha_pron_str.replace('Z', '+00:00'))
-                        else:
-                            fecha_pron_dt = datetime.strptime(fecha_pron_str, '%Y-%m-%d %H:%M:%S')
-                    else:
-                        # Solo fecha, agregar 7 AM
-                        fecha_pron_dt = datetime.strptime(fecha_pron_str, '%Y-%m-%d')
-                        fecha_pron_dt = fecha_pron_dt.replace(hour=7, minute=0, second=0)
-                except:
-                    # Si falla el parsing, usar la fecha de la consulta con 7 AM
-                    try:
-                        fecha_pron_dt = datetime.strptime(fecha_pron_str, '%Y-%m-%d')
-                        fecha_pron_dt = fecha_pron_dt.replace(hour=7, minute=0, second=0)
-                    except:
-                        fecha_pron_dt = fecha_date.replace(hour=7, minute=0, second=0)
-                
-                # Formatear fecha y hora para mostrar
-                hora_formateada = fecha_pron_dt.strftime('%H:%M')
-                
-                # Formatear fecha en español manualmente
-                meses_esp = {
-                    1: 'Enero', 2: 'Febrero', 3: 'Marzo', 4: 'Abril',
-                    5: 'Mayo', 6: 'Junio', 7: 'Julio', 8: 'Agosto',
-                    9: 'Septiembre', 10: 'Octubre', 11: 'Noviembre', 12: 'Diciembre'
-                }
-                dia = fecha_pron_dt.day
-                mes = meses_esp[fecha_pron_dt.month]
-                año = fecha_pron_dt.year
-                fecha_formateada = f"{dia} de {mes} de {año}"
-                
-                # Encontrar el máximo valor en el array pronos
-                max_pron = None
-                max_value = None
-                
-                for pron in data['pronos']:
-                    valor = pron.get('valor')
-                    if valor is not None:
-                        if max_value is None or valor > max_value:
-                            max_value = valor
-                            max_pron = pron
-                
-                if max_pron and max_value is not None:
-                    # Obtener información del máximo
-                    id_est = max_pron.get('id_est', 'N/A')
-                    hora = max_pron.get('hora', 'N/A')
-                    dia = max_pron.get('dia', fecha_api)
-                    
-                    # Obtener nombre de la estación si está disponible
-                    try:
-                        stations_dict = data_service.get_all_stations()
-                        station_info = stations_dict.get(id_est, {})
-                        station_name = station_info.get('name', id_est)
-                    except:
-                        station_name = id_est
-                    
-                    summary_text = f"Máxima concentración pronosticada: {max_value:.1f} ppb en {station_name}, a las {hora} hrs. (Pronóstico del {fecha_formateada} a las {hora_formateada} hrs.)"
-                    
-                    print(f"✅ [DEBUG API] Resumen calculado: {max_value:.1f} ppb en {id_est} a las {hora} (Pronóstico: {fecha_formateada} {hora_formateada})")
-                    
-                    return html.P([
-                        f"Máxima concentración pronosticada: {max_value:.1f} ppb en {station_name}, a las {hora} hrs.",
-                        html.Br(),
-                        html.Span(
-                            f"(Pronóstico del {fecha_formateada} a las {hora_formateada} hrs.)",
-                            style={'font-style': 'italic'}
-                        )
-                    ], style={
-                        'font-size': '18px',
-                        'font-family': 'Helvetica',
-                        'color': '#1a1a1a',
-                        'margin': '0',
-                        'text-align': 'center',
-                        'font-weight': '500'
-                    })
-                else:
-                    return html.P(
-                        "No se encontró valor máximo en los datos de la API",
-                        style={
-                            'font-size': '18px',
-                            'font-family': 'Helvetica',
-                            'color': '#666',
-                            'margin': '0',
-                            'text-align': 'center'
-                        }
-                    )
-                
-            except requests.exceptions.RequestException as e:
-                print(f"⚠️ [DEBUG API] Error de conexión: {e}")
-                return html.P(
-                    f"Error al conectar con la API: {str(e)}",
-                    style={
-                        'font-size': '18px',
-                        'font-family': 'Helvetica',
-                        'color': '#d32f2f',
-                        'margin': '0',
-                        'text-align': 'center'
-                    }
-                )
-            except Exception as e:
-                print(f"⚠️ [DEBUG API] Error calculando resumen: {e}")
-                import traceback
-                traceback.print_exc()
-                
-                return html.P(
-                    f"Error al procesar datos de la API: {str(e)}",
-                    style={
-                        'font-size': '18px',
-                        'font-family': 'Helvetica',
-                        'color': '#d32f2f',
-                        'margin': '0',
-                        'text-align': 'center'
-                    }
-                )
+        for dropdown_id in STATION_DROPDOWN_IDS:
+            @app.callback(
+                Output(dropdown_id, "options"),
+                Input(dropdown_id, "search_value"),
+                State(dropdown_id, "value")
+            )
+            def update_station_options(search_value, selected):
+                if not search_value:
+                    raise PreventUpdate
+                return search_station_options(search_value, selected)
 
 
 class CallbackManager:
@@ -831,15 +738,27 @@ class CallbackManager:
         self.otros_callbacks = OtrosContaminantesCallbacks()
         self.historicos_callbacks = HistoricosCallbacks()
         self.debug_resumen_callbacks = DebugResumenCallbacks()
+        self.selector_callbacks = SelectorCallbacks()
     
     def register_all_callbacks(self):
-        """Registra todos los callbacks de la aplicación"""
-        self.home_callbacks.register_home_callbacks(self.app)
-        self.otros_callbacks.register_otros_contaminantes_callbacks(self.app)
-        self.historicos_callbacks.register_historicos_callbacks(self.app)
-        self.debug_resumen_callbacks.register_debug_resumen_callbacks(self.app)
+        """Registra todos los callbacks de la aplicación en una sola pasada"""
+        registrars = (
+            self.home_callbacks.register_home_callbacks,
+            self.otros_callbacks.register_otros_contaminantes_callbacks,
+            self.historicos_callbacks.register_historicos_callbacks,
+            self.debug_resumen_callbacks.register_debug_resumen_callbacks,
+            self.selector_callbacks.register_selector_callbacks,
+        )
+        for register in registrars:
+            register(self.app)
+        
+        # El resumen de la API (inicio y debug) se refresca fuera de los callbacks
+        _start_api_refresher()
         
-        print("✅ Todos los callbacks registrados correctamente")
+        logger.info("✅ Todos los callbacks registrados correctamente (%d)", len(self.app.callback_map))
+        if logger.isEnabledFor(logging.DEBUG):
+            for callback_id in self.app.callback_map:
+                logger.debug("   • %s", callback_id)
 
 
 # Función de conveniencia para inicializar callbacks
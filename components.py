@@ -5,232 +5,361 @@ Incluye navbar, tarjetas, selectores y otros elementos de interfaz.
 
 from dash import html, dcc
 import dash_bootstrap_components as dbc
-from typing import List, Dict, Any, Optional
+import functools
+import os
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Sequence
 
 from config import RESPONSIVE_CONFIG, POLLUTANT_CONFIG, STYLES, COLORS
 from data_service import data_service
 
 
+# Opciones de los selectores: configuración estática, se construyen una sola vez
+# y se reutiliza la misma lista en cada render (misma referencia entre renders y
+# callbacks). No modificarlas en sitio salvo con refresh_station_cache().
+_STATIONS_SNAPSHOT = data_service.get_all_stations()
+STATION_OPTIONS = [{'label': station_info['name'], 'value': code}
+                   for code, station_info in _STATIONS_SNAPSHOT.items()]
+POLLUTANT_OPTIONS = [{'label': config.name, 'value': key}
+                     for key, config in POLLUTANT_CONFIG.items()]
+# Variable hardcodeada para controlar filtro de contaminantes
+SOLO_CONTAMINANTES_INTERES = True  # Cambiar a False para mostrar todos
+# Solo contaminantes de interés (O3, PM2.5 y PM10); con el filtro apagado son todos
+MAIN_POLLUTANT_OPTIONS = ([option for option in POLLUTANT_OPTIONS
+                           if option['value'] in ('O3', 'PM2.5', 'PM10')]
+                          if SOLO_CONTAMINANTES_INTERES else POLLUTANT_OPTIONS)
+# Opciones para todas las horas del día
+HOUR_OPTIONS = [{'label': f'{h:02d}:00 hrs', 'value': h} for h in range(0, 24)]
+
+
+def default_forecast_date() -> str:
+    """Fecha por defecto de los pronósticos históricos: hace 7 días ('YYYY-MM-DD')"""
+    return (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+
+
+# Con más estaciones que esto, los selectores solo llevan la opción inicial y el
+# resto se busca en el servidor con `search_value` (ver callbacks.SelectorCallbacks)
+STATION_OPTIONS_INLINE_MAX = 200
+STATION_SEARCH_LIMIT = 100
+STATION_DROPDOWN_IDS = ('station-dropdown-home', 'station-dropdown-otros', 'station-dropdown-historicos')
+
+
+def station_options_lazy() -> bool:
+    """True si las opciones de estación se cargan bajo demanda"""
+    return len(STATION_OPTIONS) > STATION_OPTIONS_INLINE_MAX
+
+
+def station_options_seed(default_value: str) -> List[Dict[str, str]]:
+    """Opciones iniciales del selector de estación: todas, o solo la seleccionada si son muchas"""
+    if not station_options_lazy():
+        return STATION_OPTIONS
+    return [option for option in STATION_OPTIONS if option['value'] == default_value]
+
+
+def search_station_options(search_value: str, selected: Optional[str] = None) -> List[Dict[str, str]]:
+    """Estaciones cuyo nombre o clave contiene `search_value` (máx. STATION_SEARCH_LIMIT)"""
+    needle = search_value.lower()
+    hits = [option for option in STATION_OPTIONS
+            if needle in option['label'].lower() or needle in option['value'].lower()]
+    if len(hits) == len(STATION_OPTIONS):
+        # Todas coinciden: devolver la lista compartida, no una copia
+        return STATION_OPTIONS
+    hits = hits[:STATION_SEARCH_LIMIT]
+    # Conservar la opción seleccionada para que el Dropdown siga mostrando su etiqueta
+    if selected and all(option['value'] != selected for option in hits):
+        hits.extend(option for option in STATION_OPTIONS if option['value'] == selected)
+    return hits
+
+# Logos con huella de versión (?m=<mtime>): el servidor los puede servir con caché
+# de larga duración y un logo actualizado cambia de URL
+_ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+
+
+def asset_url(filename: str) -> str:
+    """URL de un archivo de assets/ con la fecha de modificación como huella"""
+    try:
+        return f"/assets/{filename}?m={int(os.path.getmtime(os.path.join(_ASSETS_DIR, filename)))}"
+    except OSError:
+        return f"/assets/{filename}"
+
+
+LOGO_ICAYCC_URL = asset_url('logo-mobile-icaycc.png')
+LOGO_CAME_URL = asset_url('came_logo.png')
+LOGO_URLS = (LOGO_ICAYCC_URL, LOGO_CAME_URL)
+# Tamaño intrínseco (ancho, alto) de cada logo: con width/height en el <img> el
+# navegador reserva la proporción antes de descargarlo y el encabezado no salta
+_LOGO_SIZES = {LOGO_ICAYCC_URL: (415, 101), LOGO_CAME_URL: (695, 344)}
+
+# Alto fijo de cada opción: el menú del Dropdown está virtualizado y solo
+# monta en el DOM las opciones visibles dentro de `maxHeight`
+DROPDOWN_OPTION_HEIGHT = 35
+DROPDOWN_MAX_HEIGHT = 250
+# La selección se guarda en el navegador y se restaura al volver a la página
+DROPDOWN_PERSISTENCE = {'persistence': True, 'persistence_type': 'local', 'persisted_props': ['value']}
+
+
+# =====================================
+# ESTILOS COMPARTIDOS
+# =====================================
+# Se construyen una sola vez al importar el módulo; los componentes solo guardan
+# la referencia. No modificarlos en sitio: se comparten entre renders.
+# Los componentes estáticos (navbar, logos, selectores) también se memorizan
+# con lru_cache y el mismo árbol se reutiliza en cada navegación.
+
+# Navbar
+_NAV_LINKS = (
+    ("Página Principal", "/"),
+    ("Otros Contaminantes", "/otros-contaminantes"),
+    ("Históricos", "/historicos"),
+    ("Acerca del Pronóstico", "/acerca"),
+)
+_NAV_LINK_STYLE = {'color': 'white', 'font-weight': 'bold', 'background': 'transparent'}
+_NAVBAR_STYLE = {
+    'background-color': 'transparent !important',
+    'background': 'none !important',
+    'margin-bottom': '0',
+    'padding': '10px 20px',
+    'border': 'none'
+}
+_NAVBAR_BRAND_STYLE = {
+    'font-family': 'Helvetica',
+    'color': 'white',
+    'font-size': '24px',
+    'font-weight': 'bold',
+    'text-shadow': '2px 2px 4px rgba(0,0,0,0.3)',
+    'background': 'transparent'
+}
+
+# Encabezados y logos
+_LOGO_IMG_STYLE = {
+    'width': 'auto',
+    'height': '100px',
+    'display': 'inline-block',
+    'margin': '10px'
+}
+_LOGO_HEADER_STYLE = {
+    'text-align': 'left',
+    'margin-top': '20px',
+    'background-color': COLORS['card'],
+    'padding': '15px',
+    'border-radius': '15px',
+    'box-shadow': '0 4px 6px rgba(0,0,0,0.1)',
+    'overflow': 'visible'
+}
+# Logos alineados en fila; el gap sustituye al margin-left de los antiguos contenedores
+_LOGO_HEADER_ROW_STYLE = {**_LOGO_HEADER_STYLE, 'display': 'flex', 'align-items': 'center', 'gap': '20px'}
+_TITLE_WRAPPER_STYLE = {'margin': '20px'}
+
+# Selectores
+_SELECTOR_CARD_STYLE = {
+    'width': '100%',
+    'margin': '20px',
+    'padding': '25px',
+    'background-color': COLORS['card'],
+    'border-radius': '15px',
+    'box-shadow': '0 4px 6px rgba(0,0,0,0.1)'
+}
+_DATE_PICKER_STYLE = {
+    'flex': '1',
+    'padding': '10px',
+    'border-radius': '5px',
+    'border': '1px solid #ccc'
+}
+_HOUR_DROPDOWN_STYLE = {**STYLES['dropdown'], 'flex': '1'}
+_PREV_BUTTON_STYLE = {
+    'margin-left': '10px',
+    'min-width': '40px',
+    'font-size': '18px',
+    'font-weight': 'bold'
+}
+_NEXT_BUTTON_STYLE = {**_PREV_BUTTON_STYLE, 'margin-left': '5px'}
+_PICKER_ROW_STYLE = {
+    'display': 'flex',
+    'align-items': 'center',
+    'gap': '10px'
+}
+
+# Tarjetas y alertas
+_SMALL_CARD_STYLE = {
+    'margin': '10px',
+    'padding': '15px',
+    'border-radius': '10px',
+    'box-shadow': '0 4px 8px rgba(0,0,0,0.1)',
+    'background-color': COLORS['card']
+}
+_ALERT_STYLE = {
+    'border-radius': '10px',
+    'box-shadow': '0 2px 4px rgba(0,0,0,0.1)'
+}
+
+# Filas de LayoutContainers: un solo Div con CSS grid (assets/components.css), dos
+# columnas en pantallas medianas y una en móviles, sin envolturas dbc.Row/col
+_GRID_ROW_CLASS = "layout-grid mb-4"
+
+# Gráficos e indicadores
+_GRAPH_CONFIG = {'displayModeBar': False}
+
+# Carga diferida de diales: la figura viaja en un Store y se dibuja hasta que la
+# fila entra en pantalla (assets/lazy_graphs.js marca el Store de visibilidad)
+INDICATORS_VISIBLE_ID = 'indicators-visible'
+DIALS_GRAPH_ID = 'dials'
+DIALS_FIGURE_ID = 'dials-figure'
+# Los diales son de solo lectura: staticPlot omite toda la interacción de Plotly
+_DIALS_CONFIG = {**_GRAPH_CONFIG, 'staticPlot': True}
+_EMPTY_DIAL_FIGURE = {
+    'data': [],
+    'layout': {
+        'xaxis': {'visible': False},
+        'yaxis': {'visible': False},
+        'height': 460,  # Dos filas de diales
+        'paper_bgcolor': 'rgba(0,0,0,0)',
+        'plot_bgcolor': 'rgba(0,0,0,0)'
+    }
+}
+
+# Resumen del máximo de ozono
+_SUMMARY_TEXT_STYLE = {
+    'font-size': '18px',
+    'font-family': 'Helvetica',
+    'color': COLORS['text'],
+    'margin': '0',
+    'text-align': 'center'
+}
+_SUMMARY_CONTENT_STYLE = {
+    'padding': '15px',
+    'text-align': 'center'
+}
+_SUMMARY_FRESHNESS_STYLE = {
+    'display': 'block',
+    'font-size': '12px',
+    'font-family': 'Helvetica',
+    'color': '#888',
+    'text-align': 'right'
+}
+_SUMMARY_CARD_STYLE = {
+    'background-color': COLORS['card'],
+    'border': f'2px solid {COLORS.get("border", "#e0e0e0")}',
+    'border-radius': '8px',
+    'box-shadow': '0 2px 8px rgba(0,0,0,0.1)',
+    'margin': '20px 0'
+}
+
+
+def refresh_station_cache() -> None:
+    """
+    Vuelve a leer las estaciones del servicio de datos (p. ej. tras cambiar el catálogo).
+    STATION_OPTIONS se actualiza en sitio para que los módulos que lo importaron vean
+    la lista nueva, y se descartan los selectores de estación memorizados.
+    """
+    global _STATIONS_SNAPSHOT
+    _STATIONS_SNAPSHOT = data_service.get_all_stations()
+    STATION_OPTIONS[:] = [{'label': station_info['name'], 'value': code}
+                          for code, station_info in _STATIONS_SNAPSHOT.items()]
+    SelectorComponents.create_station_dropdown.cache_clear()
+
+
+def _logo(src: str) -> html.Img:
+    """Logo institucional con el estilo compartido de los encabezados"""
+    size = _LOGO_SIZES.get(src)
+    if size is None:
+        return html.Img(src=src, style=_LOGO_IMG_STYLE)
+    return html.Img(src=src, width=size[0], height=size[1], style=_LOGO_IMG_STYLE)
+
+
 class NavigationComponents:
     """Componentes de navegación"""
     
+    __slots__ = ()  # Solo métodos estáticos: las instancias globales no necesitan __dict__
+    
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def create_navbar() -> html.Div:
         """Crea barra de navegación fusionada con título completo y fondo verde profesional"""
         return html.Div([
             # Navbar superior con menú - completamente transparente
             dbc.NavbarSimple(
                 children=[
-                    dbc.NavItem(dbc.NavLink("Página Principal", href="/", active="exact", 
-                                          style={'color': 'white', 'font-weight': 'bold', 'background': 'transparent'})),
-                    dbc.NavItem(dbc.NavLink("Otros Contaminantes", href="/otros-contaminantes", active="exact",
-                                          style={'color': 'white', 'font-weight': 'bold', 'background': 'transparent'})),
-                    dbc.NavItem(dbc.NavLink("Históricos", href="/historicos", active="exact",
-                                          style={'color': 'white', 'font-weight': 'bold', 'background': 'transparent'})),
-                    dbc.NavItem(dbc.NavLink("Acerca del Pronóstico", href="/acerca", active="exact",
-                                          style={'color': 'white', 'font-weight': 'bold', 'background': 'transparent'})),
+                    dbc.NavItem(dbc.NavLink(label, href=href, active="exact", style=_NAV_LINK_STYLE))
+                    for label, href in _NAV_LINKS
                 ],
                 brand="Pronóstico de Calidad del Aire Basado en Redes Neuronales:",
                 brand_href="/",
                 dark=True,
                 color="",  # Sin color para evitar fondo por defecto
-                style={
-                    'background-color': 'transparent !important',
-                    'background': 'none !important',
-                    'margin-bottom': '0',
-                    'padding': '10px 20px',
-                    'border': 'none'
-                },
-                brand_style={
-                    'font-family': 'Helvetica',
-                    'color': 'white',
-                    'font-size': '24px',
-                    'font-weight': 'bold',
-                    'text-shadow': '2px 2px 4px rgba(0,0,0,0.3)',
-                    'background': 'transparent'
-                }
+                style=_NAVBAR_STYLE,
+                brand_style=_NAVBAR_BRAND_STYLE
             ),
             
             # Título completo en nueva línea
             html.Div([
-                html.H1("Concentraciones de Ozono, PM10 y PM2.5", 
-                        style={
-                            'font-family': 'Helvetica',
-                            'color': 'white',
-                            'font-size': '20px',
-                            'font-weight': 'bold',
-                            'text-shadow': '2px 2px 4px rgba(0,0,0,0.3)',
-                            'margin': '0',
-                            'padding': '0 20px 15px 20px',
-                            'text-align': 'center'  # Centrar el texto
-                        })
+                html.H1("Concentraciones de Ozono, PM10 y PM2.5", className="app-navbar-title")
             ])
-        ], style={
-            'background-color': COLORS["header"],  # Verde sólido en lugar de gradiente
-            'box-shadow': '0 4px 6px rgba(0,0,0,0.1)',
-            'border-radius': '15px',
-            'margin': '20px',
-            'min-height': '80px',  # Asegurar altura mínima para que se vea el fondo
-            'padding': '15px'  # Agregar padding para mejor espaciado
-        })
+        ], className="app-navbar")
 
 
 class HeaderComponents:
     """Componentes de encabezado"""
     
-    @staticmethod
-    def create_logo_header() -> html.Div:
-        """Crea header con logo (estilo vdev8)"""
-        return html.Div([
-            # Logo principal (izquierda)
-            html.Img(
-                src='/assets/logo-mobile-icaycc.png',
-                style={
-                    'width': 'auto', 
-                    'height': '100px',
-                    'display': 'inline-block', 
-                    'margin': '10px'
-                }
-            ),
-            
-            # Logo institución 2 (centro-derecha)
-            html.Img(
-                src='/assets/came_logo.png',
-                style={
-                    'width': 'auto', 
-                    'height': '100px',
-                    'display': 'inline-block', 
-                    'margin': '10px',
-                    'float': 'right'
-                }
-            ),
-            
-            # Logo institución 3 (derecha) - COMENTADO TEMPORALMENTE
-            # html.Img(
-            #     src='/assets/logo-mobile-icaycc.png',
-            #     style={
-            #         'width': '200px', 
-            #         'height': 'auto',
-            #         'display': 'inline-block', 
-            #         'margin': '10px',
-            #         'float': 'right'
-            #     }
-            # )
-        ], style={
-            'text-align': 'left', 
-            'margin-top': '20px', 
-            'background-color': COLORS['card'], 
-            'padding': '15px', 
-            'border-radius': '15px',
-            'box-shadow': '0 4px 6px rgba(0,0,0,0.1)',
-            'overflow': 'hidden'  # Para contener los floats
-        })
+    __slots__ = ()
     
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def create_page_title(title: str) -> html.Div:
         """Crea título de página con estilo profesional (vdev8)"""
         return html.Div([
             html.H1(title, style=STYLES['header'])
-        ], style={'margin': '20px'})
+        ], style=_TITLE_WRAPPER_STYLE)
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def create_logo_header() -> html.Div:
         """Crea header solo con logos (sin selector de estación)"""
         return html.Div([
             # Logo principal a la izquierda
-            html.Div([
-                html.Img(
-                    src='/assets/logo-mobile-icaycc.png',
-                    style={
-                        'width': 'auto', 
-                        'height': '100px',
-                        'display': 'inline-block', 
-                        'margin': '10px'
-                    }
-                ),
-            ], style={'display': 'inline-block', 'vertical-align': 'middle'}),
+            _logo(LOGO_ICAYCC_URL),
             
             # Logo institución 2 (centro)
-            html.Div([
-                html.Img(
-                    src='/assets/came_logo.png',  #logo-institucion2.png
-                    style={
-                        'width': 'auto', 
-                        'height': '100px',
-                        'display': 'inline-block', 
-                        'margin': '10px'
-                    }
-                ),
-            ], style={'display': 'inline-block', 'vertical-align': 'middle', 'margin-left': '20px'}),
+            _logo(LOGO_CAME_URL),  #logo-institucion2.png
             
             # Logo institución 3 (derecha) - COMENTADO TEMPORALMENTE
-            # html.Div([
-            #     html.Img(
-            #         src='/assets/logo-mobile-icaycc.png',  # Usando logo por defecto
-            #         style={
-            #             'width': 'auto', 
-            #             'height': '100px',
-            #             'display': 'inline-block', 
-            #             'margin': '10px'
-            #         }
-            #     ),
-            # ], style={'display': 'inline-block', 'vertical-align': 'middle', 'margin-left': '20px'}),
-        ], style={
-            'text-align': 'left', 
-            'margin-top': '20px', 
-            'background-color': COLORS['card'], 
-            'padding': '15px', 
-            'border-radius': '15px',
-            'box-shadow': '0 4px 6px rgba(0,0,0,0.1)',
-            'overflow': 'visible'
-        })
+            # _logo(asset_url('logo-mobile-icaycc.png')),  # Usando logo por defecto
+        ], style=_LOGO_HEADER_ROW_STYLE)
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def create_fused_title_header() -> html.Div:
         """Crea header fusionado con cintillo y título completo"""
         return html.Div([
             html.H1("Pronóstico de Calidad del Aire Basado en Redes Neuronales: Concentraciones de Ozono, PM10 y PM2.5", 
-                    style={
-                        'font-family': 'Helvetica',
-                        'color': 'white',
-                        'padding': '20px',
-                        'font-size': '28px',
-                        'font-weight': 'bold',
-                        'text-shadow': '2px 2px 4px rgba(0,0,0,0.3)',
-                        'background': f'linear-gradient(135deg, {COLORS["gradient_start"]}, {COLORS["gradient_end"]})',
-                        'border-radius': '15px',
-                        'box-shadow': '0 4px 6px rgba(0,0,0,0.1)',
-                        'margin': '0',
-                        'text-align': 'center'
-                    })
-        ], style={'margin': '20px'})
+                    className="app-fused-header")
+        ], style=_TITLE_WRAPPER_STYLE)
 
 
 class SelectorComponents:
     """Componentes de selectores"""
     
+    __slots__ = ()
+    
     @staticmethod
+    @functools.lru_cache(maxsize=16)
     def create_station_dropdown(dropdown_id: str = 'station-dropdown', default_value: str = 'PED') -> html.Div:
         """Crea selector de estación con estilo profesional (vdev8)"""
         return html.Div([
             html.Label('Seleccionar estación:', style=STYLES['label']),
             dcc.Dropdown(
                 id=dropdown_id,
-                options=[{'label': station_info['name'], 'value': code}
-                        for code, station_info in data_service.get_all_stations().items()],
+                options=station_options_seed(default_value),
                 value=default_value,
+                searchable=True,
+                optionHeight=DROPDOWN_OPTION_HEIGHT,
+                maxHeight=DROPDOWN_MAX_HEIGHT,
+                **DROPDOWN_PERSISTENCE,
                 style=STYLES['dropdown']
             )
-        ], style={
-            'width': '100%', 
-            'margin': '20px', 
-            'padding': '25px', 
-            'background-color': COLORS['card'], 
-            'border-radius': '15px',
-            'box-shadow': '0 4px 6px rgba(0,0,0,0.1)'
-        })
+        ], style=_SELECTOR_CARD_STYLE)
     
     @staticmethod
+    @functools.lru_cache(maxsize=16)
     def create_pollutant_dropdown(dropdown_id: str = 'pollutant-dropdown', default_value: str = 'O3', 
                                   only_main_pollutants: bool = False) -> html.Div:
         """Crea selector de contaminante con estilo profesional
@@ -240,20 +369,8 @@ class SelectorComponents:
             default_value: Valor por defecto
             only_main_pollutants: Si True, solo muestra O3, PM2.5 y PM10
         """
-        # Variable hardcodeada para controlar filtro de contaminantes
-        SOLO_CONTAMINANTES_INTERES = True  # Cambiar a False para mostrar todos
-        
-        # Filtrar contaminantes si está activado
-        if only_main_pollutants and SOLO_CONTAMINANTES_INTERES:
-            # Solo mostrar contaminantes de interés
-            contaminantes_permitidos = ['O3', 'PM2.5', 'PM10']
-            opciones = [{'label': config['name'], 'value': key}
-                       for key, config in POLLUTANT_CONFIG.items()
-                       if key in contaminantes_permitidos]
-        else:
-            # Mostrar todos los contaminantes
-            opciones = [{'label': config['name'], 'value': key}
-                       for key, config in POLLUTANT_CONFIG.items()]
+        # El filtro SOLO_CONTAMINANTES_INTERES ya se aplicó al construir MAIN_POLLUTANT_OPTIONS
+        opciones = MAIN_POLLUTANT_OPTIONS if only_main_pollutants else POLLUTANT_OPTIONS
         
         return html.Div([
             html.Label('Seleccionar contaminante:', style=STYLES['label']),
@@ -261,25 +378,20 @@ class SelectorComponents:
                 id=dropdown_id,
                 options=opciones,
                 value=default_value,
+                searchable=True,
+                optionHeight=DROPDOWN_OPTION_HEIGHT,
+                maxHeight=DROPDOWN_MAX_HEIGHT,
+                **DROPDOWN_PERSISTENCE,
                 style=STYLES['dropdown']
             )
-        ], style={
-            'width': '100%', 
-            'margin': '20px', 
-            'padding': '25px', 
-            'background-color': COLORS['card'], 
-            'border-radius': '15px',
-            'box-shadow': '0 4px 6px rgba(0,0,0,0.1)'
-        })
+        ], style=_SELECTOR_CARD_STYLE)
     
     @staticmethod
     def create_date_picker(date_picker_id: str = 'date-picker', default_date: str = None) -> html.Div:
         """Crea selector de fecha simple con estilo profesional y botones de navegación"""
-        from datetime import datetime, timedelta
-        
-        # Si no hay fecha por defecto, usar hace 7 días
+        # Si no hay fecha por defecto, usar hace 7 días (se calcula en cada render)
         if default_date is None:
-            default_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+            default_date = default_forecast_date()
         
         # IDs para los botones de navegación
         prev_button_id = f"{date_picker_id}-prev"
@@ -292,12 +404,7 @@ class SelectorComponents:
                     id=date_picker_id,
                     date=default_date,
                     display_format='DD/MM/YYYY',
-                    style={
-                        'flex': '1',
-                        'padding': '10px',
-                        'border-radius': '5px',
-                        'border': '1px solid #ccc'
-                    }
+                    style=_DATE_PICKER_STYLE
                 ),
                 dbc.Button(
                     "←",
@@ -305,12 +412,7 @@ class SelectorComponents:
                     n_clicks=0,
                     color="secondary",
                     size="sm",
-                    style={
-                        'margin-left': '10px',
-                        'min-width': '40px',
-                        'font-size': '18px',
-                        'font-weight': 'bold'
-                    }
+                    style=_PREV_BUTTON_STYLE
                 ),
                 dbc.Button(
                     "→",
@@ -318,33 +420,14 @@ class SelectorComponents:
                     n_clicks=0,
                     color="secondary",
                     size="sm",
-                    style={
-                        'margin-left': '5px',
-                        'min-width': '40px',
-                        'font-size': '18px',
-                        'font-weight': 'bold'
-                    }
+                    style=_NEXT_BUTTON_STYLE
                 )
-            ], style={
-                'display': 'flex',
-                'align-items': 'center',
-                'gap': '10px'
-            })
-        ], style={
-            'width': '100%', 
-            'margin': '20px', 
-            'padding': '25px', 
-            'background-color': COLORS['card'], 
-            'border-radius': '15px',
-            'box-shadow': '0 4px 6px rgba(0,0,0,0.1)'
-        })
+            ], style=_PICKER_ROW_STYLE)
+        ], style=_SELECTOR_CARD_STYLE)
     
     @staticmethod
     def create_hour_picker(hour_picker_id: str = 'hour-picker', default_hour: int = 9) -> html.Div:
         """Crea selector de hora simple con estilo profesional y botones de navegación"""
-        # Crear opciones para todas las horas del día
-        hour_options = [{'label': f'{h:02d}:00 hrs', 'value': h} for h in range(0, 24)]
-        
         # IDs para los botones de navegación
         prev_button_id = f"{hour_picker_id}-prev"
         next_button_id = f"{hour_picker_id}-next"
@@ -354,10 +437,11 @@ class SelectorComponents:
             html.Div([
                 dcc.Dropdown(
                     id=hour_picker_id,
-                    options=hour_options,
+                    options=HOUR_OPTIONS,
                     value=default_hour,
                     clearable=False,
-                    style={**STYLES['dropdown'], 'flex': '1'}
+                    **DROPDOWN_PERSISTENCE,
+                    style=_HOUR_DROPDOWN_STYLE
                 ),
                 dbc.Button(
                     "←",
@@ -365,12 +449,7 @@ class SelectorComponents:
                     n_clicks=0,
                     color="secondary",
                     size="sm",
-                    style={
-                        'margin-left': '10px',
-                        'min-width': '40px',
-                        'font-size': '18px',
-                        'font-weight': 'bold'
-                    }
+                    style=_PREV_BUTTON_STYLE
                 ),
                 dbc.Button(
                     "→",
@@ -378,31 +457,17 @@ class SelectorComponents:
                     n_clicks=0,
                     color="secondary",
                     size="sm",
-                    style={
-                        'margin-left': '5px',
-                        'min-width': '40px',
-                        'font-size': '18px',
-                        'font-weight': 'bold'
-                    }
+                    style=_NEXT_BUTTON_STYLE
                 )
-            ], style={
-                'display': 'flex',
-                'align-items': 'center',
-                'gap': '10px'
-            })
-        ], style={
-            'width': '100%', 
-            'margin': '20px', 
-            'padding': '25px', 
-            'background-color': COLORS['card'], 
-            'border-radius': '15px',
-            'box-shadow': '0 4px 6px rgba(0,0,0,0.1)'
-        })
+            ], style=_PICKER_ROW_STYLE)
+        ], style=_SELECTOR_CARD_STYLE)
 
 
 class CardComponents:
     """Componentes de tarjetas"""
     
+    __slots__ = ()
+    
     @staticmethod
     def create_info_card(title: str, content: str, is_small: bool = False) -> dbc.Card:
         """Crea tarjeta de información con estilo profesional"""
@@ -411,13 +476,7 @@ class CardComponents:
                 html.H5(title, className="card-title"),
                 html.P(content, className="card-text")
             ])
-        ], style=STYLES['container'] if not is_small else {
-            'margin': '10px',
-            'padding': '15px',
-            'border-radius': '10px',
-            'box-shadow': '0 4px 8px rgba(0,0,0,0.1)',
-            'background-color': COLORS['card']
-        })
+        ], style=STYLES['container'] if not is_small else _SMALL_CARD_STYLE)
     
     @staticmethod
     def create_action_card(title: str, description: str, button_text: str, 
@@ -437,7 +496,10 @@ class CardComponents:
 class AlertComponents:
     """Componentes de alertas"""
     
+    __slots__ = ()
+    
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def create_pollutant_info_alert() -> dbc.Alert:
         """Crea alerta informativa sobre tipos de pronóstico"""
         return dbc.Alert([
@@ -447,105 +509,82 @@ class AlertComponents:
                 html.Br(),
                 "• Otros contaminantes: Valores regionales (promedio, mínimo, máximo) + observaciones por estación"
             ])
-        ], color="info", style={
-            'border-radius': '10px',
-            'box-shadow': '0 2px 4px rgba(0,0,0,0.1)'
-        })
+        ], color="info", style=_ALERT_STYLE)
 
 
 class LayoutContainers:
     """Contenedores de layout"""
     
+    __slots__ = ()
+    
     @staticmethod
-    def create_responsive_selector_row(left_component: Any, right_component: Any) -> dbc.Row:
+    def create_responsive_selector_row(left_component: Any, right_component: Any) -> html.Div:
         """Crea fila responsiva de selectores"""
-        return dbc.Row([
-            dbc.Col(left_component, xs=12, sm=12, md=6, lg=6),
-            dbc.Col(right_component, xs=12, sm=12, md=6, lg=6)
-        ], className="mb-4")
+        return html.Div((left_component, right_component), className=_GRID_ROW_CLASS)
     
     @staticmethod
     def create_timeseries_and_indicators_row(timeseries_title: str, timeseries_id: str,
-                                           indicators_title: str, indicators_content: List[Any]) -> dbc.Row:
-        """Crea fila con serie temporal e indicadores"""
-        return dbc.Row([
+                                           indicators_title: str, indicators_content: Sequence[Any]) -> html.Div:
+        """Crea fila con serie temporal e indicadores (uno debajo del otro)"""
+        return html.Div((
             # Serie temporal
-            dbc.Col([
-                html.Div([
-                    html.H3(timeseries_title, style=STYLES['title']),
-                    dcc.Graph(id=timeseries_id, config={'displayModeBar': False})
-                ], style=STYLES['container'])
-            ], width=12, className="mb-4"),
+            html.Div([
+                html.H3(timeseries_title, style=STYLES['title']),
+                dcc.Loading(dcc.Graph(id=timeseries_id, config=_GRAPH_CONFIG), type='circle')
+            ], style=STYLES['container'], className="mb-4"),
             
             # Indicadores
-            dbc.Col([
-                html.Div([
-                    html.H3(indicators_title, style=STYLES['title']),
-                    indicators_content
-                ], style=STYLES['container'])
-            ], width=12)
-        ])
+            html.Div([
+                html.H3(indicators_title, style=STYLES['title']),
+                indicators_content
+            ], style=STYLES['container'])
+        ))
     
     @staticmethod
     def create_dual_chart_row(left_title: str, left_graph_id: str,
-                             right_title: str, right_graph_id: str) -> dbc.Row:
+                             right_title: str, right_graph_id: str) -> html.Div:
         """Crea fila con dos gráficos lado a lado"""
-        return dbc.Row([
-            dbc.Col([
-                html.Div([
-                    html.H4(left_title, style=STYLES['title']),
-                    dcc.Graph(id=left_graph_id, config={'displayModeBar': False})
-                ], style=STYLES['container'])
-            ], xs=12, md=6),
-            dbc.Col([
-                html.Div([
-                    html.H4(right_title, style=STYLES['title']),
-                    dcc.Graph(id=right_graph_id, config={'displayModeBar': False})
-                ], style=STYLES['container'])
-            ], xs=12, md=6)
-        ])
+        return html.Div((
+            html.Div([
+                html.H4(left_title, style=STYLES['title']),
+                dcc.Loading(dcc.Graph(id=left_graph_id, config=_GRAPH_CONFIG), type='circle')
+            ], style=STYLES['container']),
+            html.Div([
+                html.H4(right_title, style=STYLES['title']),
+                dcc.Loading(dcc.Graph(id=right_graph_id, config=_GRAPH_CONFIG), type='circle')
+            ], style=STYLES['container'])
+        ), className="layout-grid")
     
     @staticmethod
-    def create_action_cards_row(cards: List[Any]) -> dbc.Row:
+    def create_action_cards_row(cards: Sequence[Any]) -> html.Div:
         """Crea fila de tarjetas de acción"""
-        return dbc.Row([
-            dbc.Col(card, xs=12, md=6) for card in cards
-        ], className="mb-4")
+        return html.Div(tuple(cards), className=_GRID_ROW_CLASS)
 
 
 class IndicatorComponents:
     """Componentes de indicadores"""
     
+    __slots__ = ()
+    
     @staticmethod
-    def wrap_indicators_in_columns(indicators: List[Any]) -> html.Div:
-        """Envuelve indicadores en columnas responsivas"""
-        return html.Div([
-            html.Div([
-                dcc.Graph(
-                    id=f'dial_{i}', 
-                    figure=indicators[i], 
-                    config={'displayModeBar': False}
-                )
-            ], style={
-                'width': '50%', 
-                'height': '90%', 
-                'display': 'inline-block',
-                'min-width': '300px',
-                'margin-bottom': '20px'
-            }) 
-            for i in range(len(indicators))
-        ], style={
-            'width': '100%',
-            'display': 'flex',
-            'flex-wrap': 'wrap',
-            'justify-content': 'center',
-            'gap': '20px'
-        })
+    def wrap_indicators_in_columns(indicators_figure: Any) -> html.Div:
+        """
+        Envuelve la figura de diales (una sola figura con subplots).
+        
+        La figura viaja en un Store y se dibuja en el navegador cuando la fila
+        se vuelve visible; mientras tanto el gráfico reserva su altura vacío.
+        """
+        return html.Div((
+            dcc.Graph(id=DIALS_GRAPH_ID, figure=_EMPTY_DIAL_FIGURE, config=_DIALS_CONFIG),
+            dcc.Store(id=DIALS_FIGURE_ID, data=indicators_figure)
+        ), className="indicator-row", **{'data-lazy-store': INDICATORS_VISIBLE_ID})
 
 
 class SummaryComponents:
     """Componentes de resumen"""
     
+    __slots__ = ()
+    
     @staticmethod
     def create_ozone_max_summary() -> html.Div:
         """
@@ -560,28 +599,15 @@ class SummaryComponents:
                         children=[
                             html.P(
                                 "Cargando resumen del pronóstico...",
-                                style={
-                                    'font-size': '18px',
-                                    'font-family': 'Helvetica',
-                                    'color': COLORS['text'],
-                                    'margin': '0',
-                                    'text-align': 'center'
-                                }
+                                style=_SUMMARY_TEXT_STYLE
                             )
                         ],
-                        style={
-                            'padding': '15px',
-                            'text-align': 'center'
-                        }
-                    )
+                        style=_SUMMARY_CONTENT_STYLE
+                    ),
+                    # Hora de la última consulta del resumen (indicador de frescura)
+                    html.Small(id='ozone-summary-freshness', style=_SUMMARY_FRESHNESS_STYLE)
                 ])
-            ], style={
-                'background-color': COLORS['card'],
-                'border': f'2px solid {COLORS.get("border", "#e0e0e0")}',
-                'border-radius': '8px',
-                'box-shadow': '0 2px 8px rgba(0,0,0,0.1)',
-                'margin': '20px 0'
-            })
+            ], style=_SUMMARY_CARD_STYLE)
         ], style=STYLES['container'])
 
 
@@ -596,6 +622,6 @@ indicator_components = IndicatorComponents()
 summary_components = SummaryComponents()
 
 # Funciones de conveniencia
-def create_navbar():
+def create_navbar() -> html.Div:
     """Función de conveniencia para crear navbar"""
     return nav_components.create_navbar() 
@@ -4,11 +4,43 @@ Maneja diferentes modos de operación de manera profesional.
 """
 
 from enum import Enum
+import bisect
+import numpy as np
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+import functools
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 import os
-import json
+import logging
 import netrc
+import threading
+
+from cache_utils import ttl_cache
+
+# Decodificador JSON rápido si está disponible (orjson), si no la biblioteca estándar
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Recarga en caliente del archivo de configuración (opcional): watchdog y PyYAML
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
 
 # =============================================================================
 # CONFIGURACIÓN GLOBAL PARA PRONÓSTICOS DE OZONO
@@ -18,6 +50,9 @@ import netrc
 # - 7: Nuevo estándar PostgreSQL (recomendado)
 OZONE_FORECAST_ID = 7  # Cambiar aquí para alternar entre 6 y 7
 
+# Segundos que se reutiliza la fecha del último pronóstico consultada en la BD
+REFERENCE_DATE_TTL = 60
+
 # Función para obtener el ID del pronóstico de ozono
 def get_ozone_forecast_id() -> int:
     """
@@ -33,12 +68,14 @@ def get_ozone_forecast_id() -> int:
     return OZONE_FORECAST_ID
 
 # Función para cambiar dinámicamente el ID del pronóstico
-def set_ozone_forecast_id(new_id: int) -> None:
+def set_ozone_forecast_id(new_id: int, notify: bool = True) -> None:
     """
     Cambia el ID del tipo de pronóstico para ozono.
+    ForecastDataService lo lee en cada consulta de forecast_otres.
     
     Args:
         new_id (int): Nuevo ID (6 o 7)
+        notify (bool): Ejecutar los ganchos de recarga (limpian cachés de datos y figuras)
     
     Ejemplo de uso:
         from config import set_ozone_forecast_id
@@ -48,9 +85,14 @@ def set_ozone_forecast_id(new_id: int) -> None:
     global OZONE_FORECAST_ID
     if new_id in [6, 7]:
         OZONE_FORECAST_ID = new_id
-        print(f"🔄 ID de pronóstico de ozono cambiado a: {new_id}")
+        POLLUTANT_CONFIG['O3'] = replace(POLLUTANT_CONFIG['O3'], forecast_id=new_id)
+        # La fecha de referencia memorizada puede corresponder al tipo anterior
+        _latest_reference_date.cache_clear()
+        logger.info("🔄 ID de pronóstico de ozono cambiado a: %s", new_id)
+        if notify:
+            _run_reload_hooks()
     else:
-        print(f"⚠️ ID inválido: {new_id}. Solo se permiten valores 6 o 7.")
+        logger.warning("⚠️ ID inválido: %s. Solo se permiten valores 6 o 7.", new_id)
 
 class DataMode(Enum):
     """
@@ -74,6 +116,38 @@ class Environment(Enum):
     STAGING = "staging"
     PRODUCTION = "production"
 
+# Variables de entorno que lee AppConfig: se toman una sola vez por proceso
+_ENV_KEYS = (
+    'SQLITE_FORECAST_DB_PATH', 'SQLITE_HISTORICAL_DB_PATH',
+    'DB_HOST', 'DB_PORT', 'DB_NAME', 'DB_USER', 'DB_PASSWORD',
+    'DATA_MODE', 'ENVIRONMENT', 'MOCK_REFERENCE_DATE', 'DEBUG', 'PORT',
+    'CONFIG_FILE', 'CONFIG_HOT_RELOAD'
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _env_snapshot() -> Dict[str, Optional[str]]:
+    """Copia de las variables de entorno de la configuración (una lectura por proceso)"""
+    return {key: os.environ.get(key) for key in _ENV_KEYS}
+
+
+def _env(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Equivalente a os.getenv(key, default) sobre la copia de _env_snapshot()"""
+    value = _env_snapshot()[key]
+    return default if value is None else value
+
+
+@functools.lru_cache(maxsize=1)
+def get_db_credentials():
+    """Obtiene credenciales de BD desde .netrc (el archivo se lee una sola vez por proceso)"""
+    try:
+        n = netrc.netrc()
+        login, account, password = n.authenticators('AMATE-SOLOREAD')
+        return login, password
+    except (FileNotFoundError, netrc.NetrcParseError):
+        return _env('DB_USER'), _env('DB_PASSWORD')
+
+
 class AppConfig:
     """
     Configuración centralizada de la aplicación.
@@ -86,8 +160,8 @@ class AppConfig:
         self.USE_SQLITE_CONTINGENCY = False  # Desactivado - ahora usamos PostgreSQL
         self.USE_POSTGRESQL_PRODUCTION = True  # Sistema principal PostgreSQL
         # Rutas de bases de datos SQLite (usar variables de entorno o rutas relativas)
-        self.SQLITE_FORECAST_DB_PATH = os.getenv('SQLITE_FORECAST_DB_PATH', './data/forecast_predictions.db')
-        self.SQLITE_HISTORICAL_DB_PATH = os.getenv('SQLITE_HISTORICAL_DB_PATH', './data/contingencia_sqlite_bd.db')
+        self.SQLITE_FORECAST_DB_PATH = _env('SQLITE_FORECAST_DB_PATH', './data/forecast_predictions.db')
+        self.SQLITE_HISTORICAL_DB_PATH = _env('SQLITE_HISTORICAL_DB_PATH', './data/contingencia_sqlite_bd.db')
         
         # Configuración por defecto - Si PostgreSQL está activado, usar modo PRODUCTION
         self.environment = Environment.PRODUCTION
@@ -101,25 +175,14 @@ class AppConfig:
         # Fecha de referencia para datos históricos mock (solo se usa si no hay SQLite)
         self.mock_reference_date = datetime(2023, 5, 15, 14, 0, 0)  # 15 de mayo 2023, 14:00
         
-        # Configuración de base de datos PostgreSQL de PRODUCCIÓN
-        def get_db_credentials():
-            """Obtiene credenciales de BD desde .netrc"""
-            try:
-                n = netrc.netrc()
-                login, account, password = n.authenticators('AMATE-SOLOREAD')
-                return login, password
-            except (FileNotFoundError, netrc.NetrcParseError):
-                return os.getenv('DB_USER'), os.getenv('DB_PASSWORD')
-
-        # Configuración PostgreSQL de producción
+        # Configuración PostgreSQL de producción (credenciales desde .netrc)
         login, password = get_db_credentials()
         self.db_config = {
-            'host': os.getenv('DB_HOST', '132.248.8.152'),
-            'port': os.getenv('DB_PORT', '5432'),
-            'database': os.getenv('DB_NAME', 'contingencia'),
+            'host': _env('DB_HOST', '132.248.8.152'),
+            'port': _env('DB_PORT', '5432'),
+            'database': _env('DB_NAME', 'contingencia'),
             'user': login or 'forecast_user',
-            'password': password or '',
-            'forecast_id': 7  # Nuevo ID de pronóstico PostgreSQL
+            'password': password or ''
         }
         
         # Configuración de la aplicación
@@ -142,62 +205,67 @@ class AppConfig:
         # Cargar configuración desde variables de entorno
         self._load_from_environment()
         
+        # Archivo de configuración opcional (y su recarga en caliente si CONFIG_HOT_RELOAD=1)
+        self.config_file = _env('CONFIG_FILE', './config.yaml')
+        if os.path.exists(self.config_file):
+            reload_config_file(self.config_file)
+        if _env('CONFIG_HOT_RELOAD') == '1':
+            start_config_watcher(self.config_file)
+        
     def _load_from_environment(self):
         """Carga configuración desde variables de entorno."""
         
         # Si PostgreSQL está activado, SIEMPRE usar modo PRODUCTION
         if self.USE_POSTGRESQL_PRODUCTION:
-            print("🔄 PostgreSQL activado: forzando modo PRODUCTION")
+            logger.info("🔄 PostgreSQL activado: forzando modo PRODUCTION")
             self.data_mode = DataMode.PRODUCTION
         # Si SQLite está activado, forzar modo PRODUCTION
         elif self.USE_SQLITE_CONTINGENCY:
-            print("🔄 SQLite activado: forzando modo PRODUCTION")
+            logger.info("🔄 SQLite activado: forzando modo PRODUCTION")
             self.data_mode = DataMode.PRODUCTION
         else:
             # Modo de datos normal (solo si ninguna BD está activada)
-            data_mode_str = os.getenv('DATA_MODE', 'mock_historical')
+            data_mode_str = _env('DATA_MODE', 'mock_historical')
             try:
                 self.data_mode = DataMode(data_mode_str)
             except ValueError:
-                print(f"⚠️ Modo de datos '{data_mode_str}' no válido, usando MOCK_HISTORICAL")
-                if self.is_debug_mode():
-                    print(f"   📋 Modos válidos: {[mode.value for mode in DataMode]}")
-                    print(f"   🔧 Usando: MOCK_HISTORICAL")
+                logger.warning("⚠️ Modo de datos '%s' no válido, usando MOCK_HISTORICAL", data_mode_str)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("   📋 Modos válidos: %s", [mode.value for mode in DataMode])
                 self.data_mode = DataMode.MOCK_HISTORICAL
         
         # Entorno
-        env_str = os.getenv('ENVIRONMENT', 'development')
+        env_str = _env('ENVIRONMENT', 'development')
         try:
             self.environment = Environment(env_str)
         except ValueError:
-            print(f"⚠️ Entorno '{env_str}' no válido, usando DEVELOPMENT")
-            if self.is_debug_mode():
-                print(f"   📋 Entornos válidos: {[env.value for env in Environment]}")
-                print(f"   🔧 Usando: DEVELOPMENT")
+            logger.warning("⚠️ Entorno '%s' no válido, usando DEVELOPMENT", env_str)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("   📋 Entornos válidos: %s", [env.value for env in Environment])
             self.environment = Environment.DEVELOPMENT
         
         # Fecha de referencia mock (solo si SQLite no está activado)
         if not self.USE_SQLITE_CONTINGENCY:
-            mock_date_str = os.getenv('MOCK_REFERENCE_DATE')
+            mock_date_str = _env('MOCK_REFERENCE_DATE')
             if mock_date_str:
                 try:
                     self.mock_reference_date = datetime.strptime(mock_date_str, '%Y-%m-%d %H:%M:%S')
                 except ValueError:
-                    print(f"⚠️ Fecha de referencia mock '{mock_date_str}' no válida, usando fecha por defecto")
+                    logger.warning("⚠️ Fecha de referencia mock '%s' no válida, usando fecha por defecto", mock_date_str)
         else:
-            print("🔄 SQLite activado: ignorando fecha de referencia mock")
+            logger.info("🔄 SQLite activado: ignorando fecha de referencia mock")
         
         # Debug mode
-        debug_str = os.getenv('DEBUG', 'true').lower()
+        debug_str = _env('DEBUG', 'true').lower()
         self.app_config['debug'] = debug_str in ('true', '1', 'yes')
         
         # Puerto
-        port_str = os.getenv('PORT')
+        port_str = _env('PORT')
         if port_str:
             try:
                 self.app_config['port'] = int(port_str)
             except ValueError:
-                print(f"⚠️ Puerto '{port_str}' no válido, usando 6006")
+                logger.warning("⚠️ Puerto '%s' no válido, usando 6006", port_str)
     
     def get_data_service_config(self) -> Dict[str, Any]:
         """
@@ -291,34 +359,13 @@ class AppConfig:
             # Para datos sintéticos, usar fecha actual pero con hora fija
             now = datetime.now()
             return now.replace(hour=14, minute=0, second=0, microsecond=0)
-        elif self.data_mode == DataMode.PRODUCTION and self.USE_POSTGRESQL_PRODUCTION:
-            # Si está en modo PostgreSQL, SIEMPRE obtener la fecha real del último pronóstico
-            try:
-                from postgres_data_service import get_last_available_date
-                last_forecast_date = get_last_available_date()
-                if last_forecast_date:
-                    print(f"✅ Usando última fecha disponible de PostgreSQL: {last_forecast_date}")
-                    return last_forecast_date
-                else:
-                    print("⚠️ No se pudo obtener fecha de pronóstico PostgreSQL, usando fecha actual")
-                    return datetime.now()
-            except Exception as e:
-                print(f"⚠️ Error obteniendo fecha PostgreSQL: {e}, usando fecha actual")
-                return datetime.now()
-        elif self.data_mode == DataMode.PRODUCTION and self.USE_SQLITE_CONTINGENCY:
-            # Si está en modo SQLite, intentar obtener la fecha real del último pronóstico
-            try:
-                from sqlite_data_service import get_sqlite_service
-                sqlite_service = get_sqlite_service()
-                last_forecast_date = sqlite_service.get_last_forecast_date()
-                if last_forecast_date:
-                    return datetime.strptime(last_forecast_date, '%Y-%m-%d %H:%M:%S')
-                else:
-                    print("⚠️ No se pudo obtener fecha de pronóstico SQLite, usando fecha actual")
-                    return datetime.now()
-            except Exception as e:
-                print(f"⚠️ Error obteniendo fecha SQLite: {e}, usando fecha actual")
-                return datetime.now()
+        elif self.data_mode == DataMode.PRODUCTION and (self.USE_POSTGRESQL_PRODUCTION or self.USE_SQLITE_CONTINGENCY):
+            # Fecha real del último pronóstico (memorizada, ver _latest_reference_date)
+            last_forecast_date = _latest_reference_date(self.USE_POSTGRESQL_PRODUCTION)
+            if last_forecast_date:
+                return last_forecast_date
+            logger.warning("⚠️ No se pudo obtener fecha de pronóstico de la BD, usando fecha actual")
+            return datetime.now()
         else:
             return datetime.now()
     
@@ -326,85 +373,140 @@ class AppConfig:
         """Determina si mostrar anotaciones de debug en los gráficos."""
         return self.is_debug_mode() and self.data_mode in [DataMode.MOCK_SYNTHETIC, DataMode.MOCK_HISTORICAL]
 
-# Instancia global de configuración
-app_config = AppConfig()
+@functools.lru_cache(maxsize=2)
+def _last_forecast_date_source(use_postgresql: bool) -> Optional[Callable[[], Any]]:
+    """
+    Resuelve una sola vez la función que consulta la fecha del último pronóstico.
+    No se importa al cargar el módulo porque postgres_data_service importa config.
+    """
+    try:
+        if use_postgresql:
+            from postgres_data_service import get_last_available_date
+            return get_last_available_date
+        from sqlite_data_service import get_sqlite_service
+        return lambda: get_sqlite_service().get_last_forecast_date()
+    except Exception as e:
+        logger.warning("⚠️ Servicio de fecha de pronóstico no disponible: %s", e)
+        return None
+
+
+@ttl_cache(ttl=REFERENCE_DATE_TTL, maxsize=2, cache_falsy=False)
+def _latest_reference_date(use_postgresql: bool) -> Optional[datetime]:
+    """
+    Consulta la fecha del último pronóstico en PostgreSQL o SQLite.
+    Los callbacks la piden en cada interacción; la memorización evita una consulta
+    por llamada. No se guardan fallos (None) para reintentar en la siguiente llamada.
+    """
+    source = _last_forecast_date_source(use_postgresql)
+    if source is None:
+        return None
+    
+    db_name = 'PostgreSQL' if use_postgresql else 'SQLite'
+    try:
+        last_forecast_date = source()
+        if not last_forecast_date:
+            return None
+        if use_postgresql:
+            logger.debug("✅ Usando última fecha disponible de PostgreSQL: %s", last_forecast_date)
+            return last_forecast_date
+        # SQLite devuelve la fecha como texto
+        return datetime.strptime(last_forecast_date, '%Y-%m-%d %H:%M:%S')
+    except Exception as e:
+        logger.warning("⚠️ Error obteniendo fecha %s: %s", db_name, e)
+        return None
+
+# Instancia global de configuración: se crea en el primer uso (ver __getattr__ al final
+# del módulo), así importar solo COLORS o STYLES no construye AppConfig
+@functools.lru_cache(maxsize=1)
+def get_app_config() -> AppConfig:
+    """Retorna la instancia única de AppConfig (creada en el primer uso)."""
+    return AppConfig()
 
 # Funciones de conveniencia
 def get_data_mode() -> DataMode:
     """Retorna el modo de datos actual."""
-    return app_config.data_mode
+    return get_app_config().data_mode
 
 def get_environment() -> Environment:
     """Retorna el entorno actual."""
-    return app_config.environment
+    return get_app_config().environment
 
 def is_mock_mode() -> bool:
     """Determina si estamos en modo mock."""
-    return app_config.data_mode in [DataMode.MOCK_SYNTHETIC, DataMode.MOCK_HISTORICAL]
+    return get_app_config().data_mode in [DataMode.MOCK_SYNTHETIC, DataMode.MOCK_HISTORICAL]
 
 def is_production_mode() -> bool:
     """Determina si estamos en modo producción."""
-    return app_config.data_mode == DataMode.PRODUCTION and app_config.environment == Environment.PRODUCTION
+    config = get_app_config()
+    return config.data_mode == DataMode.PRODUCTION and config.environment == Environment.PRODUCTION
 
 def get_mock_reference_date() -> datetime:
     """Retorna la fecha de referencia para datos mock."""
-    return app_config.mock_reference_date
+    return get_app_config().mock_reference_date
 
 def get_current_reference_date() -> datetime:
     """Retorna la fecha de referencia actual."""
-    return app_config.get_current_reference_date()
+    return get_app_config().get_current_reference_date()
 
 def is_sqlite_mode() -> bool:
     """Verifica si está en modo SQLite."""
-    return app_config.is_sqlite_mode()
+    return get_app_config().is_sqlite_mode()
 
 def is_postgresql_mode() -> bool:
     """Verifica si está en modo PostgreSQL."""
-    return app_config.is_postgresql_mode()
+    return get_app_config().is_postgresql_mode()
 
 def get_sqlite_config() -> Dict[str, Any]:
     """Obtiene la configuración de SQLite."""
-    return app_config.get_sqlite_config()
+    return get_app_config().get_sqlite_config()
 
 def get_postgresql_config() -> Dict[str, Any]:
     """Obtiene la configuración de PostgreSQL."""
-    return app_config.db_config
+    return get_app_config().db_config
 
-# Configuración específica para diferentes componentes
-# Si PostgreSQL está activado, SIEMPRE usar fecha dinámica del último pronóstico
-if app_config.USE_POSTGRESQL_PRODUCTION and app_config.data_mode == DataMode.PRODUCTION:
-    try:
-        from postgres_data_service import get_last_available_date
-        last_forecast_date = get_last_available_date()
-        if last_forecast_date:
-            specific_date = last_forecast_date.strftime('%Y-%m-%d %H:%M:%S')
-            print(f"🎯 Configuración específica: usando última fecha PostgreSQL {specific_date}")
-        else:
-            specific_date = app_config.mock_reference_date.strftime('%Y-%m-%d %H:%M:%S')
-            print(f"⚠️ Configuración específica: fallback a fecha mock {specific_date}")
-    except Exception as e:
-        specific_date = app_config.mock_reference_date.strftime('%Y-%m-%d %H:%M:%S')
-        print(f"❌ Configuración específica: error PostgreSQL, fallback a fecha mock {specific_date}")
-# Si SQLite está activado, usar fecha dinámica del último pronóstico (fallback)
-elif app_config.USE_SQLITE_CONTINGENCY and app_config.data_mode == DataMode.PRODUCTION:
-    try:
-        from sqlite_data_service import get_sqlite_service
-        sqlite_service = get_sqlite_service()
-        last_forecast_date = sqlite_service.get_last_forecast_date()
-        if last_forecast_date:
-            specific_date = last_forecast_date
-        else:
-            specific_date = app_config.mock_reference_date.strftime('%Y-%m-%d %H:%M:%S')
-    except:
-        specific_date = app_config.mock_reference_date.strftime('%Y-%m-%d %H:%M:%S')
-else:
-    specific_date = app_config.mock_reference_date.strftime('%Y-%m-%d %H:%M:%S')
-
-DEFAULT_DATE_CONFIG = {
-    'use_specific_date': True,
-    'specific_date': specific_date,
-    'station_default': 'MER'  # Estación por defecto
-}
+@functools.lru_cache(maxsize=1)
+def get_default_date_config() -> Dict[str, Any]:
+    """
+    Configuración de fecha por defecto (DEFAULT_DATE_CONFIG).
+    Se calcula en el primer uso: en modo PostgreSQL consulta la fecha del último
+    pronóstico, consulta que ya no ocurre al importar el módulo.
+    """
+    config = get_app_config()
+    # Configuración específica para diferentes componentes
+    # Si PostgreSQL está activado, SIEMPRE usar fecha dinámica del último pronóstico
+    if config.USE_POSTGRESQL_PRODUCTION and config.data_mode == DataMode.PRODUCTION:
+        try:
+            from postgres_data_service import get_last_available_date
+            last_forecast_date = get_last_available_date()
+            if last_forecast_date:
+                specific_date = last_forecast_date.strftime('%Y-%m-%d %H:%M:%S')
+                logger.info("🎯 Configuración específica: usando última fecha PostgreSQL %s", specific_date)
+            else:
+                specific_date = config.mock_reference_date.strftime('%Y-%m-%d %H:%M:%S')
+                logger.warning("⚠️ Configuración específica: fallback a fecha mock %s", specific_date)
+        except Exception as e:
+            specific_date = config.mock_reference_date.strftime('%Y-%m-%d %H:%M:%S')
+            logger.error("❌ Configuración específica: error PostgreSQL (%s), fallback a fecha mock %s", e, specific_date)
+    # Si SQLite está activado, usar fecha dinámica del último pronóstico (fallback)
+    elif config.USE_SQLITE_CONTINGENCY and config.data_mode == DataMode.PRODUCTION:
+        try:
+            from sqlite_data_service import get_sqlite_service
+            sqlite_service = get_sqlite_service()
+            last_forecast_date = sqlite_service.get_last_forecast_date()
+            if last_forecast_date:
+                specific_date = last_forecast_date
+            else:
+                specific_date = config.mock_reference_date.strftime('%Y-%m-%d %H:%M:%S')
+        except:
+            specific_date = config.mock_reference_date.strftime('%Y-%m-%d %H:%M:%S')
+    else:
+        specific_date = config.mock_reference_date.strftime('%Y-%m-%d %H:%M:%S')
+    
+    return {
+        'use_specific_date': True,
+        'specific_date': specific_date,
+        'station_default': 'MER'  # Estación por defecto
+    }
 
 # COLORS moved to professional configuration section below
 
@@ -418,8 +520,12 @@ STATIONS_WITH_DATA = ['MER', 'UIZ', 'CCA', 'PED', 'TLA']  # Estaciones que típi
 # CONFIGURACIÓN DE COLORES Y ESTILOS (vdev8)
 # =====================================
 
+# Las configuraciones compartidas por los callbacks son de solo lectura (MappingProxyType).
+# Los dicts internos (p. ej. STYLES['title']) siguen siendo dict: se pasan tal cual como
+# `style=` a Dash y su serializador JSON no acepta mappingproxy.
+
 # Colores principales (exactamente como vdev8)
-COLORS = {
+COLORS = MappingProxyType({
     'background': '#edeff2',
     'header': '#00505C',
     'text': '#2c3e50',
@@ -439,7 +545,13 @@ COLORS = {
     'aire_mala': '#FF7E00',           # Naranja
     'aire_muy_mala': '#FF0000',       # Rojo
     'aire_extremadamente_mala': '#8F3F97'  # Morado
-}
+})
+
+# Los colores se publican como variables CSS (--color-header, --color-gradient-start, ...)
+# para que las hojas de estilo de assets/ usen COLORS como única fuente
+COLOR_CSS_VARIABLES = ':root { ' + ' '.join(
+    f"--color-{name.replace('_', '-')}: {value};" for name, value in COLORS.items()
+) + ' }'
 
 # Umbrales de ozono en ppb (convertidos de ppm) - exactamente como vdev8
 OZONE_THRESHOLDS = {
@@ -449,6 +561,22 @@ OZONE_THRESHOLDS = {
     'muy_mala': 175       # 0.175 ppm * 1000
 }
 
+# Límites ordenados y categorías de ozono para clasificar con bisect (ver get_air_quality_category)
+def _build_ozone_bounds() -> tuple:
+    """Límites ordenados de OZONE_THRESHOLDS (se recalculan al recargar la configuración)"""
+    return (
+        OZONE_THRESHOLDS['buena'],
+        OZONE_THRESHOLDS['aceptable'],
+        OZONE_THRESHOLDS['mala'],
+        OZONE_THRESHOLDS['muy_mala']
+    )
+
+_OZONE_BOUNDS = _build_ozone_bounds()
+_OZONE_LABELS = ('Buena', 'Aceptable', 'Mala', 'Muy Mala', 'Extremadamente Mala')
+# Versiones NumPy para clasificar arreglos completos (ver get_air_quality_categories)
+_OZONE_BOUNDS_NP = np.array(_OZONE_BOUNDS, dtype=np.float64)
+_OZONE_LABELS_NP = np.array(_OZONE_LABELS + ('No disponible',))
+
 # Umbrales de PM10 en µg/m³ - NOM a partir de enero 2024
 PM10_THRESHOLDS = {
     'buena': 45,          # <45 µg/m³
@@ -466,7 +594,7 @@ PM25_THRESHOLDS = {
 }
 
 # Estilos (exactamente como vdev8)
-STYLES = {
+STYLES = MappingProxyType({
     'header': {
         'font-family': 'Helvetica',
         'color': 'white',
@@ -520,71 +648,79 @@ STYLES = {
         'border-radius': '15px 15px 0 0',
         'box-shadow': '0 -4px 6px rgba(0,0,0,0.1)'
     }
-}
+})
+
+@dataclass(frozen=True)
+class PollutantInfo:
+    """Metadatos inmutables de un contaminante (compartidos entre callbacks)."""
+    __slots__ = ('name', 'units', 'db_key', 'has_station_forecast', 'color', 'forecast_id')
+    name: str
+    units: str
+    db_key: str
+    has_station_forecast: bool
+    color: str
+    forecast_id: int
+
 
 # Configuración de contaminantes con metadatos - NUEVO SISTEMA POSTGRESQL
-POLLUTANT_CONFIG = {
-    'O3': {
-        'name': 'O₃ (Ozono)',
-        'units': 'ppb',
-        'db_key': 'forecast_otres',  # Nueva tabla PostgreSQL
-        'has_station_forecast': True,
-        'color': '#FF6B6B',
-        'forecast_id': OZONE_FORECAST_ID  # Usa la variable global configurable
-    },
-    'PM2.5': {
-        'name': 'PM2.5',
-        'units': 'µg/m³',
-        'db_key': 'forecast_pmdoscinco',  # Nueva tabla PostgreSQL
-        'has_station_forecast': False,
-        'color': '#4ECDC4',
-        'forecast_id': 7
-    },
-    'PM10': {
-        'name': 'PM10',
-        'units': 'µg/m³',
-        'db_key': 'forecast_pmdiez',  # Nueva tabla PostgreSQL
-        'has_station_forecast': False,
-        'color': '#45B7D1',
-        'forecast_id': 7
-    },
-    'NO2': {
-        'name': 'NO₂',
-        'units': 'ppb',
-        'db_key': 'forecast_nodos',  # Nueva tabla PostgreSQL
-        'has_station_forecast': False,
-        'color': '#96CEB4',
-        'forecast_id': 7
-    },
-    'CO': {
-        'name': 'CO',
-        'units': 'ppm',
-        'db_key': 'forecast_co',  # Nueva tabla PostgreSQL
-        'has_station_forecast': False,
-        'color': '#FFEAA7',
-        'forecast_id': 7
-    },
-    'SO2': {
-        'name': 'SO₂',
-        'units': 'ppb',
-        'db_key': 'forecast_sodos',  # Nueva tabla PostgreSQL
-        'has_station_forecast': False,
-        'color': '#DDA0DD',
-        'forecast_id': 7
-    }
+POLLUTANT_CONFIG: Dict[str, PollutantInfo] = {
+    'O3': PollutantInfo(
+        name='O₃ (Ozono)',
+        units='ppb',
+        db_key='forecast_otres',  # Nueva tabla PostgreSQL
+        has_station_forecast=True,
+        color='#FF6B6B',
+        forecast_id=OZONE_FORECAST_ID  # Usa la variable global configurable
+    ),
+    'PM2.5': PollutantInfo(
+        name='PM2.5',
+        units='µg/m³',
+        db_key='forecast_pmdoscinco',  # Nueva tabla PostgreSQL
+        has_station_forecast=False,
+        color='#4ECDC4',
+        forecast_id=7
+    ),
+    'PM10': PollutantInfo(
+        name='PM10',
+        units='µg/m³',
+        db_key='forecast_pmdiez',  # Nueva tabla PostgreSQL
+        has_station_forecast=False,
+        color='#45B7D1',
+        forecast_id=7
+    ),
+    'NO2': PollutantInfo(
+        name='NO₂',
+        units='ppb',
+        db_key='forecast_nodos',  # Nueva tabla PostgreSQL
+        has_station_forecast=False,
+        color='#96CEB4',
+        forecast_id=7
+    ),
+    'CO': PollutantInfo(
+        name='CO',
+        units='ppm',
+        db_key='forecast_co',  # Nueva tabla PostgreSQL
+        has_station_forecast=False,
+        color='#FFEAA7',
+        forecast_id=7
+    ),
+    'SO2': PollutantInfo(
+        name='SO₂',
+        units='ppb',
+        db_key='forecast_sodos',  # Nueva tabla PostgreSQL
+        has_station_forecast=False,
+        color='#DDA0DD',
+        forecast_id=7
+    )
 }
 
-# Configuración de la aplicación Dash (título como vdev8)
-APP_CONFIG = {
-    'title': 'Pronóstico de Calidad del Aire Basado en Redes Neuronales: Concentraciones de Ozono, PM10 y PM2.5',
-    'debug': True,
-    'host': '0.0.0.0',
-    'port': 6006,  # Puerto para debug en localhost
-    # 'port': 8888,  # Puerto original comentado como referencia
-    'suppress_callback_exceptions': True
+# API externa de pronóstico de ozono (a la base se le agrega la fecha YYYY-MM-DD)
+FORECAST_API_CONFIG = {
+    'ozone_url_base': os.getenv('OZONE_FORECAST_API_URL', 'http://132.248.8.98:58888/ai_vi_transformer01/ozono/CDMX/')
 }
+
 # Configuración del mapa (exactamente como vdev8)
-MAP_CONFIG = {
+MAP_CONFIG = MappingProxyType({
     'center_lat': 19.35,
     'center_lon': -99.15,
     'zoom': 8.2,  # Reducido de 8.5 a 8.2 para ver más área (como vdev8)
@@ -592,19 +728,19 @@ MAP_CONFIG = {
     'max_value': 250,  # ppb para normalización
     'marker_size': 20,
     'height': 400
-}
+})
 
 # Configuración de los gráficos (como vdev8)
-CHART_CONFIG = {
+CHART_CONFIG = MappingProxyType({
     'responsive': True,
     'displayModeBar': False,
     'height': 400,
     'margin': dict(t=40, b=40, l=40, r=40),  # Exactamente como vdev8
     'font_family': 'Helvetica, sans-serif'
-}
+})
 
 # Configuración de indicadores (diales) - como vdev8
-INDICATOR_CONFIG = {
+INDICATOR_CONFIG = MappingProxyType({
     'height': 230,  # Exactamente como vdev8
     'margin': dict(t=60, b=25, l=25, r=25),  # Exactamente como vdev8
     'thresholds': {
@@ -616,7 +752,7 @@ INDICATOR_CONFIG = {
         'medium': 'yellow',
         'high': 'red'
     }
-}
+})
 
 # Labels para probabilidades (exactamente como vdev8)
 PROBABILITY_LABELS = [
@@ -640,6 +776,55 @@ RESPONSIVE_CONFIG = {
     }
 }
 
+# Escala de colores normalizada del mapa: depende solo de constantes, se calcula una vez
+# (y de nuevo si la recarga en caliente cambia los umbrales)
+def _build_map_colorscale() -> tuple:
+    return tuple(
+        (threshold / MAP_CONFIG['max_value'], COLORS[color_key])
+        for threshold, color_key in (
+            (0, 'aire_buena'),
+            (OZONE_THRESHOLDS['buena'], 'aire_buena'),
+            (OZONE_THRESHOLDS['buena'], 'aire_aceptable'),
+            (OZONE_THRESHOLDS['aceptable'], 'aire_aceptable'),
+            (OZONE_THRESHOLDS['aceptable'], 'aire_mala'),
+            (OZONE_THRESHOLDS['mala'], 'aire_mala'),
+            (OZONE_THRESHOLDS['mala'], 'aire_muy_mala'),
+            (OZONE_THRESHOLDS['muy_mala'], 'aire_muy_mala'),
+            (OZONE_THRESHOLDS['muy_mala'], 'aire_extremadamente_mala')
+        )
+    ) + ((1.0, COLORS['aire_extremadamente_mala']),)
+
+_MAP_COLORSCALE = _build_map_colorscale()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_geojson_file(path: str) -> Dict:
+    """Lee y decodifica un GeoJSON una sola vez por proceso (los límites son estáticos)"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+# Archivos GeoJSON de límites: (atributo, archivo, descripción para el aviso)
+_GEOJSON_FILES = (
+    ('geojson', 'CDMX.json', 'city boundaries'),
+    ('geojson_mexico', 'Mexico.json', 'Mexico state boundaries'),
+    ('geojson_morelos', 'Morelos.json', 'Morelos state boundaries')
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _unknown_pollutant(pollutant_key: str) -> PollutantInfo:
+    """Metadatos genéricos para un contaminante sin configuración (uno por clave)"""
+    return PollutantInfo(
+        name=pollutant_key,
+        units='units',
+        db_key=pollutant_key.lower(),
+        has_station_forecast=False,
+        color='#999999',
+        forecast_id=7
+    )
+
+
 class ConfigManager:
     """Gestor centralizado de configuraciones"""
     
@@ -651,100 +836,228 @@ class ConfigManager:
     
     def _load_geojson(self) -> None:
         """Carga los archivos GeoJSON de límites de la Ciudad de México y estados vecinos"""
-        # Cargar archivo principal de Ciudad de México (CDMX.json)
-        try:
-            with open('./assets/CDMX.json') as f:
-                self.geojson = json.load(f)
-                print("✅ Archivo GeoJSON CDMX.json cargado correctamente")
-        except FileNotFoundError:
-            print("⚠️  Warning: CDMX.json not found. Map will work without city boundaries.")
-            if app_config.is_debug_mode():
-                print(f"    Directorio actual: {os.getcwd()}")
-                print(f"   🔍 Buscando en: ./assets/CDMX.json")
-                print(f"   💡 Asegúrate de que el archivo existe en el directorio assets/")
-            self.geojson = None
-        except Exception as e:
-            print(f"❌ Error cargando CDMX.json: {e}")
-            self.geojson = None
-        
-        # Cargar archivo Mexico.json
-        try:
-            with open('./assets/Mexico.json') as f:
-                self.geojson_mexico = json.load(f)
-                print("✅ Archivo GeoJSON Mexico.json cargado correctamente")
-        except FileNotFoundError:
-            print("⚠️  Warning: Mexico.json not found. Map will work without Mexico state boundaries.")
-            self.geojson_mexico = None
-        except Exception as e:
-            print(f"❌ Error cargando Mexico.json: {e}")
-            self.geojson_mexico = None
-        
-        # Cargar archivo Morelos.json
-        try:
-            with open('./assets/Morelos.json') as f:
-                self.geojson_morelos = json.load(f)
-                print("✅ Archivo GeoJSON Morelos.json cargado correctamente")
-        except FileNotFoundError:
-            print("⚠️  Warning: Morelos.json not found. Map will work without Morelos state boundaries.")
-            self.geojson_morelos = None
-        except Exception as e:
-            print(f"❌ Error cargando Morelos.json: {e}")
-            self.geojson_morelos = None
+        for attr, filename, description in _GEOJSON_FILES:
+            path = f'./assets/{filename}'
+            try:
+                setattr(self, attr, _load_geojson_file(path))
+                logger.info("✅ Archivo GeoJSON %s cargado correctamente", filename)
+            except FileNotFoundError:
+                logger.warning("⚠️  Warning: %s not found. Map will work without %s.", filename, description)
+                if attr == 'geojson':
+                    logger.debug("    Directorio actual: %s", os.getcwd())
+                    logger.debug("   🔍 Buscando en: %s", path)
+                    logger.debug("   💡 Asegúrate de que el archivo existe en el directorio assets/")
+                setattr(self, attr, None)
+            except Exception as e:
+                logger.error("❌ Error cargando %s: %s", filename, e)
+                setattr(self, attr, None)
     
-    def get_pollutant_info(self, pollutant_key: str) -> Dict[str, Any]:
-        """Obtiene información completa de un contaminante"""
-        return POLLUTANT_CONFIG.get(pollutant_key, {
-            'name': pollutant_key,
-            'units': 'units',
-            'db_key': pollutant_key.lower(),
-            'has_station_forecast': False,
-            'color': '#999999'
-        })
+    def get_pollutant_info(self, pollutant_key: str) -> PollutantInfo:
+        """Obtiene información completa de un contaminante."""
+        return POLLUTANT_CONFIG.get(pollutant_key) or _unknown_pollutant(pollutant_key)
     
     def get_air_quality_category(self, value: float) -> str:
         """Determina la categoría de calidad del aire basada en umbrales"""
         try:
-            value = float(value)
-            if value < OZONE_THRESHOLDS['buena']:
-                return 'Buena'
-            elif value < OZONE_THRESHOLDS['aceptable']:
-                return 'Aceptable'
-            elif value < OZONE_THRESHOLDS['mala']:
-                return 'Mala'
-            elif value < OZONE_THRESHOLDS['muy_mala']:
-                return 'Muy Mala'
-            else:
-                return 'Extremadamente Mala'
+            # Un valor igual al umbral pertenece a la categoría siguiente (bisect_right)
+            return _OZONE_LABELS[bisect.bisect_right(_OZONE_BOUNDS, float(value))]
         except (ValueError, TypeError):
             return 'No disponible'
     
+    def get_air_quality_categories(self, values) -> np.ndarray:
+        """
+        Versión vectorizada de get_air_quality_category para listas, Series o arreglos.
+        Los valores faltantes (None/NaN) se clasifican como 'No disponible'.
+        """
+        arr = np.asarray(values, dtype=np.float64)
+        idx = np.where(np.isnan(arr), len(_OZONE_LABELS), np.digitize(arr, _OZONE_BOUNDS_NP, right=False))
+        return _OZONE_LABELS_NP[idx]
+    
     def get_colorscale_for_map(self) -> list:
-        """Genera escala de colores normalizada para el mapa"""
-        max_value = MAP_CONFIG['max_value']
-        return [
-            [0/max_value, COLORS['aire_buena']],
-            [OZONE_THRESHOLDS['buena']/max_value, COLORS['aire_buena']],
-            [OZONE_THRESHOLDS['buena']/max_value, COLORS['aire_aceptable']],
-            [OZONE_THRESHOLDS['aceptable']/max_value, COLORS['aire_aceptable']],
-            [OZONE_THRESHOLDS['aceptable']/max_value, COLORS['aire_mala']],
-            [OZONE_THRESHOLDS['mala']/max_value, COLORS['aire_mala']],
-            [OZONE_THRESHOLDS['mala']/max_value, COLORS['aire_muy_mala']],
-            [OZONE_THRESHOLDS['muy_mala']/max_value, COLORS['aire_muy_mala']],
-            [OZONE_THRESHOLDS['muy_mala']/max_value, COLORS['aire_extremadamente_mala']],
-            [1.0, COLORS['aire_extremadamente_mala']]
-        ]
-
-# Instancia global del gestor de configuración  
-config_manager = ConfigManager()
+        """Retorna la escala de colores normalizada para el mapa (precalculada)"""
+        return list(_MAP_COLORSCALE)
+
+# =============================================================================
+# ARCHIVO DE CONFIGURACIÓN Y RECARGA EN CALIENTE
+# =============================================================================
+# config.yaml / config.json (CONFIG_FILE) puede sobrescribir sin reiniciar:
+#   ozone_forecast_id: 7
+#   ozone_thresholds: {buena: 58, aceptable: 90, mala: 135, muy_mala: 175}
+#   pm10_thresholds / pm25_thresholds: {buena: ..., aceptable: ..., mala: ..., muy_mala: ...}
+_CONFIG_LOCK = threading.RLock()
+
+# Secciones de umbrales recargables -> nombre de la variable del módulo. Al recargar se
+# construye un dict nuevo y se reemplaza la variable completa (un lector nunca ve umbrales
+# a medio actualizar); por eso los consumidores hacen `from config import ...` dentro de
+# la función que los usa y no al importar su módulo.
+_RELOADABLE_THRESHOLDS = {
+    'ozone_thresholds': 'OZONE_THRESHOLDS',
+    'pm10_thresholds': 'PM10_THRESHOLDS',
+    'pm25_thresholds': 'PM25_THRESHOLDS'
+}
+
+
+# Funciones sin argumentos que se ejecutan tras cambiar la configuración en caliente
+# (p. ej. callbacks.py limpia las figuras cacheadas con las bandas de umbrales viejas)
+_RELOAD_HOOKS = []
+
+
+def register_reload_hook(hook: Callable[[], None]) -> None:
+    """Registra una función a ejecutar cuando cambia el ID de pronóstico o los umbrales"""
+    _RELOAD_HOOKS.append(hook)
+
+
+def _run_reload_hooks() -> None:
+    for hook in _RELOAD_HOOKS:
+        try:
+            hook()
+        except Exception as e:
+            logger.error("❌ Error en gancho de recarga %s: %s", getattr(hook, '__name__', hook), e)
+
+
+def _as_number(value: Any) -> float:
+    """Convierte a número conservando los enteros (58 y no 58.0 en etiquetas)"""
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def _read_config_file(path: str) -> Dict[str, Any]:
+    """Lee config.yaml (requiere PyYAML) o config.json"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if path.endswith(('.yaml', '.yml')):
+        if yaml is None:
+            raise RuntimeError("PyYAML no está instalado; usa un archivo .json")
+        data = yaml.safe_load(raw)
+    else:
+        data = _json_loads(raw)
+    return data or {}
+
+
+def reload_config_file(path: str) -> bool:
+    """
+    Aplica los valores del archivo de configuración sobre la configuración en memoria.
+    Un archivo inválido no modifica nada: se valida todo antes de aplicar.
+    """
+    try:
+        data = _read_config_file(path)
+        updates = {}
+        for section, name in _RELOADABLE_THRESHOLDS.items():
+            current = globals()[name]
+            values = data.get(section)
+            if values:
+                unknown = set(values) - set(current)
+                if unknown:
+                    raise ValueError(f"claves desconocidas en {section}: {sorted(unknown)}")
+                merged = {**current, **{key: _as_number(value) for key, value in values.items()}}
+                if list(merged.values()) != sorted(merged.values()):
+                    raise ValueError(f"los umbrales de {section} deben ser crecientes")
+                updates[section] = merged
+        forecast_id = data.get('ozone_forecast_id')
+        if forecast_id is not None:
+            forecast_id = int(forecast_id)
+            if forecast_id not in (6, 7):
+                raise ValueError(f"ozone_forecast_id inválido: {forecast_id}")
+    except Exception as e:
+        logger.error("❌ Error leyendo configuración %s: %s", path, e)
+        return False
+    
+    id_changed = forecast_id is not None and forecast_id != OZONE_FORECAST_ID
+    
+    global _OZONE_BOUNDS, _OZONE_BOUNDS_NP, _MAP_COLORSCALE
+    with _CONFIG_LOCK:
+        if id_changed:
+            set_ozone_forecast_id(forecast_id, notify=False)
+        for section, merged in updates.items():
+            globals()[_RELOADABLE_THRESHOLDS[section]] = merged
+        # Valores derivados de los umbrales de ozono
+        _OZONE_BOUNDS = _build_ozone_bounds()
+        _OZONE_BOUNDS_NP = np.array(_OZONE_BOUNDS, dtype=np.float64)
+        _MAP_COLORSCALE = _build_map_colorscale()
+    if id_changed or updates:
+        _run_reload_hooks()
+    logger.info("🔄 Configuración cargada desde %s", path)
+    return True
+
+
+class ConfigWatcher(FileSystemEventHandler):
+    """Recarga la configuración cuando cambia el archivo vigilado"""
+    
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = os.path.abspath(path)
+    
+    def _handle(self, src_path: str) -> None:
+        if os.path.abspath(src_path) == self.path:
+            reload_config_file(self.path)
+    
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._handle(event.src_path)
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self._handle(event.src_path)
+    
+    def on_moved(self, event):
+        # Los editores suelen guardar escribiendo un temporal y renombrándolo
+        if not event.is_directory:
+            self._handle(event.dest_path)
+
+
+@functools.lru_cache(maxsize=1)
+def start_config_watcher(path: str):
+    """Inicia (una sola vez por proceso) el observador de watchdog sobre el archivo"""
+    if not WATCHDOG_AVAILABLE:
+        logger.warning("⚠️ CONFIG_HOT_RELOAD=1 pero watchdog no está instalado; recarga desactivada")
+        return None
+    directory = os.path.dirname(os.path.abspath(path))
+    observer = Observer()
+    observer.daemon = True
+    observer.schedule(ConfigWatcher(path), directory, recursive=False)
+    observer.start()
+    logger.info("👀 Vigilando cambios en %s", path)
+    return observer
+
+
+# Instancia global del gestor de configuración (se crea en el primer uso)
+@functools.lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    """Retorna la instancia única de ConfigManager."""
+    return ConfigManager()
+
+def _app_config_view() -> MappingProxyType:
+    """APP_CONFIG: vista de solo lectura de AppConfig.app_config (única fuente de title/debug/host/port)"""
+    return MappingProxyType(get_app_config().app_config)
+
+# Atributos perezosos del módulo (PEP 562): `from config import app_config`, `APP_CONFIG`,
+# `config_manager` y `DEFAULT_DATE_CONFIG` siguen funcionando, pero se construyen al primer acceso
+_LAZY_ATTRIBUTES = {
+    'app_config': get_app_config,
+    'APP_CONFIG': _app_config_view,
+    'config_manager': get_config_manager,
+    'DEFAULT_DATE_CONFIG': get_default_date_config
+}
+
+
+def __getattr__(name: str) -> Any:
+    factory = _LAZY_ATTRIBUTES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = factory()
+    globals()[name] = value
+    return value
+
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     print("🔧 CONFIGURACIÓN DE LA APLICACIÓN")
     print("=" * 50)
-    print(f"Entorno: {app_config.environment.value}")
-    print(f"Modo de datos: {app_config.data_mode.value}")
-    print(f"Debug: {app_config.is_debug_mode()}")
-    print(f"Fecha de referencia mock: {app_config.mock_reference_date}")
-    print(f"Título de la app: {app_config.get_app_title()}")
-    print(f"Puerto: {app_config.app_config['port']}")
-    print(f"Estación por defecto: {app_config.data_config['default_station']}")
+    print(f"Entorno: {get_app_config().environment.value}")
+    print(f"Modo de datos: {get_app_config().data_mode.value}")
+    print(f"Debug: {get_app_config().is_debug_mode()}")
+    print(f"Fecha de referencia mock: {get_app_config().mock_reference_date}")
+    print(f"Título de la app: {get_app_config().get_app_title()}")
+    print(f"Puerto: {get_app_config().app_config['port']}")
+    print(f"Estación por defecto: {get_app_config().data_config['default_station']}")
     print("=" * 50) 
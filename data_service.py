@@ -11,6 +11,7 @@ import os
 
 # Importar configuración para diferentes bases de datos
 from config import is_sqlite_mode, get_sqlite_config, is_postgresql_mode, get_postgresql_config
+from cache_utils import ttl_cache
 
 # Importar servicio PostgreSQL (sistema principal)
 try:
@@ -66,7 +67,7 @@ else:
 # Importaciones adicionales para las funciones eficientes
 try:
     import plotly.graph_objects as go
-    from config import app_config, get_data_mode, get_current_reference_date, is_mock_mode
+    from config import app_config, get_data_mode, get_current_reference_date, is_mock_mode, get_ozone_forecast_id
 except ImportError:
     # Fallback básico
     import plotly.graph_objects as go
@@ -74,6 +75,7 @@ except ImportError:
     get_data_mode = lambda: None
     get_current_reference_date = lambda: datetime.now()
     is_mock_mode = lambda: True
+    get_ozone_forecast_id = lambda: 7
 
 class AirQualityDataService:
     """
@@ -124,6 +126,17 @@ class AirQualityDataService:
         print(f"   - Fecha de referencia: {self.mock_reference_date}")
         print(f"   - Estaciones disponibles: {len(self.stations_dict)}")
         
+    # Configuración de contaminantes (mock); estática, se construye una sola vez
+    _MOCK_POLLUTANT_INFO: Dict[str, Dict[str, str]] = {
+        'O3': {'units': 'ppb', 'db_key': 'cont_otres'},
+        'PM2.5': {'units': 'µg/m³', 'db_key': 'cont_pmdoscinco'},
+        'PM10': {'units': 'µg/m³', 'db_key': 'cont_pmdiez'},
+        'NO2': {'units': 'ppb', 'db_key': 'cont_nodos'},
+        'NOx': {'units': 'ppb', 'db_key': 'cont_nox'},
+        'CO': {'units': 'ppm', 'db_key': 'cont_co'},
+        'SO2': {'units': 'ppb', 'db_key': 'cont_so2'}
+    }
+    
     def get_all_stations(self) -> Dict[str, Dict[str, Any]]:
         """Obtiene el diccionario completo de estaciones disponibles"""
         return self.stations_dict
@@ -395,7 +408,7 @@ class AirQualityDataService:
                 for station_code, forecast_data in batch_forecasts.items():
                     if 'forecast_vector' in forecast_data:
                         # Calcular máximo de las próximas 24 horas
-                        max_value = max(forecast_data['forecast_vector'])
+                        max_value = float(np.nanmax(forecast_data['forecast_vector']))
                         
                         # Obtener información de la estación
                         station_info = self.stations_dict.get(station_code, {})
@@ -461,16 +474,7 @@ class AirQualityDataService:
     
     def get_pollutant_info(self, pollutant_key: str) -> Dict:
         """Obtiene información de un contaminante"""
-        # Configuración de contaminantes (mock)
-        return {
-            'O3': {'units': 'ppb', 'db_key': 'cont_otres'},
-            'PM2.5': {'units': 'µg/m³', 'db_key': 'cont_pmdoscinco'},
-            'PM10': {'units': 'µg/m³', 'db_key': 'cont_pmdiez'},
-            'NO2': {'units': 'ppb', 'db_key': 'cont_nodos'},
-            'NOx': {'units': 'ppb', 'db_key': 'cont_nox'},
-            'CO': {'units': 'ppm', 'db_key': 'cont_co'},
-            'SO2': {'units': 'ppb', 'db_key': 'cont_so2'}
-        }.get(pollutant_key, {})
+        return self._MOCK_POLLUTANT_INFO.get(pollutant_key, {})
     
     def validate_datetime(self, fecha: str) -> bool:
         """Valida formato de fecha"""
@@ -785,6 +789,8 @@ class EfficientAirQualityDataService(AirQualityDataService):
         super().__init__(use_mock_data)
         print(f"🚀 EfficientAirQualityDataService inicializado (modo: {'MOCK' if use_mock_data else 'EFICIENTE REAL'})")
     
+    # Las series de todas las páginas piden la misma ventana; 5 min acota la antigüedad de las observaciones
+    @ttl_cache(ttl=300, maxsize=16, cache_falsy=False)
     def get_all_stations_historical_batch(self, pollutant_key: str, start_date: str, end_date: str) -> pd.DataFrame:
         """
         NUEVA FUNCIÓN EFICIENTE: Obtiene datos históricos de TODAS las estaciones en UN SOLO QUERY.
@@ -957,6 +963,8 @@ class EfficientAirQualityDataService(AirQualityDataService):
             print(f"❌ Error en query histórico batch: {e}")
             return pd.DataFrame()
     
+    # Compartido por mapa, series y resumen; 5 min de TTL para que entren los pronósticos nuevos
+    @ttl_cache(ttl=300, maxsize=16, cache_falsy=False)
     def get_all_stations_forecast_batch(self, fecha: str) -> Dict[str, Any]:
         """
         NUEVA FUNCIÓN EFICIENTE: Obtiene pronósticos de TODAS las estaciones en UN SOLO QUERY.
@@ -967,7 +975,7 @@ class EfficientAirQualityDataService(AirQualityDataService):
         Returns:
             Dict con estructura: {
                 'station_code': {
-                    'forecast_vector': [...], 
+                    'forecast_vector': np.ndarray (24 horas, float64), 
                     'timestamps': [...], 
                     'metadata': {...}
                 }, ...
@@ -991,7 +999,7 @@ class EfficientAirQualityDataService(AirQualityDataService):
                         SELECT fecha, id_est, {columnas_hp} 
                         FROM forecast_otres 
                         WHERE fecha BETWEEN '{reference_date}' AND '{reference_date}'
-                        AND id_tipo_pronostico = 7  
+                        AND id_tipo_pronostico = {get_ozone_forecast_id()}
                         AND id_est IN ('{stations_str}')
                         ORDER BY id_est;
                     """
@@ -1017,7 +1025,7 @@ class EfficientAirQualityDataService(AirQualityDataService):
                             station_code = row['id_est']
                             forecast_date = pd.to_datetime(row['fecha'])
                             timestamps = [forecast_date + pd.Timedelta(hours=i) for i in range(0, 24)]
-                            forecast_vector = row.loc['hour_p01':'hour_p24'].values
+                            forecast_vector = np.asarray(row.loc['hour_p01':'hour_p24'].values, dtype=np.float64)
                             
                             batch_forecasts[station_code] = {
                                 'forecast_vector': forecast_vector,
@@ -1053,7 +1061,7 @@ class EfficientAirQualityDataService(AirQualityDataService):
                 SELECT fecha, id_est, {columnas_hp} 
                 FROM forecast_otres 
                 WHERE fecha BETWEEN '{fecha}' AND '{fecha}'
-                AND id_tipo_pronostico = 7
+                AND id_tipo_pronostico = {get_ozone_forecast_id()}
                 AND id_est IN ('{stations_str}')
                 ORDER BY id_est;
             """
@@ -1093,8 +1101,8 @@ class EfficientAirQualityDataService(AirQualityDataService):
             for _, row in df_batch.iterrows():
                 station = row['id_est'].strip()
                 
-                # Extraer vector de 24 horas
-                forecast_vector = row.loc['hour_p01':'hour_p24'].values
+                # Extraer vector de 24 horas como float64 (NULL -> NaN) para operar en NumPy
+                forecast_vector = np.asarray(row.loc['hour_p01':'hour_p24'].values, dtype=np.float64)
                 
                 # Generar timestamps
                 timestamps = [base_date + pd.Timedelta(hours=i) for i in range(0, 24)]
@@ -1116,6 +1124,84 @@ class EfficientAirQualityDataService(AirQualityDataService):
             print(f"❌ Error en query pronósticos batch: {e}")
             return {}
     
+    def get_forecast_argmax(self, fecha: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene el máximo pronóstico de O3 entre todas las estaciones y horas.
+        
+        En PostgreSQL la agregación se hace en la BD y solo viaja una fila;
+        en los modos mock/SQLite se calcula sobre el batch de pronósticos.
+        
+        Returns:
+            Dict {'station', 'hour' (1-24), 'value'} o None si no hay datos
+        """
+        if self.use_mock_data or (self.sqlite_mode and SQLITE_AVAILABLE):
+            return self._forecast_argmax_from_batch(self.get_all_stations_forecast_batch(fecha))
+        
+        stations_str = "','".join(self.stations_dict.keys())
+        # Desdoblar las 24 columnas hour_pNN en filas (hora, valor) y ordenar en la BD
+        valores_hp = ', '.join(f'({i}, f.hour_p{i:02d})' for i in range(1, 25))
+        
+        argmax_query = f"""
+            SELECT f.id_est, v.hora, v.valor
+            FROM forecast_otres f
+            CROSS JOIN LATERAL (VALUES {valores_hp}) AS v(hora, valor)
+            WHERE f.fecha = %s
+            AND f.id_tipo_pronostico = %s
+            AND f.id_est IN ('{stations_str}')
+            AND v.valor IS NOT NULL
+            ORDER BY v.valor DESC, f.id_est, v.hora
+            LIMIT 1;
+        """
+        
+        try:
+            from postgres_data_service import ForecastDataService
+            postgres_service = ForecastDataService()
+            try:
+                df_max = postgres_service.connection.execute_query(argmax_query, (fecha, get_ozone_forecast_id()))
+            finally:
+                postgres_service.close()
+        except Exception as e:
+            print(f"❌ Error obteniendo máximo de pronósticos desde PostgreSQL: {e}")
+            return None
+        
+        if df_max.empty:
+            return None
+        
+        row = df_max.iloc[0]
+        return {
+            'station': str(row['id_est']).strip(),
+            'hour': int(row['hora']),
+            'value': float(row['valor'])
+        }
+    
+    @staticmethod
+    def _forecast_argmax_from_batch(forecast_batch: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Máximo de un batch de pronósticos: matriz estaciones x horas (NaN de relleno) y nanargmax"""
+        station_codes = []
+        vectors = []
+        for station_code, forecast_data in sorted(forecast_batch.items()):
+            forecast_vector = forecast_data.get('forecast_vector')
+            if forecast_vector is None or len(forecast_vector) == 0:
+                continue
+            station_codes.append(station_code)
+            vectors.append(forecast_vector)
+        
+        if not vectors:
+            return None
+        
+        mat = np.full((len(vectors), max(len(v) for v in vectors)), np.nan)
+        for i, vector in enumerate(vectors):
+            mat[i, :len(vector)] = vector
+        if np.isnan(mat).all():
+            return None
+        
+        station_idx, hour_idx = (int(i) for i in np.unravel_index(int(np.nanargmax(mat)), mat.shape))
+        return {
+            'station': station_codes[station_idx],
+            'hour': hour_idx + 1,
+            'value': float(mat[station_idx, hour_idx])
+        }
+    
     def create_o3_comprehensive_series_efficient(self, selected_station: str = 'PED') -> go.Figure:
         """
         NUEVA FUNCIÓN EFICIENTE: Crea serie temporal O3 completa con reducción masiva de queries.
@@ -1370,7 +1456,7 @@ class EfficientAirQualityDataService(AirQualityDataService):
         batch_forecasts = {}
         for station in stations_list:
             timestamps = [base_date + timedelta(hours=i) for i in range(0, 24)]
-            forecast_vector = np.random.uniform(20, 180, 24).tolist()
+            forecast_vector = np.random.uniform(20, 180, 24)
             
             batch_forecasts[station] = {
                 'forecast_vector': forecast_vector,
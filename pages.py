@@ -5,8 +5,10 @@ Contiene los layouts para cada página de la aplicación.
 
 from dash import html, dcc
 import dash_bootstrap_components as dbc
-from typing import Any, List
-from datetime import datetime
+import functools
+from typing import Any, List, Optional
+from datetime import datetime, timedelta
+import logging
 
 from components import (
     header_components,
@@ -15,47 +17,73 @@ from components import (
     alert_components,
     layout_containers,
     indicator_components,
-    summary_components
+    summary_components,
+    station_options_seed,
+    DROPDOWN_OPTION_HEIGHT,
+    DROPDOWN_MAX_HEIGHT,
+    DROPDOWN_PERSISTENCE,
+    INDICATORS_VISIBLE_ID
 )
-from visualization import create_indicators, create_professional_map
-from config import DEFAULT_DATE_CONFIG, STYLES, COLORS
+from visualization import create_professional_map
+from config import DEFAULT_DATE_CONFIG, STYLES, COLORS, POLLUTANT_CONFIG
 from data_service import data_service
 
+logger = logging.getLogger(__name__)
+
+
+# Nombres de meses en español indexados por número de mes (índice 0 sin uso)
+MESES_ESP = (None, 'Enero', 'Febrero', 'Marzo', 'Abril', 'Mayo', 'Junio', 'Julio',
+             'Agosto', 'Septiembre', 'Octubre', 'Noviembre', 'Diciembre')
+
+
+def format_es_datetime(dt: datetime) -> str:
+    """Formatea como 'a las 13:00 hrs. del 15 de Mayo de 2023'"""
+    return f"a las {dt:%H:%M} hrs. del {dt:%d} de {MESES_ESP[dt.month]} de {dt:%Y}"
+
+
+def _last_forecast_datetime() -> Optional[datetime]:
+    """Fecha del último pronóstico disponible en la base de datos, o None si no se pudo obtener"""
+    try:
+        from postgres_data_service import get_last_available_date
+        return get_last_available_date()
+    except Exception as e:
+        logger.warning("⚠️ Error obteniendo fecha del último pronóstico: %s", e)
+        return None
+
 
 def get_forecast_datetime_str() -> str:
     """Obtiene la fecha/hora del pronóstico formateada para mostrar en el título"""
-    from datetime import timedelta
-    
     if DEFAULT_DATE_CONFIG['use_specific_date']:
         # Usar fecha específica configurada
         forecast_datetime = datetime.strptime(DEFAULT_DATE_CONFIG['specific_date'], '%Y-%m-%d %H:%M:%S')
     else:
-        # Usar la fecha del último pronóstico disponible en la base de datos
-        try:
-            from postgres_data_service import get_last_available_date
-            forecast_datetime = get_last_available_date()
-            print(f"✅ Usando fecha del último pronóstico: {forecast_datetime}")
-        except Exception as e:
-            print(f"⚠️ Error obteniendo fecha del último pronóstico: {e}, usando fecha actual")
-            # Fallback: usar fecha actual
-            forecast_datetime = datetime.now().replace(minute=0, second=0, microsecond=0)
+        # Último pronóstico en la base de datos; si falla, la hora actual
+        forecast_datetime = (_last_forecast_datetime()
+                             or datetime.now().replace(minute=0, second=0, microsecond=0))
+        logger.debug("✅ Usando fecha del pronóstico: %s", forecast_datetime)
     
     # Restar 1 hora al último pronóstico
     adjusted_datetime = forecast_datetime - timedelta(hours=1)
-    print(f"✅ Fecha ajustada (último pronóstico - 1h): {adjusted_datetime}")
+    logger.debug("✅ Fecha ajustada (último pronóstico - 1h): %s", adjusted_datetime)
     
     # Formatear de manera más clara y legible
-    # Ejemplo: "a las 13:00 hrs. del 15 de Mayo de 2023"
-    hour_str = adjusted_datetime.strftime('%H:%M')
-    day_str = adjusted_datetime.strftime('%d')
-    month_names = {
-        1: 'Enero', 2: 'Febrero', 3: 'Marzo', 4: 'Abril', 5: 'Mayo', 6: 'Junio',
-        7: 'Julio', 8: 'Agosto', 9: 'Septiembre', 10: 'Octubre', 11: 'Noviembre', 12: 'Diciembre'
+    return format_es_datetime(adjusted_datetime)
+
+
+def get_last_forecast_iso() -> Any:
+    """Fecha del último pronóstico en ISO, para el título calculado en el navegador"""
+    forecast_datetime = _last_forecast_datetime()
+    return forecast_datetime.isoformat() if forecast_datetime else None
+
+
+def get_historicos_title_meta() -> dict:
+    """Nombres y unidades de contaminantes y nombres de estaciones para el título de históricos"""
+    return {
+        'pollutants': {key: {'name': info.name, 'units': info.units}
+                       for key, info in POLLUTANT_CONFIG.items()},
+        'stations': {code: info.get('name', code)
+                     for code, info in data_service.get_all_stations().items()}
     }
-    month_str = month_names[adjusted_datetime.month]
-    year_str = adjusted_datetime.strftime('%Y')
-    
-    return f"a las {hour_str} hrs. del {day_str} de {month_str} de {year_str}"
 
 
 class HomePage:
@@ -68,9 +96,8 @@ class HomePage:
         id_est = kwargs.get('id_est', DEFAULT_DATE_CONFIG['station_default'])
         fecha = kwargs.get('fecha', None)
         
-        # Crear indicadores para la estación por defecto
-        indicators = create_indicators(id_est)
-        wrapped_indicators = indicator_components.wrap_indicators_in_columns(indicators)
+        # Diales vacíos: update_home se dispara al cargar y los llena con la figura cacheada
+        wrapped_indicators = indicator_components.wrap_indicators_in_columns(None)
         
         # Obtener fecha/hora del pronóstico para mostrar en el título
         forecast_time_str = get_forecast_datetime_str()
@@ -127,9 +154,12 @@ class HomePage:
                         }),
                         dcc.Dropdown(
                             id='station-dropdown-home',
-                            options=[{'label': station_info['name'], 'value': code}
-                                    for code, station_info in data_service.get_all_stations().items()],
+                            options=station_options_seed(id_est),
                             value=id_est,
+                            searchable=True,
+                            optionHeight=DROPDOWN_OPTION_HEIGHT,
+                            maxHeight=DROPDOWN_MAX_HEIGHT,
+                            **DROPDOWN_PERSISTENCE,
                             style={
                                 'width': '300px',
                                 'font-family': 'Helvetica',
@@ -167,14 +197,22 @@ class HomePage:
                             'scale': 2
                         }
                     }
-                )
+                ),
+                # Refresco del resumen de la API (15 min, igual que el pronóstico)
+                dcc.Interval(id="interval-refresh", interval=900_000),
+                # Fecha del último pronóstico para el título (clientside)
+                dcc.Store(id="last-fcst-date", data=get_last_forecast_iso()),
+                # Datos del resumen de ozono (el texto se arma en el navegador)
+                dcc.Store(id="ozone-summary-data")
             ], style=STYLES['container']),
             
             
             # Grid de diales al final (estilo vdev8)
             html.Div([
                 html.H3('Probabilidades de superar umbrales de ozono', style=STYLES['title']),
-                html.Div(id="indicators-container", children=wrapped_indicators)
+                html.Div(id="indicators-container", children=wrapped_indicators),
+                # Se vuelve True cuando los diales entran en pantalla (assets/lazy_graphs.js)
+                dcc.Store(id=INDICATORS_VISIBLE_ID, data=False)
             ], style=STYLES['container']),
             
             # Enlaces y créditos
@@ -182,7 +220,8 @@ class HomePage:
         ]
     
     @staticmethod
-    def _create_footer_cards() -> dbc.Row:
+    @functools.lru_cache(maxsize=1)
+    def _create_footer_cards() -> html.Div:
         """Crea las tarjetas del pie de página"""
         explore_card = card_components.create_action_card(
             title="Explorar Más",
@@ -199,7 +238,7 @@ class HomePage:
             is_small=True
         )
         
-        return layout_containers.create_action_cards_row([explore_card, credits_card])
+        return layout_containers.create_action_cards_row((explore_card, credits_card))
 
 
 class OtrosContaminantesPage:
@@ -266,7 +305,11 @@ class OtrosContaminantesPage:
                 html.Div([
                     html.H3(f'Concentraciones de PM2.5 (µg/m³) - {get_forecast_datetime_str()}', style=STYLES['title']),
                     dcc.Graph(id="pm25-timeseries-otros", config={'displayModeBar': False})
-                ], style=STYLES['container'])
+                ], style=STYLES['container']),
+                
+                # Figuras ya enviadas por estación (clientside) y estación pendiente de pedir
+                dcc.Store(id="pm-figure-cache", data={}),
+                dcc.Store(id="pm-station-request")
             ]),
             
             # Navegación de regreso
@@ -274,7 +317,8 @@ class OtrosContaminantesPage:
         ]
     
     @staticmethod
-    def _create_navigation_cards() -> dbc.Row:
+    @functools.lru_cache(maxsize=1)
+    def _create_navigation_cards() -> html.Div:
         """Crea las tarjetas de navegación"""
         back_card = card_components.create_action_card(
             title="Volver al Inicio",
@@ -331,6 +375,7 @@ class HistoricosPage:
                 html.H3('Pronóstico Histórico', 
                         id='pollutant-title-historicos', 
                         style=STYLES['title']),
+                dcc.Store(id='historicos-title-meta', data=get_historicos_title_meta()),
                 dcc.Graph(id="pollutant-timeseries-historicos", config={'displayModeBar': False}),
                 html.Div([
                     dbc.Button(
@@ -350,7 +395,8 @@ class HistoricosPage:
         ]
     
     @staticmethod
-    def _create_navigation_cards() -> dbc.Row:
+    @functools.lru_cache(maxsize=1)
+    def _create_navigation_cards() -> html.Div:
         """Crea las tarjetas de navegación"""
         back_card = card_components.create_action_card(
             title="Volver al Inicio",
@@ -619,7 +665,8 @@ class AcercaPage:
         ], style=STYLES['container'])
     
     @staticmethod
-    def _create_navigation_cards() -> dbc.Row:
+    @functools.lru_cache(maxsize=1)
+    def _create_navigation_cards() -> html.Div:
         """Crea tarjetas de navegación para la página de acerca"""
         return layout_containers.create_action_cards_row([
             card_components.create_action_card(
@@ -730,7 +777,10 @@ class DebugResumenPage:
             ], style=STYLES['container']),
             
             # Componente oculto para disparar el callback al cargar la página
-            dcc.Location(id='debug-resumen-location', refresh=False)
+            dcc.Location(id='debug-resumen-location', refresh=False),
+            
+            # Sondeo del resumen de la API hasta que el hilo de refresco lo tenga listo
+            dcc.Interval(id='api-poll', interval=5000, n_intervals=0)
         ]
 
 
@@ -5,20 +5,56 @@ Este es el sistema de PRODUCCIÓN que reemplaza completamente SQLite.
 Usa las credenciales AMATE-SOLOREAD y las nuevas tablas forecast_*.
 """
 
-import psycopg2
-import netrc
+from psycopg2 import pool
 import os
 import pandas as pd
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 import logging
 from scipy.stats import norm
 
+from cache_utils import ttl_cache
+from config import get_db_credentials, get_postgresql_config, get_ozone_forecast_id, register_reload_hook
+
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-PRODUCTION_DB_HOST = os.getenv('DB_HOST', '132.248.8.152')
+
+@lru_cache(maxsize=1)
+def get_postgresql_pool() -> pool.ThreadedConnectionPool:
+    """
+    Pool de conexiones compartido por todos los servicios (se crea en el primer uso).
+    Evita el handshake TCP + autenticación de psycopg2.connect() en cada consulta.
+    Tamaño configurable con PG_POOL_MIN / PG_POOL_MAX.
+    """
+    login, password = get_db_credentials()
+    
+    if not login or not password:
+        raise RuntimeError(
+            "No se encontraron credenciales válidas para PostgreSQL. "
+            "Verifica que exista ~/.netrc con la entrada AMATE-SOLOREAD "
+            "o define DB_USER y DB_PASSWORD como variables de entorno."
+        )
+    
+    cfg = get_postgresql_config()
+    host = cfg['host']
+    database = cfg['database']
+    port = int(cfg['port'])
+    
+    logger.info(f"Creando pool de conexiones PostgreSQL en {host}:{port}/{database} como {login}")
+    
+    return pool.ThreadedConnectionPool(
+        minconn=int(os.getenv('PG_POOL_MIN', '2')),
+        maxconn=int(os.getenv('PG_POOL_MAX', '25')),
+        database=database,
+        user=login,
+        host=host,
+        password=password,
+        port=port
+    )
+
 
 class PostgresConnection:
     """Maneja la conexión a PostgreSQL con las nuevas tablas de pronóstico"""
@@ -28,46 +64,29 @@ class PostgresConnection:
         self._connect()
     
     def _connect(self):
-        """Establece conexión a PostgreSQL usando credenciales AMATE-SOLOREAD"""
-        def get_db_credentials():
-            """Obtiene credenciales de BD desde .netrc"""
-            try:
-                n = netrc.netrc()
-                login, account, password = n.authenticators('AMATE-SOLOREAD')
-                return login, password
-            except (FileNotFoundError, netrc.NetrcParseError):
-                return os.getenv('DB_USER'), os.getenv('DB_PASSWORD')
-        
-        login, password = get_db_credentials()
-        
-        if not login or not password:
-            raise RuntimeError(
-                "No se encontraron credenciales válidas para PostgreSQL. "
-                "Verifica que exista ~/.netrc con la entrada AMATE-SOLOREAD "
-                "o define DB_USER y DB_PASSWORD como variables de entorno."
-            )
-        
-        host = PRODUCTION_DB_HOST
-        database = os.getenv('DB_NAME', 'contingencia')
-        port = int(os.getenv('DB_PORT', '5432'))
-        
-        logger.info(f"Conectando a PostgreSQL en {host}:{port}/{database} como {login}")
-        
+        """Toma una conexión del pool de PostgreSQL (credenciales AMATE-SOLOREAD)"""
         try:
-            self.connection = psycopg2.connect(
-                database=database,
-                user=login,
-                host=host,
-                password=password,
-                port=port
-            )
-            
-            logger.info(f"✅ Conectado a PostgreSQL en {host}/{database}")
+            self.connection = get_postgresql_pool().getconn()
+            logger.debug("✅ Conexión PostgreSQL tomada del pool")
             
         except Exception as e:
-            logger.error(f"❌ Error conectando a PostgreSQL en {host}:{port}/{database}: {e}")
+            logger.error(f"❌ Error obteniendo conexión PostgreSQL del pool: {e}")
             self.connection = None
     
+    def _release(self, discard: bool = False):
+        """Devuelve la conexión al pool (discard=True la cierra, p. ej. si está rota)"""
+        if self.connection is None:
+            return
+        try:
+            get_postgresql_pool().putconn(self.connection, close=discard)
+        except Exception:
+            # La conexión no pertenece al pool o el pool ya se cerró
+            try:
+                self.connection.close()
+            except:
+                pass
+        self.connection = None
+    
     def is_connected(self) -> bool:
         """Verifica si la conexión está activa"""
         if self.connection is None:
@@ -81,12 +100,8 @@ class PostgresConnection:
             return False
     
     def reconnect(self):
-        """Reconecta a la base de datos"""
-        if self.connection:
-            try:
-                self.connection.close()
-            except:
-                pass
+        """Reconecta a la base de datos (descarta la conexión rota del pool)"""
+        self._release(discard=True)
         self._connect()
     
     def execute_query(self, query: str, params: Optional[Tuple] = None) -> pd.DataFrame:
@@ -133,14 +148,8 @@ class PostgresConnection:
             return pd.DataFrame()
     
     def close(self):
-        """Cierra la conexión a la base de datos"""
-        if self.connection:
-            try:
-                self.connection.close()
-                logger.info("✅ Conexión a PostgreSQL cerrada")
-            except:
-                pass
-            self.connection = None
+        """Devuelve la conexión al pool (no cierra el socket)"""
+        self._release()
     
     def __enter__(self):
         return self
@@ -154,7 +163,12 @@ class ForecastDataService:
     
     def __init__(self):
         self.connection = PostgresConnection()
-        self.forecast_id = 7  # Nuevo ID de pronóstico
+        self.forecast_id = 7  # ID de pronóstico de las tablas de otros contaminantes
+    
+    @property
+    def ozone_forecast_id(self) -> int:
+        """ID de pronóstico de ozono vigente (config.OZONE_FORECAST_ID, recargable en caliente)"""
+        return get_ozone_forecast_id()
     
     def get_latest_forecast_date(self) -> Optional[datetime]:
         """Obtiene la fecha del último pronóstico disponible"""
@@ -164,7 +178,7 @@ class ForecastDataService:
         WHERE id_tipo_pronostico = %s
         """
         
-        df = self.connection.execute_query(query, (self.forecast_id,))
+        df = self.connection.execute_query(query, (self.ozone_forecast_id,))
         
         if not df.empty and 'ultima_fecha' in df.columns:
             return df['ultima_fecha'].iloc[0]
@@ -194,7 +208,7 @@ class ForecastDataService:
             AND id_est = %s
             ORDER BY id_est
             """
-            params = (fecha, self.forecast_id, station)
+            params = (fecha, self.ozone_forecast_id, station)
         else:
             # Pronóstico para todas las estaciones
             query = f"""
@@ -204,7 +218,7 @@ class ForecastDataService:
             AND id_tipo_pronostico = %s
             ORDER BY id_est
             """
-            params = (fecha, self.forecast_id)
+            params = (fecha, self.ozone_forecast_id)
         
         return self.connection.execute_query(query, params)
     
@@ -303,7 +317,7 @@ class ForecastDataService:
         ORDER BY id_est
         """
         
-        df = self.connection.execute_query(query, (self.forecast_id,))
+        df = self.connection.execute_query(query, (self.ozone_forecast_id,))
         
         if not df.empty and 'id_est' in df.columns:
             return df['id_est'].tolist()
@@ -453,18 +467,27 @@ def db_query_last_predhour(id_est: str, end_time_str: str) -> Tuple[pd.DataFrame
     finally:
         service.close()
 
-def get_last_available_date() -> datetime:
-    """Obtiene la fecha del último pronóstico disponible"""
+@ttl_cache(ttl=60, maxsize=1, cache_falsy=False)
+def _latest_forecast_date() -> Optional[datetime]:
+    """Consulta la fecha del último pronóstico en BD (cacheada 60 s, sin cachear vacíos)"""
     service = ForecastDataService()
     try:
-        latest_date = service.get_latest_forecast_date()
-        if latest_date:
-            return latest_date
-        # Fallback: fecha actual menos 1 hora
-        return datetime.now() - timedelta(hours=1)
+        return service.get_latest_forecast_date()
     finally:
         service.close()
 
+
+# La fecha del último pronóstico depende del ID de pronóstico de ozono vigente
+register_reload_hook(_latest_forecast_date.cache_clear)
+
+def get_last_available_date() -> datetime:
+    """Obtiene la fecha del último pronóstico disponible"""
+    latest_date = _latest_forecast_date()
+    if latest_date:
+        return latest_date
+    # Fallback: fecha actual menos 1 hora
+    return datetime.now() - timedelta(hours=1)
+
 def get_available_stations() -> List[str]:
     """Obtiene lista de estaciones disponibles"""
     service = ForecastDataService()
@@ -846,9 +869,11 @@ def initialize_postgres_system():
     try:
         # Verificar conexión
         service = ForecastDataService()
-        latest_date = service.get_latest_forecast_date()
-        stations = service.get_available_stations()
-        service.close()
+        try:
+            latest_date = service.get_latest_forecast_date()
+            stations = service.get_available_stations()
+        finally:
+            service.close()
         
         logger.info(f"✅ Sistema PostgreSQL inicializado correctamente")
         logger.info(f"   📅 Última fecha de pronóstico: {latest_date}")
@@ -883,8 +908,10 @@ if __name__ == "__main__":
             
             # Obtener estadísticas de CO
             service = ForecastDataService()
-            co_stats = service.get_pollutant_stats(latest_date.strftime('%Y-%m-%d %H:%M:%S'), 'co')
-            service.close()
+            try:
+                co_stats = service.get_pollutant_stats(latest_date.strftime('%Y-%m-%d %H:%M:%S'), 'co')
+            finally:
+                service.close()
             print(f"📊 Estadísticas de CO: {len(co_stats)} filas")
     else:
         print("❌ Sistema PostgreSQL no pudo inicializarse")
\ No newline at end of file
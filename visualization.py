@@ -5,11 +5,13 @@ Contiene funciones para crear mapas, gráficos de series temporales e indicadore
 
 import plotly.graph_objects as go
 import plotly.express as px
+from plotly.subplots import make_subplots
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Optional
 import os
 import sys
+import logging
 
 # Agregar el directorio raíz al path para importar el sistema de configuración centralizado
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,7 +20,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import app_config, DataMode, Environment
 
 from config import (
-    COLORS, OZONE_THRESHOLDS, MAP_CONFIG, CHART_CONFIG, 
+    COLORS, MAP_CONFIG, CHART_CONFIG, 
     INDICATOR_CONFIG, PROBABILITY_LABELS, config_manager, DEFAULT_DATE_CONFIG
 )
 from data_service import (
@@ -31,6 +33,8 @@ from data_service import (
     data_service
 )
 
+logger = logging.getLogger(__name__)
+
 class MapVisualizer:
     """Visualizador de mapas"""
     
@@ -43,7 +47,7 @@ class MapVisualizer:
         # Usar fecha específica para datos reales
         if DEFAULT_DATE_CONFIG['use_specific_date']:
             fecha_actual = DEFAULT_DATE_CONFIG['specific_date']
-            print(f"🗺️ Mapa usando fecha específica: {fecha_actual}")
+            logger.debug("🗺️ Mapa usando fecha específica: %s", fecha_actual)
         else:
             fecha_actual = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
@@ -166,6 +170,7 @@ class MapVisualizer:
     @staticmethod
     def _get_colorbar_config() -> Dict:
         """Configuración de la barra de colores del mapa"""
+        from config import OZONE_THRESHOLDS
         return dict(
             title=dict(
                 text='Calidad del Aire',
@@ -345,10 +350,15 @@ class TimeSeriesVisualizer:
             return TimeSeriesVisualizer._create_simple_series(pollutant, station)
     
     @staticmethod
-    def _create_comprehensive_series(pollutant: str, selected_station: str = 'MER') -> go.Figure:
+    def _create_comprehensive_series(pollutant: str, selected_station: str = 'MER',
+                                     reference_date: Optional[datetime] = None) -> go.Figure:
         """
         Crea serie temporal completa mostrando todas las estaciones históricas + pronósticos regionales
         Funciona para PM2.5, PM10 y otros contaminantes
+        
+        reference_date: fecha del pronóstico a mostrar (históricos); si no se da se usa la
+        fecha de referencia actual. Se recibe explícita para no tocar DEFAULT_DATE_CONFIG,
+        que comparten todos los hilos.
         """
         # Importar configuración de umbrales y colores
         from config import PM10_THRESHOLDS, PM25_THRESHOLDS, COLORS
@@ -436,13 +446,16 @@ class TimeSeriesVisualizer:
         # Configurar tiempo usando fecha dinámica cuando SQLite está activado
         from config import is_sqlite_mode, get_current_reference_date
         
-        if is_sqlite_mode():
+        if reference_date is not None:
+            now = reference_date
+            logger.debug("📊 Serie temporal %s completa usando fecha del pronóstico: %s", pollutant, now)
+        elif is_sqlite_mode():
             # Usar fecha real del último pronóstico SQLite
             now = get_current_reference_date()
-            print(f"📊 Serie temporal {pollutant} completa usando fecha SQLite: {now}")
+            logger.debug("📊 Serie temporal %s completa usando fecha SQLite: %s", pollutant, now)
         elif DEFAULT_DATE_CONFIG['use_specific_date']:
             now = datetime.strptime(DEFAULT_DATE_CONFIG['specific_date'], '%Y-%m-%d %H:%M:%S')
-            print(f"📊 Serie temporal {pollutant} completa usando fecha específica: {now}")
+            logger.debug("📊 Serie temporal %s completa usando fecha específica: %s", pollutant, now)
         else:
             now = datetime.now().replace(minute=0, second=0, microsecond=0)
         
@@ -451,19 +464,20 @@ class TimeSeriesVisualizer:
         start_time_str = start_time.strftime('%Y-%m-%d %H:%M:%S')
         end_time_str = now.strftime('%Y-%m-%d %H:%M:%S')
         
-        print(f"⚡ SERIE TEMPORAL COMPREHENSIVA {pollutant}: mostrando todas las estaciones")
+        logger.debug("⚡ SERIE TEMPORAL COMPREHENSIVA %s: mostrando todas las estaciones", pollutant)
         
         # 🔥 QUERY EFICIENTE: Datos históricos de TODAS las estaciones
         df_all_historical = data_service.get_all_stations_historical_batch(pollutant, start_time_str, end_time_str)
         
         stations_dict = data_service.get_all_stations()
         pollutant_info = config_manager.get_pollutant_info(pollutant)
-        units = pollutant_info['units']
+        units = pollutant_info.units
         
         # Listas para almacenar datos de todas las estaciones
         all_historical_data = []
         
         # PASO 1: Agregar todas las estaciones (excepto la seleccionada) en gris
+        # (Scattergl: decenas de trazas de fondo se dibujan en WebGL y no como nodos SVG)
         for station_code, station_info in stations_dict.items():
             if station_code == selected_station:
                 continue  # La estación seleccionada se agrega al final
@@ -479,7 +493,7 @@ class TimeSeriesVisualizer:
                 all_historical_data.append(station_historical)
                 
                 fig.add_trace(
-                    go.Scatter(
+                    go.Scattergl(
                         x=station_historical['timestamp'],
                         y=station_historical['value'],
                         mode='lines',
@@ -650,7 +664,7 @@ class TimeSeriesVisualizer:
             )
         )
         
-        print(f"🎯 Serie temporal {pollutant} comprehensiva completada: {len(all_historical_data)} estaciones históricas")
+        logger.debug("🎯 Serie temporal %s comprehensiva completada: %d estaciones históricas", pollutant, len(all_historical_data))
         
         return fig
     
@@ -661,7 +675,7 @@ class TimeSeriesVisualizer:
         
         fig = go.Figure()
         pollutant_info = config_manager.get_pollutant_info(pollutant)
-        units = pollutant_info['units']
+        units = pollutant_info.units
         stations_dict = data_service.get_all_stations()
         
         # OTROS CONTAMINANTES: Observaciones por estación + Pronósticos regionales
@@ -728,22 +742,29 @@ class TimeSeriesVisualizer:
 class IndicatorVisualizer:
     """Responsable de crear indicadores (diales) de probabilidades"""
     
+    # Diales por fila de la figura combinada (como la cuadrícula de vdev8)
+    _DIALS_PER_ROW = 2
+    
     @staticmethod
-    def create_indicators(station: str = 'MER') -> List[Any]:
-        """Crea indicadores de probabilidades con estilo profesional vdev8"""
+    def create_indicators(station: str = 'MER') -> go.Figure:
+        """
+        Crea los indicadores de probabilidades con estilo profesional vdev8.
+        Todos los diales van en una sola figura con subplots: un solo gráfico
+        que montar en el navegador en lugar de uno por dial.
+        """
         # Usar fecha dinámica cuando SQLite está activado
         from config import is_sqlite_mode, get_current_reference_date
         
         if is_sqlite_mode():
             # Usar fecha real del último pronóstico SQLite
             fecha_actual = get_current_reference_date().strftime('%Y-%m-%d %H:%M:%S')
-            print(f"📊 Indicadores usando fecha SQLite: {fecha_actual}")
+            logger.debug("📊 Indicadores usando fecha SQLite: %s", fecha_actual)
         elif DEFAULT_DATE_CONFIG['use_specific_date']:
             fecha_actual = DEFAULT_DATE_CONFIG['specific_date']
-            print(f"📊 Indicadores usando fecha específica: {fecha_actual}")
+            logger.debug("📊 Indicadores usando fecha específica: %s", fecha_actual)
         else:
             fecha_actual = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            print(f"📊 Indicadores usando fecha actual: {fecha_actual}")
+            logger.debug("📊 Indicadores usando fecha actual: %s", fecha_actual)
         
         # Obtener probabilidades
         probabilities = get_probabilities_from_otres_forecast(fecha_actual, station)
@@ -756,16 +777,32 @@ class IndicatorVisualizer:
             "Umbral de 150 ppb"
         ]
         
-        dial_figs = []
+        cols = IndicatorVisualizer._DIALS_PER_ROW
+        rows = max(1, -(-len(probabilities) // cols))
+        fig = make_subplots(
+            rows=rows, cols=cols,
+            specs=[[{'type': 'indicator'}] * cols for _ in range(rows)],
+            subplot_titles=[f'<b>{label}</b>' for label in labels[:len(probabilities)]],
+            vertical_spacing=0.25
+        )
         for i, prob in enumerate(probabilities):
-            dial_fig = IndicatorVisualizer._create_single_indicator(prob, labels[i])
-            dial_figs.append(dial_fig)
+            fig.add_trace(IndicatorVisualizer._create_single_indicator(prob),
+                          row=i // cols + 1, col=i % cols + 1)
         
-        return dial_figs
+        # Estilo exacto de vdev8 (títulos de cada dial y 230 px por fila)
+        fig.update_annotations(font=dict(family='Helvetica', size=20, color=COLORS['text']))
+        fig.update_layout(
+            margin=dict(t=60, b=25, l=25, r=25),
+            height=230 * rows,
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)'
+        )
+        
+        return fig
     
     @staticmethod
-    def _create_single_indicator(probability: float, label: str) -> go.Figure:
-        """Crea un indicador individual con estilo profesional vdev8"""
+    def _create_single_indicator(probability: float) -> go.Indicator:
+        """Crea la traza de un dial individual con estilo profesional vdev8"""
         # Determinar color basado en probabilidad
         if probability < 0.3:
             color = COLORS['success']
@@ -774,51 +811,29 @@ class IndicatorVisualizer:
         else:
             color = COLORS['danger']
         
-        dial_fig = go.Figure(
-            go.Indicator(
-                mode="gauge+number",
-                value=probability * 100,
-                gauge={
-                    'axis': {'range': [None, 100], 'tickcolor': '#333333', 'tickwidth': 2},
-                    'shape': 'angular',
-                    'bar': {'color': color},
-                    'bgcolor': 'white',  # Fondo blanco limpio
-                    'borderwidth': 2,  # Contorno oscuro
-                    'bordercolor': '#333333',  # Color del contorno
-                    'steps': [
-                        {'range': [0, 30], 'color': '#fafbfc'},  # Gris muy muy claro para los pasos
-                        {'range': [30, 70], 'color': '#f5f6f7'},  # Gris muy claro para los pasos
-                        {'range': [70, 100], 'color': '#f0f1f2'}  # Gris claro para los pasos
-                    ],
-                    'threshold': {
-                        'line': {'color': 'red', 'width': 4},
-                        'thickness': 0.75,
-                        'value': 100
-                    }
-                }
-            )
-        )
-        
-        # Estilo exacto de vdev8
-        dial_fig.update_traces(
+        return go.Indicator(
+            mode="gauge+number",
+            value=probability * 100,
             number={'suffix': '%', 'font': {'size': 28, 'family': 'Helvetica', 'color': COLORS['text']}},
-            title={'font': {'size': 18, 'family': 'Helvetica', 'color': COLORS['text']}}
-        )
-        
-        dial_fig.update_layout(
-            margin=dict(t=60, b=25, l=25, r=25),
-            height=230,  # Exactamente como vdev8
-            title_text=f'<b>{label}</b>',
-            title_x=0.5,
-            title_y=0.95,
-            title_xanchor='center',
-            title_yanchor='top',
-            title_font=dict(family='Helvetica', size=20, color=COLORS['text']),
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)'
+            gauge={
+                'axis': {'range': [None, 100], 'tickcolor': '#333333', 'tickwidth': 2},
+                'shape': 'angular',
+                'bar': {'color': color},
+                'bgcolor': 'white',  # Fondo blanco limpio
+                'borderwidth': 2,  # Contorno oscuro
+                'bordercolor': '#333333',  # Color del contorno
+                'steps': [
+                    {'range': [0, 30], 'color': '#fafbfc'},  # Gris muy muy claro para los pasos
+                    {'range': [30, 70], 'color': '#f5f6f7'},  # Gris muy claro para los pasos
+                    {'range': [70, 100], 'color': '#f0f1f2'}  # Gris claro para los pasos
+                ],
+                'threshold': {
+                    'line': {'color': 'red', 'width': 4},
+                    'thickness': 0.75,
+                    'value': 100
+                }
+            }
         )
-        
-        return dial_fig
 
 
 # Instancias globales de los visualizadores
@@ -835,8 +850,8 @@ def create_time_series(pollutant: str = 'O3', station: str = 'MER') -> go.Figure
     """Función de conveniencia para crear serie temporal"""
     return timeseries_visualizer.create_time_series(pollutant, station)
 
-def create_indicators(station: str = 'MER') -> List[Any]:
-    """Función de conveniencia para crear indicadores"""
+def create_indicators(station: str = 'MER') -> go.Figure:
+    """Función de conveniencia para crear indicadores (una figura con todos los diales)"""
     return indicator_visualizer.create_indicators(station)
 
 def get_combined_data(pollutant: str = 'O3', station: str = 'MER', hours_back: int = 24) -> pd.DataFrame:
@@ -928,26 +943,28 @@ def create_historical_time_series(pollutant: str, station: str, forecast_date: s
         start_time_str = start_time.strftime('%Y-%m-%d %H:%M:%S')
         end_time_str = end_time.strftime('%Y-%m-%d %H:%M:%S')
         
-        print(f"🔍 Pronóstico histórico O3: {forecast_date_str}")
-        print(f"📊 Observaciones: {start_time_str} → {end_time_str}")
+        logger.debug("🔍 Pronóstico histórico O3: %s", forecast_date_str)
+        logger.debug("📊 Observaciones: %s → %s", start_time_str, end_time_str)
         
         # Obtener observaciones de todas las estaciones
         try:
             df_all_historical = data_service.get_all_stations_historical_batch('O3', start_time_str, end_time_str)
         except Exception as e:
-            print(f"⚠️ Error obteniendo observaciones batch: {e}")
+            logger.warning("⚠️ Error obteniendo observaciones batch: %s", e)
             df_all_historical = pd.DataFrame()
         
         # Obtener pronósticos de todas las estaciones
         try:
             service = ForecastDataService()
-            df_all_forecast = service.get_ozone_forecast(forecast_date_str)  # Sin station = todas
-            service.close()
+            try:
+                df_all_forecast = service.get_ozone_forecast(forecast_date_str)  # Sin station = todas
+            finally:
+                service.close()
         except Exception as e:
-            print(f"⚠️ Error obteniendo pronósticos históricos: {e}")
+            logger.warning("⚠️ Error obteniendo pronósticos históricos: %s", e)
             df_all_forecast = pd.DataFrame()
         
-        # PASO 1: Agregar observaciones y pronósticos de otras estaciones (en gris)
+        # PASO 1: Agregar observaciones y pronósticos de otras estaciones (en gris, WebGL)
         for sta_code in stations_dict.keys():
             if sta_code == station:
                 continue  # La estación seleccionada se agrega al final
@@ -956,7 +973,7 @@ def create_historical_time_series(pollutant: str, station: str, forecast_date: s
             if not df_all_historical.empty:
                 df_sta = df_all_historical[df_all_historical['id_est'] == sta_code]
                 if not df_sta.empty:
-                    fig.add_trace(go.Scatter(
+                    fig.add_trace(go.Scattergl(
                         x=pd.to_datetime(df_sta['timestamp']),
                         y=df_sta['value'],
                         mode='lines',
@@ -984,7 +1001,7 @@ def create_historical_time_series(pollutant: str, station: str, forecast_date: s
                             forecast_values.append(max(0.0, float(row[hour_col])))  # QA: negativos a 0
                     
                     if forecast_timestamps:
-                        fig.add_trace(go.Scatter(
+                        fig.add_trace(go.Scattergl(
                             x=forecast_timestamps,
                             y=forecast_values,
                             mode='lines',
@@ -1048,29 +1065,11 @@ def create_historical_time_series(pollutant: str, station: str, forecast_date: s
     else:
         # Para PM10, PM2.5 y otros contaminantes: usar la misma visualización de "otros contaminantes"
         # Simplemente usar la función existente pero con la fecha específica del pronóstico histórico
-        print(f"🔍 Usando visualización de 'otros contaminantes' para {pollutant}")
-        print(f"📅 Fecha del pronóstico: {forecast_date_str}")
+        logger.debug("🔍 Usando visualización de 'otros contaminantes' para %s", pollutant)
+        logger.debug("📅 Fecha del pronóstico: %s", forecast_date_str)
         
-        # Crear la visualización usando la misma lógica de _create_comprehensive_series
-        # pero ajustando la fecha de referencia temporalmente
-        
-        # Guardar la configuración actual
-        from config import DEFAULT_DATE_CONFIG
-        original_use_specific = DEFAULT_DATE_CONFIG.get('use_specific_date', False)
-        original_date = DEFAULT_DATE_CONFIG.get('specific_date', '')
-        
-        try:
-            # Temporalmente cambiar la fecha para que use el pronóstico histórico
-            DEFAULT_DATE_CONFIG['use_specific_date'] = True
-            DEFAULT_DATE_CONFIG['specific_date'] = forecast_date_str
-            
-            # Usar la función existente de otros contaminantes
-            fig = TimeSeriesVisualizer._create_comprehensive_series(pollutant, station)
-            
-        finally:
-            # Restaurar configuración original
-            DEFAULT_DATE_CONFIG['use_specific_date'] = original_use_specific
-            DEFAULT_DATE_CONFIG['specific_date'] = original_date
+        # Misma lógica de _create_comprehensive_series con la fecha del pronóstico histórico
+        fig = TimeSeriesVisualizer._create_comprehensive_series(pollutant, station, reference_date=forecast_datetime)
         
         return fig
     
@@ -1119,8 +1118,10 @@ def get_historical_data_for_csv(pollutant: str, station: str, forecast_date: str
     # Pronóstico
     try:
         service = ForecastDataService()
-        df_forecast_all = service.get_ozone_forecast(forecast_date_str)
-        service.close()
+        try:
+            df_forecast_all = service.get_ozone_forecast(forecast_date_str)
+        finally:
+            service.close()
 
         if not df_forecast_all.empty:
             df_sta = df_forecast_all[df_forecast_all['id_est'] == station]